@@ -0,0 +1 @@
+"""MarshPy benchmarks."""
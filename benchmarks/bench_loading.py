@@ -0,0 +1,207 @@
+"""Time loads of synthetic documents, scaling along several axes.
+
+Run with `python -m benchmarks.bench_loading`, or `nox -s benchmarks`. Results
+can be written to a JSON file with --output, and compared to the results of a
+previous run with --baseline, for example:
+
+    python -m benchmarks.bench_loading --output baseline.json
+    # Change things...
+    python -m benchmarks.bench_loading --baseline baseline.json
+"""
+from argparse import ArgumentParser
+from os import environ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from marshpy import (
+    DocumentCache,
+    Engine,
+    GlobCache,
+    GlobHandler,
+    IfHandler,
+    IntField,
+    ListField,
+    MergeHandler,
+    ObjectField,
+    PathHandler,
+    StringField,
+    load,
+)
+
+from .results import add_arguments, report
+
+
+class Case(NamedTuple):
+    """A document to load, built for a given size."""
+
+    source: str
+    object_class: Type[Any]
+    config: List[Any]
+
+
+# Called with the size and a temporary directory to write files in.
+CaseBuilder = Callable[[int, Path], Case]
+
+
+class Item:
+    """Item of the documents loaded as Root."""
+
+    fields = {
+        "name": StringField(),
+        "value": IntField(),
+        "tags": ListField(StringField()),
+    }
+
+
+class Root:
+    """Object containing a list of items."""
+
+    fields = {"items": ListField(ObjectField(object_class=Item))}
+
+
+def build_item(index: int) -> str:
+    """Return the YAML of an Item, as a flow mapping."""
+    return f"{{ name: item_{index}, value: {index}, tags: [first, second] }}"
+
+
+def build_items(count: int) -> str:
+    """Return the YAML of a list of Items."""
+    return "\n".join(f"- {build_item(it)}" for it in range(count))
+
+
+def _uncached_paths(root: Path) -> List[Any]:
+    # Files are composed on each load, to time parsing and not cache lookups.
+    return [
+        PathHandler.Config(roots=[root], document_cache=DocumentCache(max_bytes=0)),
+        GlobHandler.Config(glob_cache=GlobCache()),
+    ]
+
+
+def _wide_objects(size: int, __: Path) -> Case:
+    names = [f"field_{it}" for it in range(size)]
+    wide_class = type("_Wide", (), {"fields": {it: IntField() for it in names}})
+    wide_root = type(
+        "_WideRoot",
+        (),
+        {"fields": {"items": ListField(ObjectField(object_class=wide_class))}},
+    )
+    item = "{ " + ", ".join(f"{it}: {index}" for index, it in enumerate(names)) + " }"
+    source = "items:\n" + "\n".join(f"- {item}" for __ in range(100))
+    return Case(source, wide_root, [])
+
+
+def _deep_nesting(size: int, __: Path) -> Case:
+    nested_class = type("_Nested", (), {})
+    nested_class.fields = {  # type: ignore
+        "value": IntField(),
+        "child": ObjectField(object_class=nested_class),
+    }
+    lines = []
+    for depth in range(size):
+        indent = "  " * depth
+        lines.append(f"{indent}value: {depth}")
+        lines.append(f"{indent}child:")
+    lines.append("  " * size + "value: 0")
+    return Case("\n".join(lines), nested_class, [])
+
+
+def _object_lists(size: int, __: Path) -> Case:
+    return Case("items:\n" + build_items(size), Root, [])
+
+
+def _many_imports(size: int, root: Path) -> Case:
+    for index in range(size):
+        (root / f"item_{index}.yaml").write_text(build_item(index), encoding="utf-8")
+    source = "items:\n" + "\n".join(f"- !import item_{it}.yaml" for it in range(size))
+    return Case(source, Root, _uncached_paths(root))
+
+
+def _glob_fanout(size: int, root: Path) -> Case:
+    (root / "items").mkdir()
+    for index in range(size):
+        path = root / "items" / f"item_{index}.yaml"
+        path.write_text(build_item(index), encoding="utf-8")
+    return Case("items: !glob items/*.yaml", Root, _uncached_paths(root))
+
+
+def _heavy_tags(size: int, __: Path) -> Case:
+    environ["MARSHPY_BENCHMARK_NAME"] = "from_env"
+    tags = "!merge [[!if(enabled) first], [!if(disabled) second, third]]"
+    items = [
+        f"- {{ name: !env MARSHPY_BENCHMARK_NAME, value: {it}, tags: {tags} }}"
+        for it in range(size)
+    ]
+    config = [IfHandler.Config(flags={"enabled"})]
+    return Case("items:\n" + "\n".join(items), Root, config)
+
+
+CASES: Dict[str, Tuple[CaseBuilder, List[int]]] = {
+    "wide_objects": (_wide_objects, [10, 100, 500]),
+    "deep_nesting": (_deep_nesting, [10, 50, 100]),
+    "object_lists": (_object_lists, [100, 1_000, 10_000]),
+    "many_imports": (_many_imports, [10, 100, 1_000]),
+    "glob_fanout": (_glob_fanout, [10, 100, 1_000]),
+    "heavy_tags": (_heavy_tags, [100, 1_000, 5_000]),
+}
+
+
+def run(
+    name_filter: Optional[str] = None, repeat_count: int = 5, quick: bool = False
+) -> Dict[str, float]:
+    """Run the benchmarks, and return the best time of each, in seconds.
+
+    Args:
+        name_filter: If given, only benchmarks which name contains it are run.
+        repeat_count: Count of timed loads, the best time is kept.
+        quick: Only run the smallest size of each case.
+
+    """
+    results = {}
+    for case_name, (builder, sizes) in CASES.items():
+        for size in [min(sizes)] if quick else sizes:
+            for engine in Engine:
+                name = f"{case_name}[{size}-{engine.name.lower()}]"
+                if name_filter is not None and name_filter not in name:
+                    continue
+
+                with TemporaryDirectory() as directory:
+                    case = builder(size, Path(directory))
+                    results[name] = _time_case(case, engine, repeat_count)
+                    print(f"{name:<40} {results[name]:>12.6f}")
+
+    return results
+
+
+def _time_case(case: Case, engine: Engine, repeat_count: int) -> float:
+    tag_handlers = [MergeHandler()]
+
+    def _load() -> None:
+        load(
+            case.source,
+            case.object_class,
+            tag_handlers=tag_handlers,
+            config=case.config,
+            engine=engine,
+        )
+
+    return min(repeat(_load, number=1, repeat=repeat_count))
+
+
+def main() -> None:
+    """Run benchmarks from the command line."""
+    parser = ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("-k", dest="name_filter", help="Only run matching names.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed loads count.")
+    parser.add_argument("--quick", action="store_true", help="Only small sizes.")
+    add_arguments(parser)
+    arguments = parser.parse_args()
+
+    results = run(arguments.name_filter, arguments.repeat, arguments.quick)
+
+    report(results, arguments, ".6f")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measure the memory used by loads, for growing document sizes.
+
+Run with `python -m benchmarks.bench_memory`, or `nox -s memory_benchmarks`.
+For each document size, it reports :
+
+  - compose: memory used by the node tree of the document, as composed by the
+    tree engine before loading values.
+  - load: peak memory during a load, and memory retained by the loaded value,
+    with each engine.
+
+Results are in bytes, and can be saved and compared to a baseline like the
+results of benchmarks.bench_loading.
+"""
+from argparse import ArgumentParser
+from typing import Dict, Optional
+
+from marshpy import Engine, MemoryTracker, load
+from marshpy.core.parsing import compose
+
+from .bench_loading import Root, build_items
+from .results import add_arguments, report
+
+SIZES = [1_000, 5_000, 20_000]
+
+
+def run(name_filter: Optional[str] = None, quick: bool = False) -> Dict[str, float]:
+    """Run the benchmarks, and return the measured sizes, in bytes.
+
+    Args:
+        name_filter: If given, only benchmarks which name contains it are run.
+        quick: Only run the smallest size.
+
+    """
+    results: Dict[str, float] = {}
+
+    def _add(name: str, value: int) -> None:
+        if name_filter is None or name_filter in name:
+            results[name] = value
+            print(f"{name:<40} {value:>12,}")
+
+    tracker = MemoryTracker()
+    for size in SIZES[:1] if quick else SIZES:
+        document = "items:\n" + build_items(size)
+
+        with tracker.track():
+            node = compose(document)
+        assert tracker.usage is not None
+        _add(f"compose.peak[{size}]", tracker.usage.peak)
+        _add(f"compose.retained[{size}]", tracker.usage.retained)
+        del node
+
+        for engine in Engine:
+            value = load(document, Root, config=[tracker], engine=engine)
+            suffix = f"{size}-{engine.name.lower()}"
+            _add(f"load.peak[{suffix}]", tracker.usage.peak)
+            _add(f"load.retained[{suffix}]", tracker.usage.retained)
+            del value
+
+    return results
+
+
+def main() -> None:
+    """Run benchmarks from the command line."""
+    parser = ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("-k", dest="name_filter", help="Only run matching names.")
+    parser.add_argument("--quick", action="store_true", help="Only small sizes.")
+    add_arguments(parser)
+    arguments = parser.parse_args()
+
+    results = run(arguments.name_filter, arguments.quick)
+
+    report(results, arguments, ",.0f")
+
+
+if __name__ == "__main__":
+    main()
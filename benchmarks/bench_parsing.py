@@ -0,0 +1,47 @@
+"""Compare the pure-Python and libyaml composition backends.
+
+Run with `python -m benchmarks.bench_parsing`.
+"""
+from timeit import repeat
+
+from marshpy.core.parsing import LIBYAML_AVAILABLE, compose
+
+
+def _build_document(item_count: int) -> str:
+    lines = ["items:"]
+    for i in range(item_count):
+        lines.append(f"  - name: item_{i}")
+        lines.append(f"    value: {i}")
+        lines.append("    tags: [first, second, third]")
+        lines.append("    nested: { key: !env SOME_VARIABLE, other: text }")
+
+    return "\n".join(lines) + "\n"
+
+
+def _time_compose(document: str, use_libyaml: bool) -> float:
+    return min(
+        repeat(lambda: compose(document, use_libyaml=use_libyaml), number=1, repeat=3)
+    )
+
+
+def main() -> None:
+    """Print composition times for growing document sizes."""
+    if not LIBYAML_AVAILABLE:
+        print("PyYAML was built without libyaml, nothing to compare.")
+        return
+
+    print(
+        f"{'items':>8} {'size (kB)':>10} {'python (s)':>11} {'libyaml (s)':>12} {'speedup':>8}"
+    )
+    for item_count in [1_000, 5_000, 20_000]:
+        document = _build_document(item_count)
+        python_time = _time_compose(document, use_libyaml=False)
+        libyaml_time = _time_compose(document, use_libyaml=True)
+        print(
+            f"{item_count:>8} {len(document) / 1024:>10.0f} {python_time:>11.3f} "
+            f"{libyaml_time:>12.3f} {python_time / libyaml_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
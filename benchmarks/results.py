@@ -0,0 +1,96 @@
+"""Saving of benchmark results, and comparison to a baseline."""
+from argparse import ArgumentParser, Namespace
+from json import dump
+from json import load as load_json
+from pathlib import Path
+from platform import python_implementation, python_version
+from sys import exit as sys_exit
+from typing import Dict, List
+
+FORMAT_VERSION = 1
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    """Add the output and baseline arguments to a benchmark command line."""
+    parser.add_argument("--output", type=Path, help="Write results to this file.")
+    parser.add_argument("--baseline", type=Path, help="Compare to this file.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative increase reported as a regression (default: 0.1).",
+    )
+
+
+def report(results: Dict[str, float], arguments: Namespace, value_format: str) -> None:
+    """Save results and compare them to a baseline, as given on command line.
+
+    Exits with an error code if a benchmark regressed.
+
+    Args:
+        results: Results of the benchmarks, by name.
+        arguments: Parsed command line arguments, see add_arguments.
+        value_format: Format spec used to print results.
+
+    """
+    if arguments.output is not None:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            dump(
+                {
+                    "version": FORMAT_VERSION,
+                    "python": f"{python_implementation()} {python_version()}",
+                    "results": results,
+                },
+                output_file,
+                indent=2,
+            )
+
+    if arguments.baseline is not None:
+        with open(arguments.baseline, "r", encoding="utf-8") as baseline_file:
+            baseline = load_json(baseline_file)
+        assert baseline.get("version") == FORMAT_VERSION, "Unknown baseline format."
+        print()
+        regressions = compare(
+            results, baseline["results"], arguments.threshold, value_format
+        )
+        if len(regressions) != 0:
+            print(f"\n{len(regressions)} benchmark(s) regressed.")
+            sys_exit(1)
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float,
+    value_format: str,
+) -> List[str]:
+    """Print results against a baseline, and return the regressed benchmarks.
+
+    Args:
+        results: Results of the current run, lower being better.
+        baseline: Results of the baseline run.
+        threshold: Relative increase above which a benchmark is regressed.
+        value_format: Format spec used to print results.
+
+    """
+    regressions = []
+    print(f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<40} {'-':>12} {current:>12{value_format}}")
+            continue
+
+        ratio = current / previous if previous != 0 else 1.0
+        marker = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            marker = "  worse"
+        elif ratio < 1 - threshold:
+            marker = "  better"
+        print(
+            f"{name:<40} {previous:>12{value_format}} {current:>12{value_format}} "
+            f"{ratio:>6.2f}x{marker}"
+        )
+
+    return regressions
@@ -1,6 +1,7 @@
 """YAML python object deserializer."""
 
-from .core.constants import UNDEFINED
+from .core.constants import UNDEFINED, Engine
+from .core.document_cache import DocumentCache, get_document_cache
 from .core.errors import (
     BadTypeFormatError,
     ErrorCode,
@@ -17,9 +18,19 @@ from .core.errors import (
     ValidationError,
     get_exception_type,
 )
+from .core.event_loading_context import EventLoadingContext
+from .core.glob_cache import GlobCache, get_glob_cache
 from .core.interfaces import ILoadingContext
+from .core.load_stats import LoadStats
 from .core.loading_context import LoadingContext
+from .core.manifest import Manifest
+from .core.memory import MemoryTracker, MemoryUsage
+from .core.profiler import Profiler, ProfileReport, ProfileStats
 from .core.resolvers import ANNOTATION_RESOLVER_CONFIG, annotation_fields_resolver
+from .core.root_index import RootIndex, get_root_index
+from .core.snapshot_cache import SnapshotCache
+from .core.stat_cache import StatCache
+from .core.tracing import ChromeTracer, Tracer
 from .fields.base_field import BaseField
 from .fields.bool_field import BoolField
 from .fields.dict_field import DictField
@@ -30,7 +41,16 @@ from .fields.list_field import ListField
 from .fields.object_field import ObjectField
 from .fields.path_field import PathField
 from .fields.string_field import StringField
-from .loader import load
+from .loader import (
+    LoadManyResult,
+    Reloader,
+    ReloadResult,
+    aload,
+    load,
+    load_all,
+    load_many,
+    prepare,
+)
 from .tag_handlers.env_handler import EnvHandler
 from .tag_handlers.glob_handler import GlobHandler
 from .tag_handlers.if_handler import IfHandler
@@ -0,0 +1,296 @@
+"""Generation of specialized object loading functions.
+
+Compiled loaders behave exactly like ObjectField, but are generated for a
+given class schema, so that key matching, built-in scalar conversions, required
+fields checks and hook calls don't go through the generic loading path. Values
+that can't be converted inline (tagged nodes, non-scalar nodes, custom fields,
+fields with validate callbacks or conversion errors) are loaded through the
+loading context, so errors are the same.
+"""
+from gettext import gettext as _
+from threading import Lock
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from yaml import ScalarNode
+
+from marshpy.core.constants import UNDEFINED
+from marshpy.core.errors import ErrorCode
+from marshpy.core.interfaces import IBaseField
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.validation import ValidationContext
+from marshpy.fields.bool_field import _FALSE_VALUES, _TRUE_VALUES, BoolField
+from marshpy.fields.float_field import FloatField
+from marshpy.fields.int_field import IntField
+from marshpy.fields.string_field import StringField
+
+# Called with (obj, context, config, node), node being the object mapping.
+CompiledLoader = Callable[[Any, Any, Any, Any], Any]
+
+
+class _CompiledEntry(NamedTuple):
+    fields: Dict[str, IBaseField]
+    has_validate: bool
+    has_post_load: bool
+    loader: CompiledLoader
+
+
+_COMPILED_LOADERS: Dict[type, _CompiledEntry] = {}
+_LOCK = Lock()
+
+
+def get_compiled_loader(cls: type, schema: Any) -> CompiledLoader:
+    """Return the compiled loader for the given class and ObjectSchema.
+
+    Loaders are cached per class, and compiled again if the class is given
+    with a different schema.
+    """
+    entry = _COMPILED_LOADERS.get(cls)
+    if entry is None or entry[:3] != (
+        schema.fields,
+        schema.has_validate,
+        schema.has_post_load,
+    ):
+        entry = _CompiledEntry(
+            dict(schema.fields),
+            schema.has_validate,
+            schema.has_post_load,
+            _compile(cls, schema),
+        )
+        with _LOCK:
+            _COMPILED_LOADERS[cls] = entry
+
+    return entry.loader
+
+
+def clear_compiled_loaders() -> None:
+    """Drop all compiled loaders."""
+    with _LOCK:
+        _COMPILED_LOADERS.clear()
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+        self._indent = 0
+        self.namespace: Dict[str, Any] = {
+            "_": _,
+            "UNDEFINED": UNDEFINED,
+            "ErrorCode": ErrorCode,
+            "ScalarNode": ScalarNode,
+            "ValidationContext": ValidationContext,
+            "KEY_FIELD": StringField(),
+            "LoadStats": LoadStats,
+            "TRUE_VALUES": frozenset(_TRUE_VALUES),
+            "FALSE_VALUES": frozenset(_FALSE_VALUES),
+        }
+
+    def line(self, text: str) -> None:
+        """Add a line of code at the current indentation."""
+        self._lines.append("    " * self._indent + text)
+
+    def indent(self) -> None:
+        """Indent the following lines one level more."""
+        self._indent += 1
+
+    def dedent(self) -> None:
+        """Indent the following lines one level less."""
+        self._indent -= 1
+
+    def source(self) -> str:
+        """Return the code of the added lines."""
+        return "\n".join(self._lines) + "\n"
+
+
+def _compile(cls: type, schema: Any) -> CompiledLoader:
+    writer = _Writer()
+    fields = list(schema.fields.items())
+    required = set(schema.required_fields)
+    writer.line("def load(obj, context, config, node):")
+    writer.indent()
+    # Keys and values converted inline are counted as loaded nodes and
+    # converted scalars once the loop is done.
+    writer.line("inlined = 0")
+    for index, (name, __) in enumerate(fields):
+        if name in required:
+            writer.line(f"found_{index} = False")
+
+    writer.line("for name_node, value_node in node.value:")
+    writer.indent()
+    _write_key(writer)
+    for index, (name, field) in enumerate(fields):
+        keyword = "if" if index == 0 else "elif"
+        writer.line(f"{keyword} name == {name!r}:")
+        writer.indent()
+        if name in required:
+            writer.line(f"found_{index} = True")
+
+        writer.namespace[f"field_{index}"] = field
+        _write_value(writer, index, field)
+        writer.line("if value is not UNDEFINED:")
+        writer.indent()
+        if name.isidentifier():
+            writer.line(f"obj.{name} = value")
+        else:
+            writer.line(f"setattr(obj, {name!r}, value)")
+        writer.dedent()
+        writer.dedent()
+
+    if len(fields) != 0:
+        writer.line("else:")
+        writer.indent()
+    writer.line("context.error(")
+    writer.line(
+        "    ErrorCode.FIELD_NOT_DECLARED, _('Field {} is not declared.'), name"
+    )
+    writer.line(")")
+    if len(fields) != 0:
+        writer.dedent()
+    writer.dedent()
+
+    writer.line("stats = context.get_config(LoadStats)")
+    writer.line("stats.nodes += inlined")
+    writer.line("stats.scalars += inlined")
+
+    _write_validation(writer, fields, required, schema.has_validate)
+
+    writer.line("if not valid:")
+    writer.line("    return UNDEFINED")
+    if schema.has_post_load:
+        writer.line("post_load = config.get_hook(obj, 'post_load')")
+        writer.line("if post_load is not None:")
+        writer.line("    post_load()")
+    writer.line("return obj")
+
+    namespace = writer.namespace
+    # pylint: disable=exec-used
+    exec(
+        compile(writer.source(), f"<marshpy loader {cls.__qualname__}>", "exec"),
+        namespace,
+    )
+    return namespace["load"]  # type: ignore
+
+
+def _write_key(writer: _Writer) -> None:
+    writer.line(
+        "if name_node.__class__ is ScalarNode and not name_node.tag.startswith('!'):"
+    )
+    writer.line("    name = name_node.value")
+    writer.line("    inlined += 1")
+    writer.line("else:")
+    writer.indent()
+    writer.line("if context.load(KEY_FIELD, name_node) is UNDEFINED:")
+    writer.line("    continue")
+    writer.line("name = name_node.value")
+    writer.dedent()
+
+
+def _write_validation(
+    writer: _Writer,
+    fields: List[Tuple[str, IBaseField]],
+    required: Any,
+    has_validate: bool,
+) -> None:
+    writer.line("valid = True")
+    for index, (name, __) in enumerate(fields):
+        if name not in required:
+            continue
+
+        writer.line(f"if not found_{index}:")
+        writer.indent()
+        writer.line("valid = False")
+        writer.line("context.error(")
+        writer.line(
+            f"    ErrorCode.MISSING_REQUIRED_FIELD, _('Missing required field {{}}'), {name!r}"
+        )
+        writer.line(")")
+        writer.dedent()
+
+    if has_validate:
+        writer.line("hook = config.get_hook(obj, 'validate')")
+        writer.line("if hook is not None:")
+        writer.indent()
+        writer.line("validation_context = ValidationContext(context)")
+        writer.line("hook(validation_context)")
+        writer.line("valid = valid and not validation_context.has_error()")
+        writer.dedent()
+
+
+def _write_value(writer: _Writer, index: int, field: IBaseField) -> None:
+    fallback = f"value = context.load(field_{index}, value_node)"
+    if not _is_inlined(field):
+        writer.line(fallback)
+        return
+
+    writer.line(
+        "if value_node.__class__ is ScalarNode and not value_node.tag.startswith('!'):"
+    )
+    writer.indent()
+    writer.line("inlined += 1")
+    # Values loaded again through the context are counted by it.
+    write_conversion = _CONVERSION_WRITERS[type(field)]
+    write_conversion(writer, index, field, f"inlined -= 1; {fallback}")
+    writer.dedent()
+    writer.line("else:")
+    writer.line(f"    {fallback}")
+
+
+def _is_inlined(field: Any) -> bool:
+    # Built-in fields are compiled from their settings, subclasses may load
+    # values differently.
+    if type(field) not in _CONVERSION_WRITERS:
+        return False
+
+    # pylint: disable=protected-access
+    if field._validate is not None:
+        return False
+
+    return not isinstance(field, StringField) or field._pattern is None
+
+
+def _write_string(writer: _Writer, __: int, ___: Any, ____: str) -> None:
+    writer.line("value = value_node.value")
+
+
+def _write_bool(writer: _Writer, __: int, ___: Any, fallback: str) -> None:
+    writer.line("if value_node.value in TRUE_VALUES:")
+    writer.line("    value = True")
+    writer.line("elif value_node.value in FALSE_VALUES:")
+    writer.line("    value = False")
+    writer.line("else:")
+    writer.line(f"    {fallback}")
+
+
+def _write_number(writer: _Writer, index: int, field: Any, fallback: str) -> None:
+    # pylint: disable=protected-access
+    if isinstance(field, IntField):
+        writer.namespace[f"base_{index}"] = field._base
+        conversion = f"int(value_node.value, base_{index})"
+    else:
+        conversion = "float(value_node.value)"
+
+    writer.line("try:")
+    writer.line(f"    value = {conversion}")
+    writer.line("except ValueError:")
+    writer.line(f"    {fallback}")
+
+    bounds = []
+    if field._minimum is not None:
+        writer.namespace[f"minimum_{index}"] = field._minimum
+        bounds.append(f"value < minimum_{index}")
+    if field._maximum is not None:
+        writer.namespace[f"maximum_{index}"] = field._maximum
+        bounds.append(f"value > maximum_{index}")
+
+    if len(bounds) != 0:
+        # Out of bounds values are loaded again to let the field emit errors.
+        writer.line("else:")
+        writer.line(f"    if {' or '.join(bounds)}:")
+        writer.line(f"        {fallback}")
+
+
+_CONVERSION_WRITERS: Dict[type, Callable[[_Writer, int, Any, str], None]] = {
+    BoolField: _write_bool,
+    FloatField: _write_number,
+    IntField: _write_number,
+    StringField: _write_string,
+}
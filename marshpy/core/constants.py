@@ -1,10 +1,15 @@
 """MarshPy common definitions."""
+from enum import Enum
 from typing import TypeVar, Union
 
 
 class Undefined:
     """Dummy type representing a failed loading, used for type hints."""
 
+    def __reduce__(self) -> str:
+        """Unpickle as the UNDEFINED instance of the receiving process."""
+        return "UNDEFINED"
+
 
 # Unique symbol used to differentiate an error from a valid None return when
 # loading a field.
@@ -12,3 +17,14 @@ UNDEFINED = Undefined()
 
 ObjectType = TypeVar("ObjectType")
 LoadResult = Union[ObjectType, Undefined]
+
+
+class Engine(Enum):
+    """Loading engines."""
+
+    # Compose the whole document, then load the node tree.
+    TREE = 1
+
+    # Load built-in fields directly from parser events, composing nodes only
+    # when needed.
+    EVENTS = 2
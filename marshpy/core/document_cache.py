@@ -0,0 +1,169 @@
+"""Cache of composed YAML documents."""
+from collections import OrderedDict
+from gettext import gettext as _
+from os import stat_result
+from os.path import realpath
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+from yaml import Node
+
+FileSignature = Tuple[int, int, int]
+Composer = Callable[[Path], Optional[Node]]
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _Entry(NamedTuple):
+    name: str
+    signature: FileSignature
+    size: int
+    node: Optional[Node]
+
+
+class DocumentCache:
+    """LRU cache of composed YAML files.
+
+    Entries are keyed by resolved path, and are invalidated when the
+    modification time, size or inode of the file changes. The size of the
+    cached files is used as an estimation of the memory used by the cache,
+    least recently used entries being evicted when it exceeds the configured
+    budget.
+
+    Cached node trees are shared between loads, and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached files. Files bigger
+                       than this are never cached, setting it to 0 disables
+                       the cache.
+
+        """
+        assert max_bytes >= 0, _("max_bytes must be positive.")
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Path, _Entry]" = OrderedDict()
+        self._lock = Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __reduce__(self) -> Any:
+        """Pickle the cache as an empty cache with the same settings.
+
+        The process-wide cache is unpickled as the process-wide cache of the
+        receiving process, so caches stay warm in worker processes.
+        """
+        if self is _DOCUMENT_CACHE:
+            return (get_document_cache, ())
+
+        return (DocumentCache, (self._max_bytes,))
+
+    def __len__(self) -> int:
+        """Return the count of cached documents."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the cached files, in bytes."""
+        return self._size
+
+    def is_cached(self, path: Path, stat: Optional[stat_result] = None) -> bool:
+        """Return True if loading the given path would hit the cache.
+
+        Args:
+            path: Path of the YAML file to check.
+            stat: Stat result of the file, if already known. If None, the
+                  file is stat'ed.
+
+        """
+        if stat is None:
+            stat = path.stat()
+        key = _resolve(path)
+        signature = get_signature(stat)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        return entry is not None and entry[:2] == (str(path), signature)
+
+    def load(
+        self, path: Path, composer: Composer, stat: Optional[stat_result] = None
+    ) -> Optional[Node]:
+        """Get the document at the given path, composing it on cache miss.
+
+        Args:
+            path: Path of the YAML file to load.
+            composer: Called with path to compose the file on cache miss.
+                      Errors it raises are forwarded, and nothing is cached.
+            stat: Stat result of the file, if already known. If None, the
+                  file is stat'ed.
+
+        """
+        if stat is None:
+            stat = path.stat()
+        key = _resolve(path)
+        name = str(path)
+        signature = get_signature(stat)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            # Marks of the cached nodes keep the path the file was opened with,
+            # so a document reached through another path is composed again.
+            if entry is not None and entry[:2] == (name, signature):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.node
+            self.misses += 1
+
+        node = composer(path)
+
+        if stat.st_size <= self._max_bytes:
+            with self._lock:
+                self._remove(key)
+                self._entries[key] = _Entry(name, signature, stat.st_size, node)
+                self._size += stat.st_size
+                self._evict()
+
+        return node
+
+    def clear(self) -> None:
+        """Remove all cached documents and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def _remove(self, key: Path) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def _evict(self) -> None:
+        while self._size > self._max_bytes:
+            __, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self.evictions += 1
+
+
+def get_signature(stat: stat_result) -> FileSignature:
+    """Return the (modification time, size, inode) signature of a file."""
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _resolve(path: Path) -> Path:
+    # Path.resolve also stats the resolved path on some Python versions.
+    return Path(realpath(path))
+
+
+_DOCUMENT_CACHE = DocumentCache()
+
+
+def get_document_cache() -> DocumentCache:
+    """Return the process-wide document cache."""
+    return _DOCUMENT_CACHE
@@ -1,8 +1,9 @@
 """MarshPy error handling related classes & definitions."""
 from enum import Enum
-from typing import Callable, Type
+from typing import Any, Callable, Optional, Type
 
 from yaml import Node
+from yaml.error import Mark
 
 
 class ErrorCode(Enum):
@@ -56,6 +57,15 @@ class MarshPyError(Exception):
         """
         super().__init__(MarshPyError._get_message(node, message))
         self.node = node
+        self.message = message
+
+    def __reduce__(self) -> Any:
+        """Pickle the error without the children of its node.
+
+        The node is replaced by a copy with the same type, tag, marks and
+        scalar value, so errors sent across processes stay small.
+        """
+        return (self.__class__, (_copy_node(self.node), self.message))
 
     @staticmethod
     def _get_message(node: Node, message: str) -> str:
@@ -127,3 +137,19 @@ def get_exception_type(error_code: ErrorCode) -> Type[MarshPyError]:
     """
     assert error_code in _CODE_TO_EXCEPTION_TYPE_MAPPING
     return _CODE_TO_EXCEPTION_TYPE_MAPPING[error_code]
+
+
+def _copy_node(node: Node) -> Node:
+    value = node.value if isinstance(node.value, str) else []
+    return type(node)(
+        node.tag, value, _copy_mark(node.start_mark), _copy_mark(node.end_mark)
+    )
+
+
+def _copy_mark(mark: Any) -> Optional[Mark]:
+    # Marks of the pure Python parser reference the whole parsed document.
+    if mark is None:
+        return None
+
+    name = getattr(mark, "name", "<Unkwnown>")
+    return Mark(name, mark.index, mark.line, mark.column, None, 0)
@@ -0,0 +1,206 @@
+"""Loading context consuming parser events instead of node trees."""
+from gettext import gettext as _
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type, cast
+
+from yaml import MappingNode, Node, ScalarNode, SequenceNode
+from yaml.events import (
+    MappingEndEvent,
+    MappingStartEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+
+from marshpy.core.constants import UNDEFINED
+from marshpy.core.interfaces import IBaseField
+from marshpy.core.loading_context import LoadingContext
+from marshpy.core.parsing import (
+    YamlSource,
+    check_single_document,
+    open_event_loader,
+)
+from marshpy.fields.base_field import BaseField
+from marshpy.fields.container_field import ContainerField
+from marshpy.fields.dict_field import DictField
+from marshpy.fields.list_field import ListField
+from marshpy.fields.object_field import ObjectBuilder, ObjectField
+
+EventLoader = Any
+StreamLoader = Callable[["EventLoadingContext", EventLoader, Any, Node], Any]
+
+
+class EventLoadingContext(LoadingContext):
+    """Loading context feeding parser events directly to built-in fields.
+
+    Lists, dictionaries and objects loaded by ListField, DictField and
+    ObjectField are loaded item by item while the parser reads them, without
+    composing the node tree of the whole document. Other nodes (scalars,
+    tagged or anchored nodes, nodes loaded by custom fields, or not having the
+    type the field expects) are composed and loaded as with LoadingContext, so
+    tag handlers and custom fields get complete nodes, and errors are the same.
+
+    Mapping and sequence nodes of values loaded from events, returned by
+    current_node, have the tag and marks of the YAML value, but no children.
+    load_document reads the parser events of the source once before loading
+    it, so that YAML syntax errors and extra documents are raised before
+    anything is loaded, as with LoadingContext. load_documents doesn't, so it
+    raises syntax errors only once the loading reaches them.
+    """
+
+    def load_document(
+        self, field: IBaseField, source: YamlSource, location: Optional[str] = None
+    ) -> Any:
+        self._add_source(location)
+        with self._tracer.span(location or "<document>", "document"):
+            # Documents are loaded while they're parsed, so the compose span of
+            # the file covers the loading.
+            with self._trace_source(location):
+                # Syntax errors and extra documents are raised before loading
+                # anything, as when composing the whole document.
+                source = check_single_document(source)
+                with open_event_loader(source) as loader:
+                    loader.get_event()  # StreamStartEvent
+                    assert not loader.check_event(StreamEndEvent), _(
+                        "source doesn't contain any YAML document."
+                    )
+
+                    result = self._load_document(loader, field, location)
+                    loader.get_event()  # StreamEndEvent
+
+        return result
+
+    def load_documents(
+        self, field: IBaseField, source: YamlSource, location: Optional[str] = None
+    ) -> Iterator[Any]:
+        self._add_source(location)
+        with open_event_loader(source) as loader:
+            loader.get_event()  # StreamStartEvent
+            while not loader.check_event(StreamEndEvent):
+                yield self._load_document(loader, field, location)
+
+            loader.get_event()  # StreamEndEvent
+
+    def _load_document(
+        self, loader: EventLoader, field: IBaseField, location: Optional[str]
+    ) -> Any:
+        loader.get_event()  # DocumentStartEvent
+        result = self._load_events(loader, field, location)
+        loader.get_event()  # DocumentEndEvent
+        loader.anchors = {}
+        return result
+
+    def _load_events(
+        self, loader: EventLoader, field: IBaseField, location: Optional[str] = None
+    ) -> Any:
+        event = loader.peek_event()
+        stream_loader = self._get_stream_loader(field, event)
+        if stream_loader is None:
+            node = loader.compose_node(None, None)
+            return self.load(field, node, location)
+
+        loader.get_event()
+        node = _create_node(loader, event)
+        self._stats.nodes += 1
+        if len(self._node_stack) > 0:
+            assert self._node_stack[-1][0] != node
+
+        self._node_stack.append((node, location))
+        try:
+            result = stream_loader(self, loader, field, node)
+        finally:
+            self._node_stack.pop()
+
+        return result
+
+    def _load_list(self, loader: EventLoader, field: ListField, node: Node) -> Any:
+        result = []
+        while not loader.check_event(SequenceEndEvent):
+            item = self._load_events(loader, field.item_field)
+            if item is UNDEFINED:
+                continue
+
+            result.append(item)
+
+        node.end_mark = loader.get_event().end_mark
+        return field.validate_value(self, result)
+
+    def _load_dict(self, loader: EventLoader, field: DictField, node: Node) -> Any:
+        result = {}
+        while not loader.check_event(MappingEndEvent):
+            key_node = loader.compose_node(node, None)
+            assert isinstance(key_node, ScalarNode)
+            key = key_node.value
+
+            item = self._load_events(loader, field.item_field)
+            if item is UNDEFINED:
+                continue
+
+            result[key] = item
+
+        node.end_mark = loader.get_event().end_mark
+        return field.validate_value(self, result)
+
+    def _load_object(self, loader: EventLoader, field: ObjectField, node: Node) -> Any:
+        config = self.get_config(ObjectField.Config)
+        builder = ObjectBuilder(field.object_class(), self, config)
+        self._stats.objects += 1
+
+        while not loader.check_event(MappingEndEvent):
+            name_node = loader.compose_node(node, None)
+            field_name = builder.get_field_name(name_node)
+            item_field = None
+            if field_name is not None:
+                item_field = builder.get_field(field_name)
+
+            if field_name is None or item_field is None:
+                # Compose the skipped value, so anchors it defines are known.
+                loader.compose_node(node, name_node)
+                continue
+
+            builder.set_field(field_name, self._load_events(loader, item_field))
+
+        node.end_mark = loader.get_event().end_mark
+        return field.validate_value(self, builder.build())
+
+    _STREAM_LOADERS: Dict[Type[Any], Tuple[Type[Any], StreamLoader]] = {
+        DictField: (MappingStartEvent, _load_dict),
+        ListField: (SequenceStartEvent, _load_list),
+        ObjectField: (MappingStartEvent, _load_object),
+    }
+
+    def _get_stream_loader(
+        self, field: IBaseField, event: Any
+    ) -> Optional[StreamLoader]:
+        # Subclasses of built-in fields may load nodes differently, and lazy
+        # fields and views keep their nodes, so they are always given composed
+        # nodes. Nodes are also composed when profiling, to time each of them.
+        entry = self._STREAM_LOADERS.get(type(field))
+        if entry is None or cast(BaseField, field).lazy or self._profiler:
+            return None
+
+        if isinstance(field, ContainerField) and field.view:
+            return None
+
+        event_type, stream_loader = entry
+        if not isinstance(event, event_type):
+            return None
+
+        if event.anchor is not None:
+            return None
+
+        tag = event.tag
+        if tag is not None and tag.startswith("!") and tag != "!":
+            return None
+
+        return stream_loader
+
+
+def _create_node(loader: EventLoader, event: Any) -> Node:
+    node_type = MappingNode if isinstance(event, MappingStartEvent) else SequenceNode
+    tag = event.tag
+    if tag is None or tag == "!":
+        tag = loader.resolve(node_type, None, event.implicit)
+
+    return node_type(
+        tag, [], event.start_mark, event.start_mark, flow_style=event.flow_style
+    )
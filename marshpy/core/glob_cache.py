@@ -0,0 +1,264 @@
+"""Cache of directory listings used to expand glob patterns."""
+from fnmatch import translate
+from functools import lru_cache
+from os import scandir, stat
+from pathlib import Path, PurePath
+from re import Pattern
+from re import compile as compile_regex
+from threading import Lock
+from time import time_ns
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union, cast
+
+from marshpy.core.document_cache import FileSignature, get_signature
+from marshpy.core.load_stats import LoadStats
+
+# Directories modified less than this many nanoseconds ago aren't cached, as
+# filesystems with a coarse timestamp resolution wouldn't change the
+# directory modification time if it's modified again in the same tick.
+RACY_DELAY_NS = 2_000_000_000
+
+# Matches any count of directories.
+_RECURSIVE = None
+
+Segment = Union[None, str, Pattern[str]]
+DirectorySignatures = Tuple[Tuple[str, FileSignature], ...]
+
+
+class _Listing(NamedTuple):
+    signature: FileSignature
+    files: Tuple[str, ...]
+    directories: Tuple[str, ...]
+    # Directories that aren't symbolic links, followed by recursive patterns.
+    real_directories: Tuple[str, ...]
+
+
+class _Result(NamedTuple):
+    directories: DirectorySignatures
+    paths: Tuple[Path, ...]
+
+
+class GlobCache:
+    """Cache of directory listings and glob results.
+
+    Directory listings are keyed by path, and are invalidated when the
+    modification time, size or inode of the directory changes, which happens
+    when entries are added, removed or renamed in it. Glob results are stored
+    with the signature of each directory visited to get them, and are reused
+    as long as these directories are unchanged, which only costs a stat call
+    per visited directory.
+
+    Matches are returned in name order in each directory. As with
+    Path.glob, '**' matches any count of directories, without following
+    symbolic links, and '*' matches hidden files.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._listings: Dict[str, _Listing] = {}
+        self._results: Dict[Tuple[str, str], _Result] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __reduce__(self) -> Any:
+        """Pickle the cache as an empty cache.
+
+        The process-wide cache is unpickled as the process-wide cache of the
+        receiving process.
+        """
+        if self is _GLOB_CACHE:
+            return (get_glob_cache, ())
+
+        return (GlobCache, ())
+
+    def glob(
+        self, root: Path, pattern: str, stats: Optional[LoadStats] = None
+    ) -> List[Path]:
+        """Return the files matching a glob pattern in a root directory.
+
+        Args:
+            root: The directory the pattern is relative to.
+            pattern: The glob pattern, as accepted by Path.glob.
+            stats: If given, the hit or miss is also counted in it.
+
+        """
+        key = (str(root), pattern)
+        with self._lock:
+            result = self._results.get(key)
+
+        if result is not None and _is_unchanged(result.directories):
+            with self._lock:
+                self.hits += 1
+            if stats is not None:
+                stats.add_cache_access("glob", True)
+            return list(result.paths)
+
+        visited: Dict[str, Optional[FileSignature]] = {}
+        paths: Dict[Path, None] = {}
+        self._match(root, _compile(pattern), 0, paths, visited)
+
+        # Visited directories recently modified are recorded with a None
+        # signature, results depending on them aren't cached.
+        signatures = tuple(visited.items())
+        with self._lock:
+            self.misses += 1
+            if all(it is not None for __, it in signatures):
+                directories = cast(DirectorySignatures, signatures)
+                self._results[key] = _Result(directories, tuple(paths))
+            else:
+                self._results.pop(key, None)
+
+        if stats is not None:
+            stats.add_cache_access("glob", False)
+        return list(paths)
+
+    def clear(self) -> None:
+        """Remove all cached listings and results, and reset counters."""
+        with self._lock:
+            self._listings.clear()
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _match(
+        self,
+        directory: Path,
+        segments: Tuple[Segment, ...],
+        index: int,
+        paths: Dict[Path, None],
+        visited: Dict[str, Optional[FileSignature]],
+    ) -> None:
+        segment = segments[index]
+        is_last = index == len(segments) - 1
+        if segment == "..":
+            if not is_last:
+                self._match(directory / "..", segments, index + 1, paths, visited)
+            return
+
+        listing = self._get_listing(directory, visited)
+        if listing is None:
+            return
+
+        if segment is _RECURSIVE:
+            # Like Path.glob, a trailing '**' only matches directories.
+            if not is_last:
+                self._match(directory, segments, index + 1, paths, visited)
+                for name in listing.real_directories:
+                    self._match(directory / name, segments, index, paths, visited)
+            return
+
+        names = listing.files if is_last else listing.directories
+        if isinstance(segment, str):
+            matched_names = [segment] if segment in names else []
+        else:
+            matched_names = [it for it in names if segment.fullmatch(it)]
+
+        for name in matched_names:
+            if is_last:
+                paths[directory / name] = None
+            else:
+                self._match(directory / name, segments, index + 1, paths, visited)
+
+    def _get_listing(
+        self, directory: Path, visited: Dict[str, Optional[FileSignature]]
+    ) -> Optional[_Listing]:
+        key = str(directory)
+        try:
+            signature = get_signature(stat(key))
+        except OSError:
+            visited[key] = _MISSING
+            return None
+
+        with self._lock:
+            listing = self._listings.get(key)
+
+        if listing is not None and listing.signature == signature:
+            visited[key] = signature
+            return listing
+
+        try:
+            listing = _list_directory(key, signature)
+        except OSError:
+            visited[key] = _MISSING
+            return None
+
+        if time_ns() - signature[0] < RACY_DELAY_NS:
+            visited[key] = None
+            return listing
+
+        visited[key] = signature
+        with self._lock:
+            self._listings[key] = listing
+
+        return listing
+
+
+# Signature of missing directories, or of paths which aren't directories.
+_MISSING: FileSignature = (-1, -1, -1)
+
+
+def _is_unchanged(directories: DirectorySignatures) -> bool:
+    for path, signature in directories:
+        try:
+            current_signature = get_signature(stat(path))
+        except OSError:
+            current_signature = _MISSING
+
+        if current_signature != signature:
+            return False
+
+    return True
+
+
+def _list_directory(path: str, signature: FileSignature) -> _Listing:
+    files = []
+    directories = []
+    real_directories = []
+    with scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    directories.append(entry.name)
+                    if not entry.is_symlink():
+                        real_directories.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+            except OSError:
+                continue
+
+    return _Listing(
+        signature,
+        tuple(sorted(files)),
+        tuple(sorted(directories)),
+        tuple(sorted(real_directories)),
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> Tuple[Segment, ...]:
+    pure_pattern = PurePath(pattern)
+    if pure_pattern.is_absolute() or pure_pattern.drive:
+        raise NotImplementedError("Non-relative patterns are unsupported")
+
+    if len(pure_pattern.parts) == 0:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+
+    return tuple(_compile_segment(it) for it in pure_pattern.parts)
+
+
+def _compile_segment(segment: str) -> Segment:
+    if segment == "**":
+        return _RECURSIVE
+
+    if not any(it in segment for it in "*?["):
+        return segment
+
+    return compile_regex(translate(segment))
+
+
+_GLOB_CACHE = GlobCache()
+
+
+def get_glob_cache() -> GlobCache:
+    """Return the process-wide glob cache."""
+    return _GLOB_CACHE
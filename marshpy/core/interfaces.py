@@ -1,5 +1,6 @@
 """MarshPy common definitions."""
 from abc import abstractmethod
+from re import Match
 from typing import Any, Optional, Type, TypeVar
 
 from yaml import Node
@@ -57,10 +58,28 @@ class ILoadingContext:
     def get_config(self, config_type: Type[ConfigType]) -> ConfigType:
         """Retrieve a config object."""
 
+    def find_config(self, config_type: Type[ConfigType]) -> Optional[ConfigType]:
+        """Retrieve a config object given in the config list, or None.
+
+        Unlike get_config, no default instance is created, so that optional
+        recordings cost nothing when they aren't requested. Defaults to
+        get_config.
+        """
+        return self.get_config(config_type)
+
     @abstractmethod
     def current_node(self) -> Node:
         """Return the currently loaded node."""
 
+    def current_tag_match(self) -> Optional["Match[str]"]:
+        """Return the match of the current tag handler pattern on the node tag.
+
+        Only valid in TagHandler.load, before child nodes are loaded. Returns
+        None if the handler overrides TagHandler.match. Returns None by
+        default, tag handlers then match the tag themselves.
+        """
+        return None
+
     @abstractmethod
     def current_location(self) -> Optional[str]:
         """Return the location of the document owning the current node.
@@ -95,3 +114,10 @@ class ILoadingContext:
             *args, **kwargs: Arguments used to format message.
 
         """
+
+    def object_created(self, obj: Any) -> None:
+        """Called by object fields with the object they load, once created.
+
+        Does nothing by default. Profiling contexts use it to report fields
+        under the class of the loaded object.
+        """
@@ -0,0 +1,306 @@
+"""Values loaded on first access."""
+from threading import RLock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from yaml import Node, ScalarNode
+
+from marshpy.core.interfaces import IBaseField, ILoadingContext
+
+Loader = Callable[[ILoadingContext], Any]
+
+# Loading contexts aren't thread-safe, and lazy values loaded from the same
+# document share their loading context.
+_LOCK = RLock()
+_NOT_LOADED = object()
+
+
+class LazyValue:
+    """Proxy to a value, loaded the first time it's accessed.
+
+    The node and location of the value are kept with the loading context, and
+    the value is loaded when one of its attributes, items or its length is
+    accessed, or when materialize is called. Loading errors are raised, or
+    given to the error handler, at that point.
+
+    The proxy isn't an instance of the loaded type: call materialize to get
+    the loaded value itself. Pickling a lazy value pickles the loaded value.
+    """
+
+    __slots__ = ("_context", "_loader", "_node", "_location", "_value")
+
+    def __init__(
+        self,
+        context: ILoadingContext,
+        loader: Loader,
+        node: Node,
+        location: Optional[str],
+    ):
+        """Initialize the lazy value.
+
+        Args:
+            context: The context to load the value with.
+            loader: Called with the context to load the value, when the node
+                    is the current node.
+            node: The node of the value.
+            location: The location of the document containing the node.
+
+        """
+        self._context: Optional[ILoadingContext] = context
+        self._loader = loader
+        self._node: Optional[Node] = node
+        self._location = location
+        self._value: Any = _NOT_LOADED
+
+    def materialize(self) -> Any:
+        """Load the value if needed, and return it.
+
+        Return:
+            The loaded value, or UNDEFINED if loading failed.
+
+        """
+        if self._value is _NOT_LOADED:
+            with _LOCK:
+                context = self._context
+                if context is not None:
+                    assert self._node is not None
+                    field = _DeferredField(self._loader)
+                    self._value = context.load(field, self._node, self._location)
+                    # Release the node tree and the context once loaded.
+                    self._context = None
+                    self._node = None
+
+        return self._value
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return True if the value was loaded."""
+        return self._value is not _NOT_LOADED
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the loaded value."""
+        if name in LazyValue.__slots__:
+            raise AttributeError(name)
+
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute of the loaded value."""
+        if name in LazyValue.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.materialize(), name, value)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get an item of the loaded value."""
+        return self.materialize()[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the loaded value."""
+        return iter(self.materialize())
+
+    def __len__(self) -> int:
+        """Return the length of the loaded value."""
+        return len(self.materialize())
+
+    def __contains__(self, item: Any) -> bool:
+        """Check if the loaded value contains an item."""
+        return item in self.materialize()
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the loaded value."""
+        if isinstance(other, LazyValue):
+            other = other.materialize()
+
+        return bool(self.materialize() == other)
+
+    def __hash__(self) -> int:
+        """Hash the loaded value."""
+        return hash(self.materialize())
+
+    def __bool__(self) -> bool:
+        """Return the truth value of the loaded value."""
+        return bool(self.materialize())
+
+    def __repr__(self) -> str:
+        """Represent the loaded value."""
+        return repr(self.materialize())
+
+    def __reduce__(self) -> Any:
+        """Pickle the loaded value instead of the proxy."""
+        return (_get_value, (self.materialize(),))
+
+
+class LazySequence(Sequence[Any]):
+    """Read-only sequence loading its items on access.
+
+    Items nodes are kept with the loading context, and each item is loaded
+    the first time it's read. Length and indexing don't load other items.
+    Unlike lists loaded by ListField, items failing to load aren't skipped,
+    but read as UNDEFINED, so that indices match the YAML sequence.
+    """
+
+    def __init__(
+        self,
+        context: ILoadingContext,
+        item_field: IBaseField,
+        nodes: List[Node],
+        location: Optional[str],
+        cache: bool = True,
+    ):
+        """Initialize the sequence.
+
+        Args:
+            context: The context to load items with.
+            item_field: The field used to load items.
+            nodes: The nodes of the items.
+            location: The location of the document containing the nodes.
+            cache: If True, loaded items are kept, and returned by later
+                   reads. Otherwise, items are loaded on each read.
+
+        """
+        self._context = context
+        self._item_field = item_field
+        self._nodes = nodes
+        self._location = location
+        self._items: Optional[List[Any]] = [_NOT_LOADED] * len(nodes) if cache else None
+
+    def __len__(self) -> int:
+        """Return the count of items."""
+        return len(self._nodes)
+
+    def __getitem__(self, index: Any) -> Any:
+        """Load and return an item, or a list of items for slices."""
+        if isinstance(index, slice):
+            return [self[it] for it in range(*index.indices(len(self._nodes)))]
+
+        items = self._items
+        if items is None:
+            return _load_item(
+                self._context, self._item_field, self._nodes[index], self._location
+            )
+
+        item = items[index]
+        if item is _NOT_LOADED:
+            item = _load_item(
+                self._context, self._item_field, self._nodes[index], self._location
+            )
+            items[index] = item
+
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over items, loading them."""
+        for index in range(len(self._nodes)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """Represent the sequence, without loading items."""
+        return f"LazySequence({len(self._nodes)} items)"
+
+    def __reduce__(self) -> Any:
+        """Pickle the sequence as a list of its items."""
+        return (list, (list(self),))
+
+
+class LazyMapping(Mapping[str, Any]):
+    """Read-only mapping loading its values on access.
+
+    Keys are read when the mapping is created, and each value is loaded the
+    first time it's read. Length, key lookup and iteration over keys don't
+    load values. Values failing to load are read as UNDEFINED.
+    """
+
+    def __init__(
+        self,
+        context: ILoadingContext,
+        item_field: IBaseField,
+        nodes: List[Tuple[Node, Node]],
+        location: Optional[str],
+        cache: bool = True,
+    ):
+        """Initialize the mapping.
+
+        Args:
+            context: The context to load values with.
+            item_field: The field used to load values.
+            nodes: The (key, value) node pairs of the YAML mapping.
+            location: The location of the document containing the nodes.
+            cache: See LazySequence.
+
+        """
+        self._context = context
+        self._item_field = item_field
+        self._nodes: Dict[str, Node] = {}
+        for key_node, value_node in nodes:
+            assert isinstance(key_node, ScalarNode)
+            self._nodes[key_node.value] = value_node
+
+        self._location = location
+        self._values: Optional[Dict[str, Any]] = {} if cache else None
+
+    def __len__(self) -> int:
+        """Return the count of keys."""
+        return len(self._nodes)
+
+    def __getitem__(self, key: str) -> Any:
+        """Load and return the value of a key."""
+        values = self._values
+        if values is not None and key in values:
+            return values[key]
+
+        value = _load_item(
+            self._context, self._item_field, self._nodes[key], self._location
+        )
+        if values is not None:
+            values[key] = value
+
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over keys, without loading values."""
+        return iter(self._nodes)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if a key is in the mapping, without loading its value."""
+        return key in self._nodes
+
+    def __repr__(self) -> str:
+        """Represent the mapping, without loading values."""
+        return f"LazyMapping({list(self._nodes)})"
+
+    def __reduce__(self) -> Any:
+        """Pickle the mapping as a dictionary."""
+        return (dict, (dict(self.items()),))
+
+
+def _load_item(
+    context: ILoadingContext, field: IBaseField, node: Node, location: Optional[str]
+) -> Any:
+    with _LOCK:
+        return context.load(field, node, location)
+
+
+class _DeferredField(IBaseField):
+    def __init__(self, loader: Loader):
+        self._loader = loader
+
+    def load(self, context: ILoadingContext) -> Any:
+        return self._loader(context)
+
+    @property
+    def required(self) -> bool:
+        return False
+
+
+def _get_value(value: Any) -> Any:
+    return value
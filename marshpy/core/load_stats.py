@@ -0,0 +1,77 @@
+"""Counters of the work done by a load."""
+from typing import Any, Counter, Dict
+
+from marshpy.core.errors import ErrorCode
+
+
+class LoadStats:  # pylint: disable=too-many-instance-attributes
+    """Counters of the work done while loading a document.
+
+    Tag handlers and fields get it through get_config, so if none is given in
+    the config list, each load counts in its own instance. Give one in the
+    config list to read the counters of a load, or to sum the counters of
+    several loads.
+
+    Members:
+        nodes: Count of loaded nodes, including object keys and nodes loaded
+               by tag handlers.
+        objects: Count of objects created by object fields.
+        scalars: Count of scalar values converted by scalar fields.
+        files: Count of files opened by import and glob tags. Files found in
+               the document cache aren't opened.
+        bytes_read: Total size of the opened files.
+        tags: Count of tag handler calls, by tag.
+        errors: Count of emitted errors, by error code.
+        cache_hits: Count of cache hits, by cache name ("document", "glob",
+                    "root_index" or "snapshot").
+        cache_misses: Count of cache misses, by cache name.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.nodes = 0
+        self.objects = 0
+        self.scalars = 0
+        self.files = 0
+        self.bytes_read = 0
+        self.tags: Counter[str] = Counter()
+        self.errors: Counter[ErrorCode] = Counter()
+        self.cache_hits: Counter[str] = Counter()
+        self.cache_misses: Counter[str] = Counter()
+
+    def add_cache_access(self, cache: str, hit: bool) -> None:
+        """Count a hit or a miss of the cache with the given name."""
+        if hit:
+            self.cache_hits[cache] += 1
+        else:
+            self.cache_misses[cache] += 1
+
+    def update(self, stats: "LoadStats") -> None:
+        """Add the counters of another instance to these ones."""
+        self.nodes += stats.nodes
+        self.objects += stats.objects
+        self.scalars += stats.scalars
+        self.files += stats.files
+        self.bytes_read += stats.bytes_read
+        self.tags.update(stats.tags)
+        self.errors.update(stats.errors)
+        self.cache_hits.update(stats.cache_hits)
+        self.cache_misses.update(stats.cache_misses)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the counters as a dictionary of built-in types.
+
+        Error codes are given by name, so the result can be serialized to
+        JSON or forwarded to a metrics system.
+        """
+        return {
+            "nodes": self.nodes,
+            "objects": self.objects,
+            "scalars": self.scalars,
+            "files": self.files,
+            "bytes_read": self.bytes_read,
+            "tags": dict(self.tags),
+            "errors": {code.name: count for code, count in self.errors.items()},
+            "cache_hits": dict(self.cache_hits),
+            "cache_misses": dict(self.cache_misses),
+        }
@@ -1,17 +1,26 @@
 """Loading context class & utilities."""
+from contextlib import contextmanager
 from gettext import gettext as _
-from typing import Any, Iterable, List, Optional, Tuple, Type
+from pathlib import Path
+from re import Match
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, cast
 
 from yaml import MappingNode, Node, ScalarNode, SequenceNode
 
 from marshpy.core.errors import ErrorCode, ErrorHandler, get_exception_type
 from marshpy.core.interfaces import ConfigType, IBaseField, ILoadingContext
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.manifest import Manifest
+from marshpy.core.parsing import YamlSource, compose, compose_all
+from marshpy.core.profiler import Profiler, ProfileStack
+from marshpy.core.tag_dispatcher import TagDispatch, TagDispatcher
+from marshpy.core.tracing import TraceArgs, Tracer, count_nodes
 from marshpy.tag_handlers.tag_handler import TagHandler
 
 NodeStack = List[Tuple[Node, Optional[str]]]
 
 
-class LoadingContext(ILoadingContext):
+class LoadingContext(ILoadingContext):  # pylint: disable=too-many-instance-attributes
     """Default and only implementation of ILoadingContext."""
 
     def __init__(
@@ -35,13 +44,31 @@ class LoadingContext(ILoadingContext):
 
         """
         self._error_handler = error_handler
-        self._tag_handlers = list(tag_handlers)
+        self._tag_dispatcher = TagDispatcher(tag_handlers)
+        self._tag_matches: List[Optional["Match[str]"]] = []
         self._node_stack: NodeStack = []
 
-        if config is not None:
-            self._config = config
-        else:
-            self._config = []
+        self._config = list(config) if config is not None else []
+        # Configs are indexed by each class of their MRO, so they are found
+        # when requested through a base class. The first given config wins.
+        self._config_registry: Dict[type, Any] = {}
+        for item in self._config:
+            for config_type in type(item).__mro__[:-1]:  # Skip object
+                self._config_registry.setdefault(config_type, item)
+
+        # The profiled load is bound on the instance only when a profiler is
+        # configured, so that loads without one aren't slowed down.
+        self._profiler: Optional[Profiler] = self._config_registry.get(Profiler)
+        self._profile_stack: ProfileStack = []
+        self._dispatch = self._tag_dispatcher.dispatch
+        self._profiled_dispatch: Optional[TagDispatch] = None
+        if self._profiler is not None:
+            self.load = self._load_profiled  # type: ignore
+            self.object_created = self._object_created_profiled  # type: ignore
+            self._dispatch = self._get_profiled_dispatch
+
+        self._tracer = self.get_config(Tracer)
+        self._stats = self.get_config(LoadStats)
 
     def load(
         self, field: IBaseField, node: Node, location: Optional[str] = None
@@ -63,11 +90,20 @@ class LoadingContext(ILoadingContext):
             assert self._node_stack[-1][0] != node
 
         self._node_stack.append((node, location))
+        self._stats.nodes += 1
 
         try:
-            tag_handler = self._get_tag_handler(node)
+            tag_handler, tag_match = self._get_tag_handler(node)
             if tag_handler is not None:
-                result = tag_handler.load(self, field)
+                self._stats.tags[node.tag] += 1
+                self._tag_matches.append(tag_match)
+                try:
+                    if self._tracer.enabled:
+                        result = self._load_traced(tag_handler, field, node)
+                    else:
+                        result = tag_handler.load(self, field)
+                finally:
+                    self._tag_matches.pop()
             else:
                 result = field.load(self)
         finally:
@@ -75,20 +111,74 @@ class LoadingContext(ILoadingContext):
 
         return result
 
+    def load_document(
+        self, field: IBaseField, source: YamlSource, location: Optional[str] = None
+    ) -> Any:
+        """Load a YAML document containing a single document.
+
+        Args:
+            field: Field describing the root node.
+            source: Either a string containing YAML, or a stream to a YAML
+                    source.
+            location: The path from which the document is loaded, if any.
+
+        """
+        self._add_source(location)
+        with self._tracer.span(location or "<document>", "document") as end_args:
+            with self._trace_source(location) as compose_args:
+                node = compose(source)
+                assert node is not None, _("source doesn't contain any YAML document.")
+                if self._tracer.enabled:
+                    end_args["nodes"] = compose_args["nodes"] = count_nodes(node)
+            return self.load(field, node, location)
+
+    def load_documents(
+        self, field: IBaseField, source: YamlSource, location: Optional[str] = None
+    ) -> Iterator[Any]:
+        """Load each document of a YAML stream, one at a time.
+
+        Args:
+            See load_document.
+
+        """
+        self._add_source(location)
+        for node in compose_all(source):
+            result = self.load(field, node, location)
+            del node
+            yield result
+
     def get_config(self, config_type: Type[ConfigType]) -> ConfigType:
+        result = self._config_registry.get(config_type)
+        if result is not None:
+            return cast(ConfigType, result)
+
+        # Virtual subclasses aren't in the MRO of registered configs.
+        for item in self._config:
+            if isinstance(item, config_type):
+                result = item
+                break
+        else:
+            result = config_type()
+
+        self._config_registry[config_type] = result
+        return cast(ConfigType, result)
+
+    def find_config(self, config_type: Type[ConfigType]) -> Optional[ConfigType]:
         for item in self._config:
             if isinstance(item, config_type):
                 return item
 
-        result = config_type()
-        self._config.append(config_type)
-        return result
+        return None
 
     def current_node(self) -> Node:
         nodes = self._node_stack
         assert len(nodes) > 0
         return nodes[-1][0]
 
+    def current_tag_match(self) -> Optional["Match[str]"]:
+        assert len(self._tag_matches) > 0
+        return self._tag_matches[-1]
+
     def current_location(self) -> Optional[str]:
         for __, location in reversed(self._node_stack):
             if location is not None:
@@ -126,6 +216,7 @@ class LoadingContext(ILoadingContext):
         """
         assert len(self._node_stack) > 0
         node, __ = self._node_stack[-1]
+        self._stats.errors[code] += 1
         message = message_format.format(*args, **kwargs)
         if self._error_handler is not None:
             self._error_handler(node, code, message)
@@ -143,24 +234,75 @@ class LoadingContext(ILoadingContext):
 
         return True
 
-    def _get_tag_handler(self, node: Node) -> Optional[TagHandler]:
-        tag = node.tag
-        if not tag.startswith("!"):
-            return None
-
-        found_handler = None
-        for handler in self._tag_handlers:
-            if not handler.match(node):
-                continue
+    def _load_profiled(
+        self, field: IBaseField, node: Node, location: Optional[str] = None
+    ) -> Any:
+        profiler = self._profiler
+        assert profiler is not None
+        dispatch = self._tag_dispatcher.dispatch(node)
+        frame = profiler.enter(self._profile_stack, field, node, dispatch.handler)
+        # Used by LoadingContext.load through _get_profiled_dispatch, instead
+        # of dispatching the node again.
+        self._profiled_dispatch = dispatch
+        try:
+            return LoadingContext.load(self, field, node, location)
+        finally:
+            profiler.exit(self._profile_stack, frame)
 
-            if found_handler is not None:
-                self.error(
-                    ErrorCode.MULTIPLE_MATCHING_HANDLERS,
-                    _("Got multiple matching handlers for tag {}"),
-                    tag,
-                )
-                continue
+    def _get_profiled_dispatch(self, node: Node) -> TagDispatch:
+        dispatch = self._profiled_dispatch
+        assert dispatch is not None and self._node_stack[-1][0] is node
+        self._profiled_dispatch = None
+        return dispatch
 
-            found_handler = handler
+    def _object_created_profiled(self, obj: Any) -> None:
+        profiler = self._profiler
+        assert profiler is not None
+        profiler.object_created(self._profile_stack, obj)
 
-        return found_handler
+    def _load_traced(
+        self, tag_handler: TagHandler, field: IBaseField, node: Node
+    ) -> Any:
+        with self._tracer.span(
+            str(node.tag),
+            "tag",
+            handler=type(tag_handler).__qualname__,
+            value=node.value if isinstance(node, ScalarNode) else None,
+            location=self.current_location(),
+        ):
+            return tag_handler.load(self, field)
+
+    def _add_source(self, location: Optional[str]) -> None:
+        if location is not None:
+            manifest = self.find_config(Manifest)
+            if manifest is not None:
+                manifest.add_file(Path(location))
+
+    @contextmanager
+    def _trace_source(self, location: Optional[str]) -> Iterator[TraceArgs]:
+        """Trace the composition of a document loaded from a file.
+
+        Emits the same file and compose spans as for imported files, the
+        yielded arguments being the ones of the compose span.
+        """
+        if location is None or not self._tracer.enabled:
+            yield {}
+            return
+
+        with self._tracer.span(location, "file"):
+            with self._tracer.span(location, "compose") as end_args:
+                yield end_args
+                end_args["bytes"] = Path(location).stat().st_size
+
+    def _get_tag_handler(
+        self, node: Node
+    ) -> Tuple[Optional[TagHandler], Optional["Match[str]"]]:
+        dispatch = self._dispatch(node)
+        for __ in range(dispatch.other_handlers_count):
+            self.error(
+                ErrorCode.MULTIPLE_MATCHING_HANDLERS,
+                _("Got multiple matching handlers for tag {}"),
+                node.tag,
+            )
+
+        return dispatch.handler, dispatch.match
@@ -0,0 +1,215 @@
+"""Recording of the files, variables and flags a loading depends on."""
+from hashlib import sha256
+from os import environ, stat_result
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from marshpy.core.document_cache import FileSignature, get_signature
+from marshpy.core.glob_cache import get_glob_cache
+
+
+class FileDependency(NamedTuple):
+    """A file loaded or looked up while loading.
+
+    Members:
+        path: Path of the file, as resolved by the tag handler.
+        signature: The file signature (see document_cache.get_signature), or
+                   None if the file didn't exist.
+        parent: Location of the document referencing the file, if any.
+    """
+
+    path: str
+    signature: Optional[FileSignature]
+    parent: Optional[str]
+
+    def has_changed(self) -> bool:
+        """Check if the file signature changed."""
+        return _get_file_signature(Path(self.path)) != self.signature
+
+
+class GlobDependency(NamedTuple):
+    """A glob pattern expanded in a root directory.
+
+    Members:
+        root: The root directory.
+        pattern: The glob pattern.
+        paths: Paths of the matched files, in glob order.
+        parent: Location of the document containing the glob, if any.
+    """
+
+    root: str
+    pattern: str
+    paths: Tuple[str, ...]
+    parent: Optional[str]
+
+    def has_changed(self) -> bool:
+        """Check if the pattern matches other files."""
+        return _glob(Path(self.root), self.pattern) != self.paths
+
+
+class EnvDependency(NamedTuple):
+    """An environment variable read while loading.
+
+    Members:
+        name: Name of the variable.
+        value_hash: SHA-256 of the variable value, or None if undefined.
+    """
+
+    name: str
+    value_hash: Optional[str]
+
+    def has_changed(self) -> bool:
+        """Check if the variable value changed."""
+        return _hash_value(environ.get(self.name)) != self.value_hash
+
+
+class FlagDependency(NamedTuple):
+    """A flag checked while loading.
+
+    Members:
+        flag: Name of the flag.
+        defined: Whether the flag was defined.
+    """
+
+    flag: str
+    defined: bool
+
+
+Dependency = Union[FileDependency, GlobDependency, EnvDependency, FlagDependency]
+
+
+class Manifest:
+    """Dependencies of a loaded value.
+
+    Tag handlers record in the manifest retrieved through find_config the
+    files they load or look for, the globs they expand, the environment
+    variables they read and the flags they check, and the loading context
+    records the loaded file, if any. Pass a manifest in the config list of
+    load to get the dependencies of the loaded value. Nothing is recorded
+    when no manifest is given.
+
+    Members:
+        files: Loaded or looked up files, by path.
+        globs: Expanded globs, by (root, pattern).
+        env: Read environment variables, by name.
+        flags: Checked flags, by name.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty manifest."""
+        self.files: Dict[str, FileDependency] = {}
+        self.globs: Dict[Tuple[str, str], GlobDependency] = {}
+        self.env: Dict[str, EnvDependency] = {}
+        self.flags: Dict[str, FlagDependency] = {}
+
+    def add_file(
+        self,
+        path: Path,
+        parent: Optional[str] = None,
+        stat: Optional[stat_result] = None,
+    ) -> None:
+        """Record the current signature of a file, or that it doesn't exist.
+
+        Args:
+            path: Path of the file.
+            parent: Location of the document referencing the file, if any.
+            stat: Stat result of the file, if already known. If None, the
+                  file is stat'ed.
+
+        """
+        signature = (
+            get_signature(stat) if stat is not None else _get_file_signature(path)
+        )
+        self.files[str(path)] = FileDependency(str(path), signature, parent)
+
+    def add_missing_file(self, path: Path, parent: Optional[str] = None) -> None:
+        """Record that a file doesn't exist, without checking it."""
+        self.files[str(path)] = FileDependency(str(path), None, parent)
+
+    def add_glob(
+        self,
+        root: Path,
+        pattern: str,
+        paths: Iterable[Path],
+        parent: Optional[str] = None,
+    ) -> None:
+        """Record the files matched by a glob pattern in a root directory."""
+        matched_paths = tuple(str(it) for it in paths)
+        dependency = GlobDependency(str(root), pattern, matched_paths, parent)
+        self.globs[(str(root), pattern)] = dependency
+
+    def add_env(self, name: str, value: Optional[str]) -> None:
+        """Record the value of an environment variable, None if undefined."""
+        self.env[name] = EnvDependency(name, _hash_value(value))
+
+    def add_flag(self, flag: str, defined: bool) -> None:
+        """Record whether a flag was defined when it was checked."""
+        self.flags[flag] = FlagDependency(flag, defined)
+
+    def update(self, manifest: "Manifest") -> None:
+        """Record the dependencies of another manifest."""
+        self.files.update(manifest.files)
+        self.globs.update(manifest.globs)
+        self.env.update(manifest.env)
+        self.flags.update(manifest.flags)
+
+    def get_changes(self, flags: Optional[Iterable[str]] = None) -> List[Dependency]:
+        """Return the dependencies that changed since they were recorded.
+
+        Files are checked with a stat call and globs are expanded again, but
+        no file is read.
+
+        Args:
+            flags: The currently defined flags. If None, flags aren't checked.
+
+        """
+        changes: List[Dependency] = []
+        changes.extend(it for it in self.env.values() if it.has_changed())
+
+        if flags is not None:
+            defined_flags = set(flags)
+            changes.extend(
+                it
+                for it in self.flags.values()
+                if (it.flag in defined_flags) != it.defined
+            )
+
+        changes.extend(it for it in self.files.values() if it.has_changed())
+        changes.extend(it for it in self.globs.values() if it.has_changed())
+        return changes
+
+    def has_changed(self, flags: Optional[Iterable[str]] = None) -> bool:
+        """Check if any dependency changed since it was recorded.
+
+        Stops at the first change found. See get_changes.
+        """
+        if any(it.has_changed() for it in self.env.values()):
+            return True
+
+        if flags is not None:
+            defined_flags = set(flags)
+            for dependency in self.flags.values():
+                if (dependency.flag in defined_flags) != dependency.defined:
+                    return True
+
+        return any(it.has_changed() for it in self.files.values()) or any(
+            it.has_changed() for it in self.globs.values()
+        )
+
+
+def _glob(root: Path, pattern: str) -> Tuple[str, ...]:
+    return tuple(str(it) for it in get_glob_cache().glob(root, pattern))
+
+
+def _get_file_signature(path: Path) -> Optional[FileSignature]:
+    try:
+        return get_signature(path.stat())
+    except OSError:
+        return None
+
+
+def _hash_value(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+
+    return sha256(value.encode("utf-8")).hexdigest()
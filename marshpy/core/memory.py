@@ -0,0 +1,59 @@
+"""Measure of the memory allocated by loads."""
+from contextlib import contextmanager
+from tracemalloc import get_traced_memory, is_tracing, reset_peak, start, stop
+from typing import Any, Iterator, NamedTuple, Optional
+
+
+class MemoryUsage(NamedTuple):
+    """Memory allocated by a load.
+
+    Members:
+        peak: Maximum size in bytes of the memory allocated during the load,
+              node trees and temporary values included.
+        retained: Size in bytes of the memory still allocated after the load,
+                  which is mostly the loaded value, and entries added to
+                  caches.
+    """
+
+    peak: int
+    retained: int
+
+
+class MemoryTracker:
+    """Measure the memory allocated by loads, using tracemalloc.
+
+    Give it in the config list of load, then read usage once it returns.
+    Tracing memory allocations slows loads down a lot, and tracemalloc traces
+    all threads, so loads running concurrently are measured together. If
+    tracemalloc isn't tracing already, it's started for the load, and stopped
+    after it.
+
+    Members:
+        usage: Memory allocated by the last measured load, or None if no load
+               was measured yet.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.usage: Optional[MemoryUsage] = None
+
+    def __reduce__(self) -> Any:
+        """Pickle the tracker as a tracker without measures."""
+        return (MemoryTracker, ())
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Measure the memory allocated in the with block, setting usage."""
+        started = not is_tracing()
+        if started:
+            start()
+
+        reset_peak()
+        origin = get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            current, peak = get_traced_memory()
+            if started:
+                stop()
+            self.usage = MemoryUsage(peak - origin, current - origin)
@@ -0,0 +1,230 @@
+"""YAML parsing backends.
+
+Composition is done with libyaml bindings when PyYAML was built with them, and
+falls back to the pure-Python composer otherwise. Both backends produce the
+same node tree, with the same tags and marks. Parse errors are always reported
+by the pure-Python parser, so that error messages and locations don't depend on
+the backend in use.
+"""
+from contextlib import contextmanager
+from gettext import gettext as _
+from typing import IO, Any, Iterator, Optional, Type, Union, cast
+
+from yaml import SafeLoader
+from yaml.composer import Composer
+from yaml.error import MarkedYAMLError
+from yaml.events import DocumentStartEvent, StreamEndEvent
+from yaml.nodes import Node
+from yaml.resolver import Resolver
+
+try:
+    from yaml._yaml import CParser
+    from yaml.cyaml import CSafeLoader
+except ImportError:  # pragma: no cover
+    CParser = None  # type: ignore
+    CSafeLoader = None  # type: ignore
+
+YamlSource = Union[str, IO[str]]
+
+LIBYAML_AVAILABLE = CSafeLoader is not None
+
+if LIBYAML_AVAILABLE:
+
+    class _LibyamlEventLoader(CParser, Composer, Resolver):  # type: ignore
+        """Loader exposing libyaml parser events and the Python composer.
+
+        The composer is used to compose sub-trees of the document while
+        events are consumed.
+        """
+
+        def __init__(self, stream: YamlSource) -> None:
+            # pylint: disable=non-parent-init-called
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            Resolver.__init__(self)
+
+else:  # pragma: no cover
+    _LibyamlEventLoader = None  # type: ignore
+
+
+def get_loader_class(use_libyaml: Optional[bool] = None) -> Type[Any]:
+    """Return the PyYAML loader class used to compose documents.
+
+    Args:
+        use_libyaml: If None, use libyaml when it's available. If True, use
+                     libyaml, and fail if it isn't available. If False,
+                     always use the pure-Python loader.
+
+    """
+    if use_libyaml is None:
+        use_libyaml = LIBYAML_AVAILABLE
+
+    if use_libyaml:
+        assert LIBYAML_AVAILABLE, _("PyYAML was built without libyaml support.")
+        return cast(Type[Any], CSafeLoader)
+
+    return SafeLoader
+
+
+def compose(source: YamlSource, use_libyaml: Optional[bool] = None) -> Optional[Node]:
+    """Compose a single YAML document into a node tree.
+
+    Args:
+        source: Either a string containing YAML, or a stream to a YAML source.
+        use_libyaml: See get_loader_class.
+
+    Return:
+        The root node of the document, or None if the source is empty.
+
+    """
+    loader_class = get_loader_class(use_libyaml)
+    start = _tell(source)
+    loader = loader_class(source)
+    try:
+        return cast(Optional[Node], loader.get_single_node())
+    except MarkedYAMLError:
+        if loader_class is SafeLoader or not _rewind(source, start):
+            raise
+    finally:
+        loader.dispose()
+
+    # libyaml doesn't report errors the same way the pure-Python parser does,
+    # so parse the document again to get the same error than without libyaml.
+    return compose(source, use_libyaml=False)
+
+
+def compose_all(
+    source: YamlSource, use_libyaml: Optional[bool] = None
+) -> Iterator[Node]:
+    """Compose the documents of a YAML stream one at a time.
+
+    Each document is composed when the next item is requested, so only one
+    document of the stream is held by this generator at once.
+
+    Args:
+        source: Either a string containing YAML, or a stream to a YAML source.
+        use_libyaml: See get_loader_class.
+
+    """
+    loader_class = get_loader_class(use_libyaml)
+    start = _tell(source)
+    loader = loader_class(source)
+    composed_count = 0
+    try:
+        while loader.check_node():
+            yield loader.get_node()
+            composed_count += 1
+        return
+    except MarkedYAMLError:
+        if loader_class is SafeLoader or not _rewind(source, start):
+            raise
+    finally:
+        loader.dispose()
+
+    # See compose : parse the stream again to get the pure-Python error,
+    # skipping documents that were already returned.
+    for index, node in enumerate(compose_all(source, use_libyaml=False)):
+        if index >= composed_count:
+            yield node
+
+
+def check_single_document(
+    source: YamlSource, use_libyaml: Optional[bool] = None
+) -> YamlSource:
+    """Raise the error compose would raise if source isn't a single document.
+
+    Only parser events are read, no node is composed, so errors compose would
+    raise can be raised before loading anything from the source.
+
+    Args:
+        source: Either a string containing YAML, or a stream to a YAML source.
+        use_libyaml: See get_loader_class.
+
+    Return:
+        The source, rewound to where it started. Streams that can't be
+        rewound are read in a string first.
+
+    """
+    if not isinstance(source, str) and _tell(source) is None:
+        source = source.read()
+
+    use_libyaml = get_loader_class(use_libyaml) is not SafeLoader
+    loader_class = _LibyamlEventLoader if use_libyaml else SafeLoader
+    start = _tell(source)
+    loader = loader_class(source)
+    valid = True
+    try:
+        document_count = 0
+        while valid and not loader.check_event(StreamEndEvent):
+            if isinstance(loader.get_event(), DocumentStartEvent):
+                document_count += 1
+                valid = document_count == 1
+    except MarkedYAMLError:
+        valid = False
+    finally:
+        loader.dispose()
+
+    _rewind(source, start)
+    if not valid:
+        # Raises the same error as compose.
+        compose(source, use_libyaml=False)
+        _rewind(source, start)
+
+    return source
+
+
+@contextmanager
+def open_event_loader(
+    source: YamlSource, use_libyaml: Optional[bool] = None
+) -> Iterator[Any]:
+    """Open a loader giving access to both parser events and the composer.
+
+    The returned loader exposes the check_event, peek_event & get_event
+    methods of PyYAML parsers, and the compose_node method of PyYAML composer.
+    As with compose, parse errors raised with libyaml are replaced by the ones
+    the pure-Python parser raises.
+
+    Args:
+        source: Either a string containing YAML, or a stream to a YAML source.
+        use_libyaml: See get_loader_class.
+
+    """
+    use_libyaml = get_loader_class(use_libyaml) is not SafeLoader
+    loader_class = _LibyamlEventLoader if use_libyaml else SafeLoader
+    start = _tell(source)
+    loader = loader_class(source)
+    try:
+        yield loader
+    except MarkedYAMLError:
+        if not use_libyaml or not _rewind(source, start):
+            raise
+
+        for __ in compose_all(source, use_libyaml=False):
+            pass
+        raise
+    finally:
+        loader.dispose()
+
+
+def _tell(source: YamlSource) -> Optional[int]:
+    if isinstance(source, str):
+        return None
+
+    try:
+        if source.seekable():
+            return source.tell()
+    except (AttributeError, OSError):
+        pass
+
+    return None
+
+
+def _rewind(source: YamlSource, start: Optional[int]) -> bool:
+    if isinstance(source, str):
+        return True
+
+    if start is None:
+        return False
+
+    source.seek(start)
+    return True
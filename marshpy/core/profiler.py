@@ -0,0 +1,340 @@
+"""Profiling of loads, aggregated by field type, object field and tag handler."""
+from marshal import dump
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from yaml import MappingNode, Node
+
+from marshpy.core.interfaces import IBaseField
+from marshpy.tag_handlers.tag_handler import TagHandler
+
+FieldKey = Tuple[str, str]
+
+
+class ProfileStats(NamedTuple):
+    """Profiling statistics of a kind of load.
+
+    Members:
+        calls: Count of loads.
+        inclusive: Time in seconds spent in these loads, including child
+                   loads. Loads nested in a load of the same kind may be counted
+                   twice.
+        exclusive: Time in seconds spent in these loads, excluding child
+                   loads.
+    """
+
+    calls: int
+    inclusive: float
+    exclusive: float
+
+
+class ProfileReport(NamedTuple):
+    """Profiling statistics of loads, returned by Profiler.report.
+
+    Members:
+        by_field_type: Statistics by name of field class.
+        by_field: Statistics by (class name, field name), for fields of
+                  objects loaded from a mapping. The class is the one
+                  declaring the field, in the bases of the loaded object
+                  class.
+        by_tag_handler: Statistics by name of the tag handler class, for
+                        nodes loaded by a tag handler, including the loads
+                        of their child nodes.
+    """
+
+    by_field_type: Dict[str, ProfileStats]
+    by_field: Dict[FieldKey, ProfileStats]
+    by_tag_handler: Dict[str, ProfileStats]
+
+    def format(self, limit: int = 20) -> str:
+        """Format the report as text tables, sorted by exclusive time.
+
+        Args:
+            limit: Maximum count of rows per table.
+
+        """
+        lines: List[str] = []
+        tables: List[Tuple[str, Dict[Any, ProfileStats]]] = [
+            ("Field type", self.by_field_type),
+            ("Field", self.by_field),
+            ("Tag handler", self.by_tag_handler),
+        ]
+        for title, table in tables:
+            lines.append(f"{'calls':>9} {'incl (s)':>10} {'excl (s)':>10}  {title}")
+            rows = sorted(table.items(), key=lambda it: it[1].exclusive, reverse=True)
+            for key, stats in rows[:limit]:
+                name = ".".join(key) if isinstance(key, tuple) else key
+                lines.append(
+                    f"{stats.calls:>9} {stats.inclusive:>10.6f} "
+                    f"{stats.exclusive:>10.6f}  {name}"
+                )
+            lines.append("")
+
+        return "\n".join(lines)
+
+
+class _Stats:
+    __slots__ = ["calls", "primitive_calls", "inclusive", "exclusive"]
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.primitive_calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+
+    def add(self, inclusive: float, exclusive: float, recursive: bool) -> None:
+        """Record a call, its inclusive time only if it's not recursive."""
+        self.calls += 1
+        self.exclusive += exclusive
+        if not recursive:
+            self.primitive_calls += 1
+            self.inclusive += inclusive
+
+    def to_tuple(self) -> Tuple[int, int, float, float]:
+        """Return the statistics in the order of pstats entries."""
+        return (self.primitive_calls, self.calls, self.exclusive, self.inclusive)
+
+
+class _Function:
+    __slots__ = ["stats", "callers"]
+
+    def __init__(self) -> None:
+        self.stats = _Stats()
+        self.callers: Dict[str, _Stats] = {}
+
+
+class ProfileFrame:  # pylint: disable=too-many-instance-attributes
+    """A load in progress, pushed on the profile stack of a loading context."""
+
+    __slots__ = [
+        "field",
+        "node",
+        "field_key",
+        "tag_handler",
+        "label",
+        "start",
+        "children_time",
+        "object_class",
+        "child_keys",
+    ]
+
+    def __init__(
+        self,
+        field: IBaseField,
+        node: Node,
+        field_key: Optional[FieldKey],
+        tag_handler: Optional[TagHandler],
+    ):
+        """Initialize the frame."""
+        self.field = field
+        self.node = node
+        self.field_key = field_key
+        self.tag_handler = tag_handler
+        if tag_handler is not None:
+            self.label = f"!{type(tag_handler).__qualname__}"
+        elif field_key is not None:
+            self.label = ".".join(field_key)
+        else:
+            self.label = f"<{type(field).__qualname__}>"
+        self.start = 0.0
+        self.children_time = 0.0
+        # Class of the object loaded by an object field, once created.
+        self.object_class: Optional[type] = None
+        # Field keys of the value nodes of an object, by node id, built on the
+        # first child load.
+        self.child_keys: Optional[Dict[int, FieldKey]] = None
+
+
+ProfileStack = List[ProfileFrame]
+
+
+class Profiler:
+    """Collect timings of the loads it's configured for.
+
+    Give a profiler in the config list of a load to time each node load of
+    it, and get the results through report or dump_stats. A profiler can be
+    shared by several loads, even concurrent ones, timings are then summed.
+    When no profiler is configured, loads aren't instrumented at all.
+
+    With the events engine, nodes are always composed before being loaded
+    when profiling, so that each node load is timed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self._lock = Lock()
+        self._by_field_type: Dict[str, _Stats] = {}
+        self._by_field: Dict[FieldKey, _Stats] = {}
+        self._by_tag_handler: Dict[str, _Stats] = {}
+        self._functions: Dict[str, _Function] = {}
+        # Names of the classes declaring fields, by loaded class and field.
+        self._owner_names: Dict[Tuple[type, str], str] = {}
+
+    def __reduce__(self) -> Any:
+        """Pickle the profiler as an empty profiler."""
+        return (Profiler, ())
+
+    def enter(
+        self,
+        stack: ProfileStack,
+        field: IBaseField,
+        node: Node,
+        tag_handler: Optional[TagHandler],
+    ) -> ProfileFrame:
+        """Push a frame for a node load on a profile stack, and start timing it.
+
+        Args:
+            stack: The profile stack of the loading context.
+            field: Field loading the node.
+            node: The loaded node.
+            tag_handler: Tag handler loading the node, if any.
+
+        """
+        field_key = None
+        if len(stack) > 0:
+            parent = stack[-1]
+            if parent.tag_handler is not None and parent.field is field:
+                # A tag handler loading a node for the same field.
+                field_key = parent.field_key
+            elif parent.object_class is not None:
+                if parent.child_keys is None:
+                    parent.child_keys = self._get_child_keys(parent)
+                field_key = parent.child_keys.get(id(node))
+
+        frame = ProfileFrame(field, node, field_key, tag_handler)
+        stack.append(frame)
+        frame.start = perf_counter()
+        return frame
+
+    def object_created(self, stack: ProfileStack, obj: Any) -> None:
+        """Record the class of the object loaded by the current frame."""
+        if len(stack) > 0:
+            stack[-1].object_class = type(obj)
+
+    def exit(self, stack: ProfileStack, frame: ProfileFrame) -> None:
+        """Stop timing a frame, pop it and record its timings."""
+        inclusive = perf_counter() - frame.start
+        exclusive = inclusive - frame.children_time
+        stack.pop()
+        caller = None
+        if len(stack) > 0:
+            caller = stack[-1]
+            caller.children_time += inclusive
+
+        label = frame.label
+        recursive = any(it.label == label for it in stack)
+
+        with self._lock:
+            field_type = type(frame.field).__qualname__
+            _get_stats(self._by_field_type, field_type).add(
+                inclusive, exclusive, recursive
+            )
+            if frame.field_key is not None:
+                _get_stats(self._by_field, frame.field_key).add(
+                    inclusive, exclusive, recursive
+                )
+            if frame.tag_handler is not None:
+                handler_type = type(frame.tag_handler).__qualname__
+                _get_stats(self._by_tag_handler, handler_type).add(
+                    inclusive, exclusive, recursive
+                )
+
+            function = self._functions.get(label)
+            if function is None:
+                function = self._functions[label] = _Function()
+            function.stats.add(inclusive, exclusive, recursive)
+            if caller is not None:
+                _get_stats(function.callers, caller.label).add(
+                    inclusive, exclusive, recursive
+                )
+
+    def _get_child_keys(self, frame: ProfileFrame) -> Dict[int, FieldKey]:
+        object_node = frame.node
+        cls = frame.object_class
+        if not isinstance(object_node, MappingNode) or cls is None:
+            return {}
+
+        child_keys = {}
+        for key_node, value_node in reversed(object_node.value):
+            field_name = str(key_node.value)
+            owner_name = self._owner_names.get((cls, field_name))
+            if owner_name is None:
+                owner_name = _get_owner_name(cls, field_name)
+                self._owner_names[(cls, field_name)] = owner_name
+            child_keys[id(value_node)] = (owner_name, field_name)
+
+        return child_keys
+
+    def report(self) -> ProfileReport:
+        """Return the statistics collected so far."""
+        with self._lock:
+            return ProfileReport(
+                by_field_type=_to_profile_stats(self._by_field_type),
+                by_field=_to_profile_stats(self._by_field),
+                by_tag_handler=_to_profile_stats(self._by_tag_handler),
+            )
+
+    def dump_stats(self, path: Union[str, Path]) -> None:
+        """Write the collected statistics in a file readable by pstats.
+
+        Each tag handler, object field and field type is written as a
+        function, called by the function of its parent node load.
+
+        Args:
+            path: Path of the file to write.
+
+        """
+        with self._lock:
+            stats = {
+                _get_pstats_key(label): (
+                    *function.stats.to_tuple(),
+                    {
+                        _get_pstats_key(caller): caller_stats.to_tuple()
+                        for caller, caller_stats in function.callers.items()
+                    },
+                )
+                for label, function in self._functions.items()
+            }
+
+        with open(path, "wb") as stats_file:
+            dump(stats, stats_file)
+
+    def clear(self) -> None:
+        """Remove all collected statistics."""
+        with self._lock:
+            self._by_field_type.clear()
+            self._by_field.clear()
+            self._by_tag_handler.clear()
+            self._functions.clear()
+
+
+def _get_owner_name(cls: type, field_name: str) -> str:
+    """Return the name of the class declaring a field, in the MRO of cls."""
+    for owner in cls.__mro__:
+        owner_vars = vars(owner)
+        if field_name in owner_vars.get("fields", {}):
+            return owner.__qualname__
+        if field_name in owner_vars.get("__annotations__", {}):
+            return owner.__qualname__
+
+    return cls.__qualname__
+
+
+def _get_stats(table: Dict[Any, _Stats], key: Any) -> _Stats:
+    stats = table.get(key)
+    if stats is None:
+        stats = table[key] = _Stats()
+    return stats
+
+
+def _to_profile_stats(table: Dict[Any, _Stats]) -> Dict[Any, ProfileStats]:
+    return {
+        key: ProfileStats(stats.calls, stats.inclusive, stats.exclusive)
+        for key, stats in table.items()
+    }
+
+
+def _get_pstats_key(label: str) -> Tuple[str, int, str]:
+    return ("marshpy", 0, label)
@@ -1,52 +1,122 @@
 """Custom resolvers"""
-from typing import Any, Type, get_args, get_origin, get_type_hints
+import types
+from enum import Enum
+from gettext import gettext as _
+from inspect import isclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Type, Union, get_args, get_origin, get_type_hints
 
-from marshpy.fields.base_field import IBaseField
+from marshpy.fields.base_field import BaseField, IBaseField
 from marshpy.fields.bool_field import BoolField
 from marshpy.fields.dict_field import DictField
+from marshpy.fields.enum_field import EnumField
 from marshpy.fields.float_field import FloatField
 from marshpy.fields.int_field import IntField
 from marshpy.fields.list_field import ListField
 from marshpy.fields.object_field import ObjectField
+from marshpy.fields.path_field import PathField
 from marshpy.fields.string_field import StringField
 
-_LITERAL_FIELD_MAPPINGS = {
-    str: StringField,
-    int: IntField,
-    bool: BoolField,
-    float: FloatField,
+# Fields built from annotations have no per-object state, so the same instance
+# is shared by all classes annotated with a given type.
+_LITERAL_FIELD_MAPPINGS: Dict[Any, BaseField] = {
+    str: StringField(),
+    int: IntField(),
+    bool: BoolField(),
+    float: FloatField(),
+    Path: PathField(),
 }
 
+# Unions written with the | operator (Python 3.10+) have their own origin type.
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+_NONE_TYPE = type(None)
 
-def annotation_fields_resolver(obj: Any) -> dict[str, IBaseField]:
-    """Fields resolver using type hints to get object field."""
-    result = {}
-    for name, annotation in get_type_hints(obj).items():
-        result[name] = _build_field(annotation)
+_ANNOTATION_FIELDS: Dict[Any, BaseField] = {}
+_CLASS_FIELDS: Dict[Type[Any], Dict[str, IBaseField]] = {}
+_LOCK = Lock()
 
-    return result
 
+def annotation_fields_resolver(obj: Any) -> Dict[str, IBaseField]:
+    """Fields resolver using type hints to get object field.
 
-def _build_field(field_type: Type[Any]):
+    Fields are resolved once per class, the returned dictionary must not be
+    modified. As type hints are resolved on the object, only the annotations
+    of the class are used, or the ones of its nearest base class declaring
+    annotations if it has none.
+    """
+    cls = obj.__class__
+    fields = _CLASS_FIELDS.get(cls)
+    if fields is None:
+        fields = {
+            name: get_annotation_field(annotation)
+            for name, annotation in get_type_hints(obj).items()
+        }
+        with _LOCK:
+            fields = _CLASS_FIELDS.setdefault(cls, fields)
+
+    return fields
+
+
+def get_annotation_field(annotation: Any) -> BaseField:
+    """Return the field loading values of the given annotation type.
+
+    Fields are built once per annotation, and shared between all callers.
+    """
+    field = _ANNOTATION_FIELDS.get(annotation)
+    if field is None:
+        field = _build_field(annotation)
+        with _LOCK:
+            field = _ANNOTATION_FIELDS.setdefault(annotation, field)
+
+    return field
+
+
+def clear_annotation_cache() -> None:
+    """Drop fields resolved from annotations.
+
+    Must be called when annotations of a class change after objects of that
+    class were loaded. Schemas cached by ObjectField.Config instances should be
+    invalidated too.
+    """
+    with _LOCK:
+        _ANNOTATION_FIELDS.clear()
+        _CLASS_FIELDS.clear()
+
+
+def _build_field(field_type: Any) -> BaseField:
     if field_type in _LITERAL_FIELD_MAPPINGS:
-        return _LITERAL_FIELD_MAPPINGS[field_type]()
+        return _LITERAL_FIELD_MAPPINGS[field_type]
 
     origin_type = get_origin(field_type)
     type_args = get_args(field_type)
+    if origin_type in _UNION_TYPES:
+        # Optional[T] is loaded as T, the value being left unset if missing.
+        value_types = [it for it in type_args if it is not _NONE_TYPE]
+        assert len(value_types) == 1, _("Unions of types aren't supported: {}").format(
+            field_type
+        )
+        return get_annotation_field(value_types[0])
+
     if origin_type == list:
         assert len(type_args) == 1
-        nested_field = _build_field(type_args[0])
+        nested_field = get_annotation_field(type_args[0])
         return ListField(nested_field)
 
     if origin_type == dict:
         assert len(type_args) == 2
         assert type_args[0] == str
-        nested_field = _build_field(type_args[1])
+        nested_field = get_annotation_field(type_args[1])
         return DictField(nested_field)
 
+    if isclass(field_type) and issubclass(field_type, Enum):
+        return EnumField(field_type)
+
     return ObjectField(field_type)
 
 
+# Fields resolved from annotations don't depend on objects, so schemas can be
+# cached.
 ANNOTATION_RESOLVER_CONFIG = ObjectField.Config(
-    fields_resolver=annotation_fields_resolver
+    fields_resolver=annotation_fields_resolver, cache_schemas=True
 )
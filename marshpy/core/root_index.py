@@ -0,0 +1,191 @@
+"""Index of the files of root directories, used to resolve imports."""
+from os import scandir, stat_result
+from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+from threading import Lock
+from time import time_ns
+from typing import Any, Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+from unicodedata import normalize
+from weakref import WeakKeyDictionary
+
+from marshpy.core.document_cache import FileSignature, get_signature
+from marshpy.core.glob_cache import RACY_DELAY_NS
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.stat_cache import StatCache
+
+
+class _Listing(NamedTuple):
+    signature: FileSignature
+    files: FrozenSet[str]
+    folded_files: FrozenSet[str]
+
+
+_EMPTY_LISTING = _Listing((0, 0, 0), frozenset(), frozenset())
+
+# Listings of recently modified directories, with the stat result they were
+# listed for.
+_RacyListings = Dict[str, Tuple[stat_result, _Listing]]
+
+
+class RootIndex:
+    """Index of the file names of directories, to find files in roots.
+
+    The names of the files of a directory are listed the first time a file
+    is looked up in it, and are kept until the modification time, size or
+    inode of the directory changes. Finding a file in a list of roots then
+    costs one stat call per directory, done through the stat cache of the
+    load, so that it's done once per load, instead of one stat call per root
+    for each looked up file. Missing files are found the same way.
+
+    Directories modified recently aren't indexed, but their listings are kept
+    as long as the stat cache of the load returns the same stat result for
+    them, so they are listed once per load.
+
+    File names are matched exactly. As case-insensitive file systems also
+    open a file through a name differing by case or Unicode normalization,
+    a file whose listed name only differs this way is checked with a stat
+    call, and found if it exists.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._listings: Dict[str, _Listing] = {}
+        self._racy_listings: "WeakKeyDictionary[StatCache, _RacyListings]" = (
+            WeakKeyDictionary()
+        )
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __reduce__(self) -> Any:
+        """Pickle the index as an empty index.
+
+        The process-wide index is unpickled as the process-wide index of the
+        receiving process.
+        """
+        if self is _ROOT_INDEX:
+            return (get_root_index, ())
+
+        return (RootIndex, ())
+
+    def find(
+        self,
+        roots: Iterable[Path],
+        relative_path: Path,
+        stat_cache: StatCache,
+        stats: Optional[LoadStats] = None,
+    ) -> Optional[Path]:
+        """Find a file in the first root containing it.
+
+        Args:
+            roots: The root directories, by order of priority.
+            relative_path: Path of the file, relative to the roots.
+            stat_cache: Cache used to check directories.
+            stats: If given, hits and misses are also counted in it.
+
+        Return:
+            The path of the file in the first root containing it, or None if
+            no root contains it.
+
+        """
+        name = relative_path.name
+        parent = relative_path.parent
+        for root in roots:
+            listing = self._get_listing(root / parent, stat_cache, stats)
+            if name in listing.files:
+                return root / relative_path
+
+            if _fold(name) in listing.folded_files:
+                path = root / relative_path
+                result = stat_cache.stat(path)
+                if result is not None and S_ISREG(result.st_mode):
+                    return path
+
+        return None
+
+    def clear(self) -> None:
+        """Remove all listings, and reset counters."""
+        with self._lock:
+            self._listings.clear()
+            self._racy_listings.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _get_listing(
+        self, directory: Path, stat_cache: StatCache, stats: Optional[LoadStats]
+    ) -> _Listing:
+        result = stat_cache.stat(directory)
+        if result is None or not S_ISDIR(result.st_mode):
+            return _EMPTY_LISTING
+
+        key = str(directory)
+        signature = get_signature(result)
+        with self._lock:
+            listing = self._get_cached_listing(key, signature, stat_cache, result)
+            if listing is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if stats is not None:
+            stats.add_cache_access("root_index", listing is not None)
+        if listing is not None:
+            return listing
+
+        try:
+            files = frozenset(_list_files(key))
+        except OSError:
+            return _EMPTY_LISTING
+
+        listing = _Listing(signature, files, frozenset(_fold(it) for it in files))
+        with self._lock:
+            # See glob_cache.RACY_DELAY_NS.
+            if time_ns() - signature[0] >= RACY_DELAY_NS:
+                self._listings[key] = listing
+            else:
+                racy_listings = self._racy_listings.setdefault(stat_cache, {})
+                racy_listings[key] = (result, listing)
+
+        return listing
+
+    def _get_cached_listing(
+        self,
+        key: str,
+        signature: FileSignature,
+        stat_cache: StatCache,
+        result: stat_result,
+    ) -> Optional[_Listing]:
+        listing = self._listings.get(key)
+        if listing is not None and listing.signature == signature:
+            return listing
+
+        # The stat cache returns the same result as long as it considers the
+        # directory unchanged, the listing is then still valid for it.
+        racy_listing = self._racy_listings.get(stat_cache, {}).get(key)
+        if racy_listing is not None and racy_listing[0] is result:
+            return racy_listing[1]
+
+        return None
+
+
+def _fold(name: str) -> str:
+    """Return the name compared by case-insensitive file systems."""
+    return normalize("NFC", name).casefold()
+
+
+def _list_files(directory: str) -> Iterable[str]:
+    with scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    yield entry.name
+            except OSError:
+                continue
+
+
+_ROOT_INDEX = RootIndex()
+
+
+def get_root_index() -> RootIndex:
+    """Return the process-wide root index."""
+    return _ROOT_INDEX
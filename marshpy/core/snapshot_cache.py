@@ -0,0 +1,146 @@
+"""Disk cache of loaded values."""
+import pickle
+from hashlib import sha256
+from os import replace
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Iterable, Optional
+
+from marshpy.core.constants import UNDEFINED
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.manifest import Manifest
+
+# Bumped when the format of snapshots changes.
+_SNAPSHOT_FORMAT = 3
+
+
+class SnapshotCache:
+    """Cache of pickled loaded values, stored in a directory.
+
+    Snapshots are keyed by the root source, the loaded type, the engine, the
+    defined flags, the custom tag handler types, the roots of path handlers
+    and the cache version. A snapshot is only used if none of the files,
+    globs and environment variables recorded in its manifest changed since
+    it was stored. Unreadable snapshots are ignored, the value being loaded
+    again.
+
+    Other loading parameters, like the settings of tag handlers or other
+    configs, aren't part of the key: change the version when they change.
+    """
+
+    def __init__(self, directory: Path, version: str = ""):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory where snapshots are stored. It's created if
+                       it doesn't exist.
+            version: Added to the snapshot keys, change it to invalidate all
+                     snapshots, for example when loaded classes change.
+
+        """
+        self._directory = directory
+        self._version = version
+
+    def get_key(self, *parts: Any) -> str:
+        """Return the key of a snapshot, from the given parts.
+
+        Parts are converted to strings, so they should have a stable string
+        representation.
+        """
+        key = sha256()
+        for part in (_SNAPSHOT_FORMAT, self._version, *parts):
+            key.update(str(part).encode("utf-8"))
+            key.update(b"\0")
+
+        return key.hexdigest()
+
+    def get(
+        self,
+        key: str,
+        flags: Iterable[str],
+        manifest: Optional[Manifest] = None,
+        stats: Optional[LoadStats] = None,
+    ) -> Any:
+        """Get the value stored with the given key.
+
+        Args:
+            key: The snapshot key.
+            flags: The flags currently defined.
+            manifest: If given and a value is returned, the dependencies of
+                      the value are recorded in it.
+            stats: If given and a value is returned, the counters of the
+                   load that stored the value are added to it.
+
+        Return:
+            The stored value, or UNDEFINED if there is no snapshot, if it's
+            unreadable or if any of its dependencies changed.
+
+        """
+        try:
+            with open(self._get_path(key), "rb") as snapshot_file:
+                stored_manifest, stored_stats, value = pickle.load(snapshot_file)
+        except Exception:  # pylint: disable=broad-except
+            # Missing, corrupted, or written by an incompatible version.
+            return UNDEFINED
+
+        if not isinstance(stored_manifest, Manifest) or not isinstance(
+            stored_stats, LoadStats
+        ):
+            return UNDEFINED
+
+        if stored_manifest.has_changed(flags):
+            return UNDEFINED
+
+        if manifest is not None:
+            manifest.update(stored_manifest)
+        if stats is not None:
+            stats.update(stored_stats)
+
+        return value
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        manifest: Manifest,
+        stats: Optional[LoadStats] = None,
+    ) -> bool:
+        """Store a value with the dependencies it was loaded from.
+
+        The counters of the load, if given, are stored too, to be replayed by
+        get.
+
+        The snapshot is written atomically, so concurrent readers never see
+        a partially written snapshot.
+
+        Return:
+            False if the value couldn't be pickled or written, True otherwise.
+
+        """
+        temporary_path: Optional[Path] = None
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile("wb", dir=self._directory, delete=False) as file:
+                temporary_path = Path(file.name)
+                stored_stats = stats if stats is not None else LoadStats()
+                pickle.dump((manifest, stored_stats, value), file)
+
+            replace(temporary_path, self._get_path(key))
+        except (OSError, pickle.PicklingError, AttributeError, TypeError):
+            # Values that can't be pickled are simply not cached.
+            if temporary_path is not None:
+                temporary_path.unlink(missing_ok=True)
+            return False
+
+        return True
+
+    def _get_path(self, key: str) -> Path:
+        return self._directory / f"{key}.snapshot"
+
+
+def get_source_key(source: Any, location: Optional[str]) -> str:
+    """Return a string identifying a YAML source, for snapshot keys."""
+    if location is not None:
+        return f"file:{location}"
+
+    return f"text:{sha256(str(source).encode('utf-8')).hexdigest()}"
@@ -0,0 +1,87 @@
+"""Cache of filesystem stat calls."""
+from gettext import gettext as _
+from os import stat, stat_result
+from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+
+class StatCache:
+    """Cache of stat calls, shared by path fields and path tag handlers.
+
+    Tag handlers and fields get it through get_config, so if none is given in
+    the config list, each load uses its own cache, and stats a path at most
+    once. A cache given in the config list is shared by all loads using that
+    config: set a time to live, so that filesystem changes are eventually
+    seen.
+
+    Members:
+        hits: Count of stat calls saved.
+        misses: Count of stat calls made.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            ttl: Duration in seconds after which a path is stat'ed again. If
+                 None, results are kept until the cache is cleared.
+
+        """
+        assert ttl is None or ttl >= 0, _("ttl must be positive.")
+        self._ttl = ttl
+        self._entries: Dict[str, Tuple[float, Optional[stat_result]]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __reduce__(self) -> Any:
+        """Pickle the cache as an empty cache with the same time to live."""
+        return (StatCache, (self._ttl,))
+
+    def stat(self, path: Path) -> Optional[stat_result]:
+        """Return the stat result of a path, or None if it doesn't exist."""
+        key = str(path)
+        ttl = self._ttl
+        now = monotonic() if ttl is not None else 0.0
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (ttl is None or now - entry[0] < ttl):
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+
+        result: Optional[stat_result]
+        try:
+            result = stat(key)
+        except (OSError, ValueError):
+            result = None
+
+        with self._lock:
+            self._entries[key] = (now, result)
+
+        return result
+
+    def exists(self, path: Path) -> bool:
+        """Check if a path exists."""
+        return self.stat(path) is not None
+
+    def is_file(self, path: Path) -> bool:
+        """Check if a path is a regular file, following symbolic links."""
+        result = self.stat(path)
+        return result is not None and S_ISREG(result.st_mode)
+
+    def is_dir(self, path: Path) -> bool:
+        """Check if a path is a directory, following symbolic links."""
+        result = self.stat(path)
+        return result is not None and S_ISDIR(result.st_mode)
+
+    def clear(self) -> None:
+        """Remove all cached results, and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,127 @@
+"""Tag handlers lookup."""
+from re import Match, Pattern
+from re import compile as re_compile
+from re import error as re_error
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from yaml import Node
+
+from marshpy.tag_handlers.tag_handler import TagHandler
+
+
+class TagDispatch(NamedTuple):
+    """Handlers matching a tag.
+
+    Members:
+        handler: The first matching handler, or None.
+        match: The match of the handler pattern on the tag, or None if the
+               handler overrides TagHandler.match.
+        other_handlers_count: Count of the other handlers matching the tag.
+    """
+
+    handler: Optional[TagHandler]
+    match: Optional["Match[str]"]
+    other_handlers_count: int
+
+
+_NO_DISPATCH = TagDispatch(None, None, 0)
+_BACKREFERENCE = re_compile(r"\\[1-9]")
+
+
+class TagDispatcher:
+    """Find handlers matching tags, caching the result per tag.
+
+    Handlers overriding TagHandler.match may match nodes on something else
+    than their tag, so they are tested again on each node. Other handlers are
+    matched once per distinct tag, tags matching no handler being rejected by a
+    single regex combining all handler patterns. The dispatcher is meant to
+    live as long as a loading session, the cache is never trimmed.
+    """
+
+    def __init__(self, tag_handlers: Iterable[TagHandler]):
+        """Initialize the dispatcher.
+
+        Args:
+            tag_handlers: The handlers to dispatch to, in priority order.
+
+        """
+        self._handlers = list(tag_handlers)
+        self._static_handlers: List[TagHandler] = []
+        self._dynamic_handlers: List[TagHandler] = []
+        for handler in self._handlers:
+            if type(handler).match is TagHandler.match:
+                self._static_handlers.append(handler)
+            else:
+                self._dynamic_handlers.append(handler)
+
+        self._combined_pattern = _combine_patterns(self._static_handlers)
+        self._dispatches: Dict[str, TagDispatch] = {}
+
+    def dispatch(self, node: Node) -> TagDispatch:
+        """Return the handlers matching the tag of the given node."""
+        tag = node.tag
+        if not tag.startswith("!"):
+            return _NO_DISPATCH
+
+        dispatch = self._dispatches.get(tag)
+        if dispatch is None:
+            dispatch = self._match_tag(tag[1:])
+            self._dispatches[tag] = dispatch
+
+        if len(self._dynamic_handlers) == 0:
+            return dispatch
+
+        return self._match_dynamic_handlers(node, dispatch)
+
+    def _match_tag(self, tag: str) -> TagDispatch:
+        combined_pattern = self._combined_pattern
+        if combined_pattern is not None and combined_pattern.match(tag) is None:
+            return _NO_DISPATCH
+
+        found_handler: Optional[TagHandler] = None
+        found_match = None
+        other_handlers_count = 0
+        for handler in self._static_handlers:
+            match = handler.match_tag(tag)
+            if match is None:
+                continue
+
+            if found_handler is not None:
+                other_handlers_count += 1
+                continue
+
+            found_handler = handler
+            found_match = match
+
+        return TagDispatch(found_handler, found_match, other_handlers_count)
+
+    def _match_dynamic_handlers(self, node: Node, dispatch: TagDispatch) -> TagDispatch:
+        matching_handlers = [it for it in self._dynamic_handlers if it.match(node)]
+        if len(matching_handlers) == 0:
+            return dispatch
+
+        other_handlers_count = dispatch.other_handlers_count + len(matching_handlers)
+        first_handler = matching_handlers[0]
+        static_handler = dispatch.handler
+        if static_handler is not None and self._handlers.index(
+            static_handler
+        ) < self._handlers.index(first_handler):
+            return TagDispatch(static_handler, dispatch.match, other_handlers_count)
+
+        if static_handler is None:
+            other_handlers_count -= 1
+
+        return TagDispatch(first_handler, None, other_handlers_count)
+
+
+def _combine_patterns(tag_handlers: Iterable[TagHandler]) -> Optional["Pattern[str]"]:
+    patterns = [it.tag_pattern for it in tag_handlers]
+    # Numbered backreferences would refer to other groups once combined.
+    if len(patterns) == 0 or any(_BACKREFERENCE.search(it) for it in patterns):
+        return None
+
+    try:
+        return re_compile("|".join(f"(?:{it})" for it in patterns))
+    except re_error:
+        # Patterns defining the same group names can't be combined.
+        return None
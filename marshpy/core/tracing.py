@@ -0,0 +1,137 @@
+"""Tracing of file loads, glob expansions and tag handler calls."""
+from contextlib import contextmanager
+from json import dump
+from os import getpid
+from pathlib import Path
+from threading import Lock, get_ident
+from time import perf_counter_ns
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+from yaml import MappingNode, Node, SequenceNode
+
+TraceArgs = Dict[str, Any]
+
+
+class Tracer:
+    """Hook called when traced operations of a load begin and end.
+
+    Get it with context.get_config(Tracer). This base implementation does
+    nothing, and is used when no tracer is given in the config list. Callers
+    check enabled before computing costly event arguments, like node counts.
+    """
+
+    enabled = False
+
+    def begin(self, name: str, category: str, args: TraceArgs) -> None:
+        """Called when a traced operation begins.
+
+        Args:
+            name: Name of the operation, a path for file loads.
+            category: Kind of the operation, like "file" or "glob".
+            args: Details of the operation.
+
+        """
+
+    def end(self, name: str, category: str, args: TraceArgs) -> None:
+        """Called when a traced operation ends, see begin for arguments."""
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[TraceArgs]:
+        """Trace the operation executed in the with block.
+
+        Arguments given as keywords are passed to begin. The yielded
+        dictionary is passed to end, so details only known at the end of the
+        operation can be added to it.
+        """
+        self.begin(name, category, args)
+        end_args: TraceArgs = {}
+        try:
+            yield end_args
+        finally:
+            self.end(name, category, end_args)
+
+
+class ChromeTracer(Tracer):
+    """Tracer recording events in the Chrome trace event format.
+
+    Give it in the config list of loads, then write the recorded events with
+    write, and open the written file in Perfetto or chrome://tracing. A tracer
+    can be shared by concurrent loads, events being recorded per thread.
+    Operations executed in worker processes aren't traced.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        self._events: List[Dict[str, Any]] = []
+        self._lock = Lock()
+        self._pid = getpid()
+
+    def __reduce__(self) -> Any:
+        """Pickle the tracer as an empty tracer."""
+        return (ChromeTracer, ())
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Return the recorded events, in Chrome trace event format."""
+        with self._lock:
+            return list(self._events)
+
+    def begin(self, name: str, category: str, args: TraceArgs) -> None:
+        self._add_event(name, category, "B", args)
+
+    def end(self, name: str, category: str, args: TraceArgs) -> None:
+        self._add_event(name, category, "E", args)
+
+    def write(self, path: Union[str, Path]) -> None:
+        """Write the recorded events in a JSON trace file."""
+        with open(path, "w", encoding="utf-8") as trace_file:
+            dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, trace_file)
+
+    def clear(self) -> None:
+        """Remove all recorded events."""
+        with self._lock:
+            self._events.clear()
+
+    def _add_event(self, name: str, category: str, phase: str, args: TraceArgs) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": phase,
+            "ts": perf_counter_ns() / 1000,
+            "pid": self._pid,
+            "tid": get_ident(),
+            "args": {key: _to_json(value) for key, value in args.items()},
+        }
+        with self._lock:
+            self._events.append(event)
+
+
+def count_nodes(node: Optional[Node]) -> int:
+    """Return the count of distinct nodes in a node tree."""
+    if node is None:
+        return 0
+
+    visited: Set[int] = set()
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        if id(current) in visited:
+            continue
+
+        visited.add(id(current))
+        if isinstance(current, SequenceNode):
+            pending.extend(current.value)
+        elif isinstance(current, MappingNode):
+            for key, value in current.value:
+                pending.append(key)
+                pending.append(value)
+
+    return len(visited)
+
+
+def _to_json(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
@@ -5,14 +5,37 @@ from typing import Any, Optional
 
 from marshpy.core.constants import UNDEFINED
 from marshpy.core.interfaces import IBaseField, ILoadingContext
+from marshpy.core.lazy import LazyValue
 from marshpy.core.validation import ValidateCallback, ValidationContext
 
 
 class BaseField(IBaseField):
     """Base class for all MarshPy fields."""
 
+    class Config:
+        """Shared configuration for all fields."""
+
+        def __init__(self, eager: bool = False):
+            """Initialize the config.
+
+            Args:
+                eager: If True, lazy fields are loaded immediately, so that
+                       all errors are reported during the load, for example
+                       to validate whole documents.
+
+            """
+            self._eager = eager
+
+        @property
+        def eager(self) -> bool:
+            """Return True if lazy fields are loaded immediately."""
+            return self._eager
+
     def __init__(
-        self, required: bool = False, validate: Optional[ValidateCallback] = None
+        self,
+        required: bool = False,
+        validate: Optional[ValidateCallback] = None,
+        lazy: bool = False,
     ) -> None:
         """Initialize the field.
 
@@ -27,12 +50,16 @@ class BaseField(IBaseField):
                       explicative message, which will raise a ValidationError
                       error, or call the custom error_handler with
                       ErrorCode.VALIDATION_ERROR code.
+            lazy: If True, the field value is a LazyValue keeping the node,
+                  loaded and validated the first time it's accessed. See
+                  marshpy.core.lazy.
 
         """
         if validate is not None:
             assert callable(validate), _("validate must be a callable object.")
         self._required = required
         self._validate = validate
+        self._lazy = lazy
 
     def load(self, context: ILoadingContext) -> Any:
         """Load this field.
@@ -45,8 +72,24 @@ class BaseField(IBaseField):
             Deserialized field value, or UNDEFINED if the loading failed.
 
         """
-        field_value = self._load(context)
+        if self._lazy and not context.get_config(BaseField.Config).eager:
+            node = context.current_node()
+            return LazyValue(context, self._load_now, node, context.current_location())
+
+        return self._load_now(context)
+
+    def validate_value(self, context: ILoadingContext, field_value: Any) -> Any:
+        """Run the validate callback of this field on a loaded value.
 
+        Args:
+            context: instance of LoadingContext, managing the current
+                     deserialization state.
+            field_value: The deserialized value.
+
+        Return:
+            The value if it's valid, or UNDEFINED if validation failed.
+
+        """
         validate = self._validate
         if validate is not None:
             validation_context = ValidationContext(context)
@@ -60,6 +103,15 @@ class BaseField(IBaseField):
     def required(self) -> bool:
         return self._required
 
+    @property
+    def lazy(self) -> bool:
+        """Return True if the field is loaded on first access."""
+        return self._lazy
+
+    def _load_now(self, context: ILoadingContext) -> Any:
+        field_value = self._load(context)
+        return self.validate_value(context, field_value)
+
     @abstractmethod
     def _load(self, context: ILoadingContext) -> Any:
         raise NotImplementedError
@@ -16,6 +16,9 @@ class ContainerField(BaseField):
         item_field: BaseField,
         required: bool = False,
         validate: Optional[ValidateCallback] = None,
+        lazy: bool = False,
+        view: bool = False,
+        cache_items: bool = True,
     ):
         """Initialize the container field.
 
@@ -23,13 +26,33 @@ class ContainerField(BaseField):
             item_field: Field used to load nested items.
             required: See BaseField constructor.
             validate: See BaseField constructor.
+            lazy: See BaseField constructor.
+            view: If True, the loaded value is a read-only view loading items
+                  when they are read, unless BaseField.Config.eager is set :
+                  a LazySequence for lists, a LazyMapping for dictionaries.
+                  Items failing to load are then read as UNDEFINED instead of
+                  being skipped.
+            cache_items: If True, items loaded by views are kept, and returned
+                         by later reads.
 
         """
-        super().__init__(required=required, validate=validate)
+        super().__init__(required=required, validate=validate, lazy=lazy)
         assert isinstance(item_field, BaseField), _(
             "item_field must be an implementation of BaseField."
         )
         self._item_field = item_field
+        self._view = view
+        self._cache_items = cache_items
+
+    @property
+    def item_field(self) -> BaseField:
+        """Return the field used to load nested items."""
+        return self._item_field
+
+    @property
+    def view(self) -> bool:
+        """Return True if items are loaded when they are read."""
+        return self._view
 
     @abstractmethod
     def _load(self, context: ILoadingContext) -> Any:
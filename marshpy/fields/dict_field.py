@@ -1,11 +1,11 @@
 """Dictionary field class & utilities."""
-from typing import Any, Optional
+from typing import Any
 
 from yaml import ScalarNode
 
 from marshpy.core.constants import UNDEFINED
 from marshpy.core.interfaces import ILoadingContext
-from marshpy.core.validation import ValidateCallback
+from marshpy.core.lazy import LazyMapping
 from marshpy.fields.base_field import BaseField
 from marshpy.fields.container_field import ContainerField
 
@@ -13,27 +13,17 @@ from marshpy.fields.container_field import ContainerField
 class DictField(ContainerField):
     """Dictionary YAML object field."""
 
-    def __init__(
-        self,
-        item_field: BaseField,
-        required: bool = False,
-        validate: Optional[ValidateCallback] = None,
-    ):
-        """Initialize dict field.
-
-        Args:
-            item_field: Field used to load dictionnary values.
-            required: See BaseField constructor.
-            validate: See BaseField constructor.
-
-        """
-        super().__init__(item_field=item_field, required=required, validate=validate)
-
     def _load(self, context: ILoadingContext) -> Any:
         node = context.current_node()
         if not context.expect_mapping():
             return UNDEFINED
 
+        if self._view and not context.get_config(BaseField.Config).eager:
+            location = context.current_location()
+            return LazyMapping(
+                context, self._item_field, node.value, location, self._cache_items
+            )
+
         result = {}
         for key_node, value_node in node.value:
             assert isinstance(key_node, ScalarNode)
@@ -1,11 +1,16 @@
 """Object field class & utilities."""
 from gettext import gettext as _
 from inspect import isclass
+from threading import Lock
 from typing import Any, Callable, Dict, Optional, Set, Type, cast
 
+from yaml import Node
+
+from marshpy.core.compiler import CompiledLoader, get_compiled_loader
 from marshpy.core.constants import UNDEFINED
 from marshpy.core.errors import ErrorCode
 from marshpy.core.interfaces import IBaseField, ILoadingContext
+from marshpy.core.load_stats import LoadStats
 from marshpy.core.validation import ValidateCallback, ValidationContext
 from marshpy.fields.base_field import BaseField
 from marshpy.fields.string_field import StringField
@@ -14,6 +19,8 @@ FieldsResolver = Callable[[Any], Dict[str, IBaseField]]
 HookResolver = Callable[[Any, str], Optional[Callable[..., None]]]
 ObjectFactory = Callable[[str, ILoadingContext], Any]
 
+_KEY_FIELD = StringField()
+
 _TYPE_FORMAT_MSG = _(
     """\
 Type tag should be in the form !type:path.to.Type, got {}"""
@@ -31,8 +38,28 @@ class ObjectField(BaseField):
             object_factory: Optional[ObjectFactory] = None,
             fields_resolver: Optional[FieldsResolver] = None,
             hook_resolver: Optional[HookResolver] = None,
+            cache_schemas: Optional[bool] = None,
+            compile_loaders: bool = False,
         ):
-            """Initialize the config class."""
+            """Initialize the config class.
+
+            Args:
+                object_factory: Creates objects for !type tags.
+                fields_resolver: Returns the fields of an object.
+                hook_resolver: Returns a hook of an object, or None.
+                cache_schemas: If True, fields and hooks presence are resolved
+                               once per class and reused for all objects of
+                               that class. Set it to False if the resolvers
+                               give different results for objects of the
+                               same class. If None, schemas are cached only
+                               when the default fields and hook resolvers
+                               are used.
+                compile_loaders: If True, objects are loaded by functions
+                                 generated for each class schema, which are
+                                 faster than the generic loading path. See
+                                 marshpy.core.compiler.
+
+            """
             self._object_factory = (
                 object_factory
                 if object_factory is not None
@@ -48,6 +75,31 @@ class ObjectField(BaseField):
                 if hook_resolver is not None
                 else self._default_hook_resolver
             )
+            self._cache_schemas = (
+                cache_schemas
+                if cache_schemas is not None
+                else fields_resolver is None and hook_resolver is None
+            )
+            self._compile_loaders = compile_loaders
+            self._schemas: Dict[Type[Any], ObjectSchema] = {}
+            self._lock = Lock()
+
+        def __getstate__(self) -> Dict[str, Any]:
+            """Pickle the config without cached schemas."""
+            state = dict(self.__dict__)
+            state["_schemas"] = {}
+            del state["_lock"]
+            return state
+
+        def __setstate__(self, state: Dict[str, Any]) -> None:
+            """Unpickle the config, with a new lock."""
+            self.__dict__.update(state)
+            self._lock = Lock()
+
+        @property
+        def compile_loaders(self) -> bool:
+            """Return True if objects are loaded through compiled loaders."""
+            return self._compile_loaders
 
         def create(self, type_name: str, context: ILoadingContext) -> Optional[Any]:
             """Get hook of given name for given object."""
@@ -61,6 +113,52 @@ class ObjectField(BaseField):
             """Get hook of given name for given object."""
             return self._hook_resolver(obj, hook_name)
 
+        def get_schema(self, obj: Any) -> "ObjectSchema":
+            """Get the resolved fields and hooks presence for the given object.
+
+            Schemas are cached per class, unless schemas caching is disabled.
+            """
+            cls = obj.__class__
+            with self._lock:
+                schema = self._schemas.get(cls)
+            if schema is not None:
+                return schema
+
+            schema = ObjectSchema(
+                self.get_fields(obj),
+                has_validate=self.get_hook(obj, "validate") is not None,
+                has_post_load=self.get_hook(obj, "post_load") is not None,
+            )
+
+            if self._compile_loaders:
+                schema.loader = get_compiled_loader(cls, schema)
+
+            if self._cache_schemas:
+                with self._lock:
+                    self._schemas[cls] = schema
+
+            return schema
+
+        def invalidate(self, cls: Optional[Type[Any]] = None) -> None:
+            """Drop cached schemas.
+
+            Must be called when the fields or hooks of a class change after
+            objects of that class were loaded with this config.
+
+            Args:
+                cls: The class to invalidate, with its subclasses, which
+                     inherit its fields and hooks. If None, drop all schemas.
+
+            """
+            with self._lock:
+                if cls is None:
+                    self._schemas.clear()
+                    return
+
+                for cached_cls in list(self._schemas):
+                    if issubclass(cached_cls, cls):
+                        del self._schemas[cached_cls]
+
         @staticmethod
         def _default_object_factory(
             type_name: str, context: ILoadingContext
@@ -125,19 +223,26 @@ class ObjectField(BaseField):
         object_class: Type[Any] = object,
         required: bool = False,
         validate: Optional[ValidateCallback] = None,
+        lazy: bool = False,
     ):
         """Initialize object field.
 
         Arg:
             required: See BaseField constructor.
             validate: See BaseField constructor.
+            lazy: See BaseField constructor.
             object_class: The class of the object to create.
 
         """
-        super().__init__(required=required, validate=validate)
+        super().__init__(required=required, validate=validate, lazy=lazy)
         assert isclass(object_class), _("object_class must be a type")
         self._object_class = object_class
 
+    @property
+    def object_class(self) -> Type[Any]:
+        """Return the default class of the loaded objects."""
+        return self._object_class
+
     def _load(self, context: ILoadingContext) -> Any:
         if not context.expect_mapping():
             return UNDEFINED
@@ -158,43 +263,139 @@ class ObjectField(BaseField):
         if obj is None:
             return UNDEFINED
 
+        context.get_config(LoadStats).objects += 1
+        context.object_created(obj)
         return _load(obj, context, config)
 
 
 def _load(obj: Any, context: ILoadingContext, config: ObjectField.Config) -> Any:
-    fields = config.get_fields(obj)
-
     node = context.current_node()
-    set_fields = set()
+    if config.compile_loaders:
+        loader = config.get_schema(obj).loader
+        assert loader is not None
+        return loader(obj, context, config, node)
+
+    builder = ObjectBuilder(obj, context, config)
 
     for name_node, value_node in node.value:
-        field_name = context.load(StringField(), name_node)
-        if field_name is UNDEFINED:
+        field_name = builder.get_field_name(name_node)
+        if field_name is None:
             continue
 
+        field = builder.get_field(field_name)
+        if field is None:
+            continue
+
+        builder.set_field(field_name, context.load(field, value_node))
+
+    return builder.build()
+
+
+class ObjectSchema:
+    """Loading metadata of a class, resolved through ObjectField.Config."""
+
+    def __init__(
+        self,
+        fields: Dict[str, IBaseField],
+        has_validate: bool,
+        has_post_load: bool,
+    ) -> None:
+        """Initialize the schema.
+
+        Args:
+            fields: The fields of the class, by name.
+            has_validate: True if objects of the class have a validate hook.
+            has_post_load: True if objects of the class have a post_load hook.
+
+        """
+        self.fields = fields
+        self.required_fields = [
+            name for name, field in fields.items() if field.required
+        ]
+        self.has_validate = has_validate
+        self.has_post_load = has_post_load
+        self.loader: Optional[CompiledLoader] = None
+
+
+class ObjectBuilder:
+    """Set fields of an object being loaded, then validate it.
+
+    Must be used while the mapping node of the object is the current node of
+    the loading context.
+    """
+
+    def __init__(
+        self, obj: Any, context: ILoadingContext, config: ObjectField.Config
+    ) -> None:
+        """Initialize the builder.
+
+        Args:
+            obj: The object to load.
+            context: The loading context.
+            config: The object field configuration.
+
+        """
+        self._obj = obj
+        self._context = context
+        self._config = config
+        self._schema = config.get_schema(obj)
+        self._fields = self._schema.fields
+        self._set_fields: Set[str] = set()
+
+    def get_field_name(self, name_node: Node) -> Optional[str]:
+        """Load a field name from a mapping key node.
+
+        Return:
+            The field name, or None if the key node couldn't be loaded.
+
+        """
+        field_name = self._context.load(_KEY_FIELD, name_node)
+        if field_name is UNDEFINED:
+            return None
+
         field_name = name_node.value
-        set_fields.add(field_name)
-        if field_name not in fields:
-            context.error(
+        self._set_fields.add(field_name)
+        return cast(str, field_name)
+
+    def get_field(self, field_name: str) -> Optional[IBaseField]:
+        """Return the field with the given name.
+
+        Emit an error and return None if no such field is declared.
+        """
+        field = self._fields.get(field_name)
+        if field is None:
+            self._context.error(
                 ErrorCode.FIELD_NOT_DECLARED, _("Field {} is not declared."), field_name
             )
-            continue
 
-        field = fields[field_name]
-        field_value = context.load(field, value_node)
+        return field
+
+    def set_field(self, field_name: str, field_value: Any) -> None:
+        """Set a loaded field value on the object, unless loading failed."""
         if field_value is UNDEFINED:
-            continue
+            return
+
+        setattr(self._obj, field_name, field_value)
 
-        setattr(obj, field_name, field_value)
+    def build(self) -> Any:
+        """Validate the object and call post load hook.
 
-    if _validate(obj, fields, set_fields, context, config):
-        post_load = config.get_hook(obj, "post_load")
-        if post_load is not None:
-            post_load()
+        Return:
+            The loaded object, or UNDEFINED if validation failed.
 
-        return obj
+        """
+        obj = self._obj
+        schema = self._schema
+        config = self._config
+        if _validate(obj, schema, self._set_fields, self._context, config):
+            if schema.has_post_load:
+                post_load = config.get_hook(obj, "post_load")
+                if post_load is not None:
+                    post_load()
+
+            return obj
 
-    return UNDEFINED
+        return UNDEFINED
 
 
 def _get_class_fields(cls: Type[Any]) -> Dict[str, IBaseField]:
@@ -213,19 +414,22 @@ def _get_class_fields(cls: Type[Any]) -> Dict[str, IBaseField]:
 
 def _validate(
     obj: Any,
-    fields: Dict[str, IBaseField],
+    schema: ObjectSchema,
     set_fields: Set[str],
     context: ILoadingContext,
     config: ObjectField.Config,
 ) -> bool:
     valid_object = True
-    for name, field in fields.items():
-        if field.required and name not in set_fields:
+    for name in schema.required_fields:
+        if name not in set_fields:
             valid_object = False
             context.error(
                 ErrorCode.MISSING_REQUIRED_FIELD, _("Missing required field {}"), name
             )
 
+    if not schema.has_validate:
+        return valid_object
+
     hook = config.get_hook(obj, "validate")
 
     if hook is not None:
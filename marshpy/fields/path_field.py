@@ -6,6 +6,7 @@ from typing import Any, Optional
 from marshpy.core.constants import UNDEFINED
 from marshpy.core.errors import ErrorCode
 from marshpy.core.interfaces import ILoadingContext
+from marshpy.core.stat_cache import StatCache
 from marshpy.core.validation import ValidateCallback
 from marshpy.fields.scalar_field import ScalarField
 
@@ -33,15 +34,16 @@ class PathField(ScalarField):
 
     def _convert(self, context: ILoadingContext, value: str) -> Any:
         path = Path(value)
+        stat_cache = context.get_config(StatCache)
 
-        if not path.is_absolute() and not path.exists():
+        if not path.is_absolute() and not stat_cache.exists(path):
             location_str = context.current_location()
             if location_str is not None:
                 location = Path(location_str)
                 parent = location.parent
                 path = parent / path
 
-        if self._must_exist and not path.exists():
+        if self._must_exist and not stat_cache.exists(path):
             context.error(ErrorCode.VALIDATION_ERROR, _("Cannot find path {}."), path)
             return UNDEFINED
 
@@ -6,6 +6,7 @@ from typing import Any, Optional, Union
 from marshpy.core.constants import UNDEFINED
 from marshpy.core.errors import ErrorCode
 from marshpy.core.interfaces import ILoadingContext
+from marshpy.core.load_stats import LoadStats
 from marshpy.fields.base_field import BaseField
 
 
@@ -18,6 +19,7 @@ class ScalarField(BaseField):
 
         current_node = context.current_node()
         string_value = current_node.value
+        context.get_config(LoadStats).scalars += 1
         return self._convert(context, string_value)
 
     @abstractmethod
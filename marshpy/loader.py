@@ -1,16 +1,52 @@
 """MarshPy deserializing function."""
+from asyncio import CancelledError, Semaphore, get_running_loop
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from gettext import gettext as _
 from inspect import isclass
 from io import TextIOBase
-from typing import IO, Any, Iterable, List, Optional, Type, TypeVar, Union, cast
+from os import stat_result
+from pathlib import Path
+from time import perf_counter
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from uuid import uuid4
 
-from yaml import compose
+from yaml import Node
+from yaml.error import MarkedYAMLError
 
-from marshpy.core.constants import UNDEFINED, LoadResult
-from marshpy.core.errors import ErrorHandler
+from marshpy.core.compiler import get_compiled_loader
+from marshpy.core.constants import UNDEFINED, Engine, LoadResult
+from marshpy.core.document_cache import DEFAULT_MAX_BYTES, Composer, DocumentCache
+from marshpy.core.errors import (
+    ErrorCode,
+    ErrorHandler,
+    get_exception_type,
+)
+from marshpy.core.event_loading_context import EventLoadingContext
+from marshpy.core.load_stats import LoadStats
 from marshpy.core.loading_context import LoadingContext
+from marshpy.core.manifest import Dependency, Manifest
+from marshpy.core.memory import MemoryTracker
+from marshpy.core.snapshot_cache import SnapshotCache, get_source_key
 from marshpy.fields.base_field import BaseField
 from marshpy.fields.bool_field import BoolField
+from marshpy.fields.container_field import ContainerField
 from marshpy.fields.dict_field import DictField
 from marshpy.fields.float_field import FloatField
 from marshpy.fields.int_field import IntField
@@ -21,6 +57,7 @@ from marshpy.tag_handlers.env_handler import EnvHandler
 from marshpy.tag_handlers.glob_handler import GlobHandler
 from marshpy.tag_handlers.if_handler import IfHandler
 from marshpy.tag_handlers.import_handler import ImportHandler
+from marshpy.tag_handlers.path_handler import PathHandler, compose_file
 from marshpy.tag_handlers.tag_handler import TagHandler
 
 _ROOT_FIELDS_MAPPING = {
@@ -32,16 +69,24 @@ _ROOT_FIELDS_MAPPING = {
     str: StringField(),
 }
 
+_CONTEXT_TYPES = {
+    Engine.TREE: LoadingContext,
+    Engine.EVENTS: EventLoadingContext,
+}
+
 ObjectType = TypeVar("ObjectType")
+ConfigType = TypeVar("ConfigType")
 
 
-def load(  # pylint: disable=too-many-locals
+def load(
     source: Union[str, IO[str]],
     object_class: Optional[Type[ObjectType]] = None,
     tag_handlers: Optional[Iterable[TagHandler]] = None,
     error_handler: Optional[ErrorHandler] = None,
     root_field: Optional[BaseField] = None,
     config: Optional[List[Any]] = None,
+    engine: Engine = Engine.TREE,
+    snapshot_cache: Optional[SnapshotCache] = None,
 ) -> LoadResult[ObjectType]:
     """Deserialize a YAML file, stream or string into an object.
 
@@ -61,13 +106,586 @@ def load(  # pylint: disable=too-many-locals
         config:             List of objects used to eventually configure custom
                             fields, that will be retrievable through the
                             get_config method.
+        engine:             The loading engine to use. Engine.EVENTS avoids
+                            building the node tree of the whole document,
+                            lowering memory usage on big documents.
+        snapshot_cache:     If set, the loaded value is pickled in this cache,
+                            and returned by later loads as long as the files,
+                            globs and environment variables it depends on
+                            don't change. Values loaded with errors aren't
+                            cached. When a value is returned from the cache,
+                            the Manifest and LoadStats given in config get
+                            the dependencies and counters of the load that
+                            stored it, and a MemoryTracker measures the
+                            reading of the snapshot.
 
     """
-    # This fails with pyfakefs, no simple way to check this, so disable it for
-    # now
-    # assert isinstance(source, (str, TextIOBase)), \
-    #     _('source parameter must be a string or Text I/O.')
+    if snapshot_cache is not None:
+        return _load_snapshot(
+            snapshot_cache,
+            source,
+            object_class,
+            tag_handlers=tag_handlers,
+            error_handler=error_handler,
+            root_field=root_field,
+            config=config,
+            engine=engine,
+        )
+
+    context = _get_context(tag_handlers, error_handler, config, engine)
+    root_field = _get_root_field(object_class, root_field)
+
+    memory_tracker = _get_first(config or [], MemoryTracker)
+    with memory_tracker.track() if memory_tracker is not None else nullcontext():
+        result = context.load_document(root_field, source, _get_location(source))
+
+    if result is UNDEFINED:
+        return UNDEFINED
+
+    return cast(ObjectType, result)
+
+
+def _load_snapshot(
+    snapshot_cache: SnapshotCache,
+    source: Union[str, IO[str]],
+    object_class: Optional[Type[ObjectType]],
+    tag_handlers: Optional[Iterable[TagHandler]],
+    error_handler: Optional[ErrorHandler],
+    root_field: Optional[BaseField],
+    config: Optional[List[Any]],
+    engine: Engine,
+) -> LoadResult[ObjectType]:
+    location = _get_location(source)
+    if location is None and not isinstance(source, str):
+        source = source.read()
+
+    tag_handlers = list(tag_handlers) if tag_handlers is not None else []
+    config = list(config) if config is not None else []
+    flags = _get_flags(config)
+    key = _get_snapshot_key(
+        snapshot_cache,
+        get_source_key(source, location),
+        _get_root_field(object_class, root_field),
+        tag_handlers,
+        config,
+        flags,
+        engine,
+    )
+
+    result = _get_snapshot(snapshot_cache, key, flags, config)
+    if result is not UNDEFINED:
+        return cast(ObjectType, result)
+
+    # The dependencies and counters of the load are recorded apart, so that
+    # configured ones summing several loads aren't stored in the snapshot.
+    manifest = Manifest()
+    stats = LoadStats()
+    try:
+        result, has_errors = _load_checked(
+            source,
+            object_class,
+            error_handler,
+            root_field,
+            # Snapshots are pickled, which loads lazy values anyway.
+            [BaseField.Config(eager=True), manifest, stats, *config],
+            engine,
+            tag_handlers=tag_handlers,
+        )
+    finally:
+        _add_load_records(config, manifest, stats)
+
+    if result is not UNDEFINED and not has_errors:
+        snapshot_cache.put(key, result, manifest, stats)
+
+    return result
+
+
+def _get_snapshot(
+    snapshot_cache: SnapshotCache, key: str, flags: Set[str], config: List[Any]
+) -> Any:
+    manifest = _get_first(config, Manifest)
+    stats = _get_first(config, LoadStats)
+    memory_tracker = _get_first(config, MemoryTracker)
+    with memory_tracker.track() if memory_tracker is not None else nullcontext():
+        result = snapshot_cache.get(key, flags, manifest, stats)
+
+    if stats is not None:
+        stats.add_cache_access("snapshot", result is not UNDEFINED)
+
+    return result
+
+
+def _add_load_records(config: List[Any], manifest: Manifest, stats: LoadStats) -> None:
+    """Add the dependencies and counters of a load to the configured ones."""
+    configured_manifest = _get_first(config, Manifest)
+    if configured_manifest is not None:
+        configured_manifest.update(manifest)
+
+    configured_stats = _get_first(config, LoadStats)
+    if configured_stats is not None:
+        configured_stats.update(stats)
+
+
+def _get_snapshot_key(
+    snapshot_cache: SnapshotCache,
+    source_key: str,
+    root_field: BaseField,
+    tag_handlers: List[TagHandler],
+    config: List[Any],
+    flags: Set[str],
+    engine: Engine,
+) -> str:
+    path_config = _get_first(config, PathHandler.Config)
+    return snapshot_cache.get_key(
+        source_key,
+        _get_field_name(root_field),
+        engine.name,
+        sorted(flags),
+        [f"{type(it).__module__}.{type(it).__qualname__}" for it in tag_handlers],
+        [str(it) for it in path_config.roots] if path_config is not None else [],
+    )
+
+
+def _get_flags(config: List[Any]) -> Set[str]:
+    if_config = _get_first(config, IfHandler.Config)
+    return if_config.flags if if_config is not None else set()
+
+
+def _get_first(
+    config: List[Any], config_type: Type[ConfigType]
+) -> Optional[ConfigType]:
+    """Return the first item of a config list of the given type, as get_config."""
+    return next((it for it in config if isinstance(it, config_type)), None)
+
+
+def _load_checked(
+    source: Union[str, IO[str]],
+    object_class: Optional[Type[ObjectType]],
+    error_handler: Optional[ErrorHandler],
+    root_field: Optional[BaseField],
+    config: List[Any],
+    engine: Engine,
+    **kwargs: Any,
+) -> Tuple[LoadResult[ObjectType], bool]:
+    """Load a value, also returning True if any error was emitted."""
+    errors: List[ErrorCode] = []
+
+    def _error_handler(node: Node, code: ErrorCode, message: str) -> None:
+        errors.append(code)
+        assert error_handler is not None
+        error_handler(node, code, message)
+
+    result = load(
+        source,
+        object_class,
+        error_handler=_error_handler if error_handler is not None else None,
+        root_field=root_field,
+        config=config,
+        engine=engine,
+        **kwargs,
+    )
+    return result, len(errors) != 0
+
+
+async def aload(
+    source: Union[str, IO[str]],
+    object_class: Optional[Type[ObjectType]] = None,
+    tag_handlers: Optional[Iterable[TagHandler]] = None,
+    error_handler: Optional[ErrorHandler] = None,
+    root_field: Optional[BaseField] = None,
+    config: Optional[List[Any]] = None,
+    engine: Engine = Engine.TREE,
+    executor: Optional[Executor] = None,
+    semaphore: Optional[Semaphore] = None,
+    snapshot_cache: Optional[SnapshotCache] = None,
+) -> LoadResult[ObjectType]:
+    """Deserialize a YAML document without blocking the event loop.
+
+    The whole loading, including file reads and composition of documents
+    loaded by import and glob tags, runs in a worker thread, so results and
+    errors are the same as with load. The error handler is called from the
+    worker thread.
+
+    The config list can be shared by concurrent calls, the caches of configs
+    being thread-safe. Each call records in its own Manifest and LoadStats,
+    added to the ones given in config on the event loop once it returns. The
+    records of a cancelled call are dropped, as the worker thread may still be
+    loading. A MemoryTracker shared by concurrent calls measures them
+    together.
+
+    Args:
+        executor:   Executor to load with, defaults to the default executor of
+                    the running loop. Its worker count bounds the count of
+                    loadings running at once.
+        semaphore:  If set, acquired while loading, to further bound the count
+                    of loadings in flight.
+        Other arguments: See load.
+
+    """
+    loop = get_running_loop()
+    config = list(config) if config is not None else []
+    manifest = Manifest()
+    stats = LoadStats()
+    load_function = partial(
+        load,
+        source,
+        object_class,
+        tag_handlers=tag_handlers,
+        error_handler=error_handler,
+        root_field=root_field,
+        config=[manifest, stats, *config],
+        engine=engine,
+        snapshot_cache=snapshot_cache,
+    )
+
+    cancelled = False
+    try:
+        if semaphore is None:
+            return await loop.run_in_executor(executor, load_function)
+
+        async with semaphore:
+            return await loop.run_in_executor(executor, load_function)
+    except CancelledError:
+        cancelled = True
+        raise
+    finally:
+        # Cancelling doesn't stop the worker thread, that may still be writing
+        # to the records of the call.
+        if not cancelled:
+            _add_load_records(config, manifest, stats)
+
+
+def load_all(
+    source: Union[str, IO[str]],
+    object_class: Optional[Type[ObjectType]] = None,
+    tag_handlers: Optional[Iterable[TagHandler]] = None,
+    error_handler: Optional[ErrorHandler] = None,
+    root_field: Optional[BaseField] = None,
+    config: Optional[List[Any]] = None,
+    engine: Engine = Engine.TREE,
+) -> Iterator[LoadResult[ObjectType]]:
+    """Deserialize each document of a multi-document YAML stream.
+
+    Documents are composed and loaded one at a time, the node tree of a
+    document being released before the next one is composed, so memory usage
+    is bounded by the biggest document of the stream.
+
+    Args:
+        See load. Each yielded item is the result of the loading of one
+        document, or UNDEFINED if it failed.
+
+    """
+    context = _get_context(tag_handlers, error_handler, config, engine)
+    root_field = _get_root_field(object_class, root_field)
+    location = _get_location(source)
+
+    for result in context.load_documents(root_field, source, location):
+        if result is UNDEFINED:
+            yield UNDEFINED
+        else:
+            yield cast(ObjectType, result)
+
+
+class LoadManyResult(NamedTuple):
+    """Result of the loading of one source by load_many.
+
+    Members:
+        value: The loaded value, or UNDEFINED if loading failed.
+        errors: Errors emitted while loading the source. A YAML syntax error,
+                or an OSError if a file can't be read, stops the loading of
+                the source, and is the last error of the list.
+        manifest: Dependencies of the loaded value.
+        stats: Counters of the work done to load the source.
+    """
+
+    value: Any
+    errors: List[Exception]
+    manifest: Manifest
+    stats: LoadStats
+
+
+def load_many(
+    sources: Iterable[Union[str, Path]],
+    object_class: Optional[Type[Any]] = None,
+    tag_handlers: Optional[Iterable[TagHandler]] = None,
+    root_field: Optional[BaseField] = None,
+    config: Optional[List[Any]] = None,
+    engine: Engine = Engine.TREE,
+    executor: Optional[Executor] = None,
+    chunksize: int = 16,
+) -> List[LoadManyResult]:
+    """Load independent YAML sources concurrently.
+
+    Errors are collected for each source instead of being raised, including
+    YAML syntax errors and files that can't be read. Other exceptions are
+    raised.
+
+    Args:
+        sources:    YAML strings, or paths of YAML files.
+        executor:   Executor to load sources with. Arguments are sent to
+                    workers, and loaded values and errors sent back, so they
+                    must be picklable. Each worker reuses the configs it
+                    received for the whole call, and process-wide caches are
+                    kept between tasks and calls, so reusing a pool across
+                    calls keeps them warm. If None, a ProcessPoolExecutor is
+                    created for the call.
+        chunksize:  Count of sources sent to a process worker at once.
+        Other arguments: See load.
+
+    Return:
+        A LoadManyResult for each source, in the order of sources.
+
+    """
+    batch = _Batch(uuid4().hex, object_class, tag_handlers, root_field, config, engine)
+    sources = list(sources)
+    if executor is not None:
+        return list(executor.map(batch.load, sources, chunksize=chunksize))
+
+    with ProcessPoolExecutor() as process_executor:
+        return list(process_executor.map(batch.load, sources, chunksize=chunksize))
+
+
+class _Batch(NamedTuple):
+    token: str
+    object_class: Optional[Type[Any]]
+    tag_handlers: Optional[Iterable[TagHandler]]
+    root_field: Optional[BaseField]
+    config: Optional[List[Any]]
+    engine: Engine
+
+    def load(self, source: Union[str, Path]) -> LoadManyResult:
+        """Load a source of the batch, collecting its errors."""
+        # Arguments are unpickled for each task, the first copy received by a
+        # worker is kept so that caches of configs stay warm.
+        batch = _WORKER_BATCHES.setdefault(self.token, self)
+        while len(_WORKER_BATCHES) > _MAX_WORKER_BATCHES:
+            del _WORKER_BATCHES[next(iter(_WORKER_BATCHES))]
+
+        errors: List[Exception] = []
+        manifest = Manifest()
+        stats = LoadStats()
+
+        def _error_handler(node: Node, code: ErrorCode, message: str) -> None:
+            errors.append(get_exception_type(code)(node, message))
+
+        value = UNDEFINED
+        try:
+            if isinstance(source, Path):
+                with open(source, "r", encoding="utf-8") as yaml_file:
+                    value = batch.load_source(
+                        yaml_file, _error_handler, manifest, stats
+                    )
+            else:
+                value = batch.load_source(source, _error_handler, manifest, stats)
+        except (MarkedYAMLError, OSError) as error:
+            errors.append(error)
+
+        return LoadManyResult(value, errors, manifest, stats)
+
+    def load_source(
+        self,
+        source: Union[str, IO[str]],
+        error_handler: ErrorHandler,
+        manifest: Manifest,
+        stats: LoadStats,
+    ) -> Any:
+        """Load a source with the arguments of the batch."""
+        # The first config of a type is used, so the manifest and the stats go
+        # first.
+        config = self.config if self.config is not None else []
+        return load(
+            source,
+            self.object_class,
+            tag_handlers=self.tag_handlers,
+            error_handler=error_handler,
+            root_field=self.root_field,
+            config=[manifest, stats, *config],
+            engine=self.engine,
+        )
+
+
+_MAX_WORKER_BATCHES = 8
+_WORKER_BATCHES: Dict[str, _Batch] = {}
+
+
+def prepare(object_class: Type[Any], config: Optional[List[Any]] = None) -> None:
+    """Compile loaders of a class and of the object classes of its fields.
+
+    This avoids compiling them during the first load, loaders being compiled
+    anyway when needed if ObjectField.Config.compile_loaders is set.
+
+    Args:
+        object_class:   The class to prepare. Classes of nested object fields
+                        are prepared too, except classes loaded through
+                        !type tags.
+        config:         The config list that will be given to load. Its
+                        ObjectField.Config is used to resolve fields and
+                        hooks, if any.
+
+    """
+    assert isclass(object_class), _("object_class must be a type")
+    object_config = None
+    for item in config if config is not None else []:
+        if isinstance(item, ObjectField.Config):
+            object_config = item
+            break
+    else:
+        object_config = ObjectField.Config(compile_loaders=True)
+
+    prepared = set()
+    fields: List[BaseField] = [ObjectField(object_class)]
+    while len(fields) > 0:
+        field = fields.pop()
+        if isinstance(field, ContainerField):
+            fields.append(field.item_field)
+            continue
+
+        if not isinstance(field, ObjectField) or field.object_class in prepared:
+            continue
+
+        cls = field.object_class
+        prepared.add(cls)
+        schema = object_config.get_schema(cls())
+        get_compiled_loader(cls, schema)
+        fields.extend(it for it in schema.fields.values() if isinstance(it, BaseField))
+
+
+class ReloadResult(NamedTuple):
+    """Result of a call to Reloader.reload.
+
+    Members:
+        value: The current value, or UNDEFINED if loading failed.
+        reloaded: True if the value was loaded again.
+        changes: Dependencies that changed since the previous loading.
+        parsed_files: Paths of the files composed again.
+        duration: Duration of the call, in seconds.
+    """
+
+    value: Any
+    reloaded: bool
+    changes: List[Dependency]
+    parsed_files: Set[str]
+    duration: float
 
+
+class Reloader:
+    """Load a YAML file again when it or its dependencies change.
+
+    The files, globs, environment variables and flags the loaded value
+    depends on are recorded in a Manifest, and checked with stat calls on
+    each call to reload. When any changed, only the modified files are
+    composed again, the node trees of other files being kept in a cache
+    owned by the reloader, and the value is loaded from these node trees.
+
+    Node trees are reused, so the tree engine is always used.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        object_class: Optional[Type[Any]] = None,
+        tag_handlers: Optional[Iterable[TagHandler]] = None,
+        error_handler: Optional[ErrorHandler] = None,
+        root_field: Optional[BaseField] = None,
+        config: Optional[List[Any]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """Initialize the reloader. The file is loaded on the first reload.
+
+        Args:
+            path:       Path of the YAML file to load.
+            max_bytes:  Maximum total size of the files whose node trees are
+                        kept, see DocumentCache.
+            Other arguments: See load. The PathHandler.Config in config, if
+                             any, is used for its roots only.
+
+        """
+        config = list(config) if config is not None else []
+        path_config = next(
+            (it for it in config if isinstance(it, PathHandler.Config)), None
+        )
+
+        self._path = path
+        self._root_field = _get_root_field(object_class, root_field)
+        self._get_context = partial(_get_context, tag_handlers, error_handler)
+        self._document_cache = _RecordingDocumentCache(max_bytes)
+        self._config = [
+            PathHandler.Config(
+                roots=path_config.roots if path_config is not None else None,
+                document_cache=self._document_cache,
+            ),
+            *config,
+        ]
+        self._manifest: Optional[Manifest] = None
+        self._value: Any = UNDEFINED
+
+    @property
+    def value(self) -> Any:
+        """Get the last loaded value, UNDEFINED if it was never loaded."""
+        return self._value
+
+    @property
+    def manifest(self) -> Optional[Manifest]:
+        """Get the dependencies of the last loaded value."""
+        return self._manifest
+
+    def reload(self, force: bool = False) -> ReloadResult:
+        """Load the file again if any dependency changed since the last load.
+
+        If loading raises an error, the previous value and dependencies are
+        kept, so the next call tries to load the file again.
+
+        Args:
+            force: Load the file again even if no dependency changed.
+
+        """
+        start = perf_counter()
+        changes: List[Dependency] = []
+        if self._manifest is not None:
+            changes = self._manifest.get_changes(_get_flags(self._config))
+            if not force and len(changes) == 0:
+                return ReloadResult(
+                    self._value, False, changes, set(), perf_counter() - start
+                )
+
+        manifest = Manifest()
+        context = self._get_context([manifest, *self._config], Engine.TREE)
+
+        self._document_cache.parsed_files = set()
+        stat = self._path.stat()
+        manifest.add_file(self._path, stat=stat)
+        node = self._document_cache.load(self._path, compose_file, stat)
+        assert node is not None, _("source doesn't contain any YAML document.")
+        self._value = context.load(self._root_field, node, str(self._path))
+        self._manifest = manifest
+
+        parsed_files = self._document_cache.parsed_files
+        return ReloadResult(
+            self._value, True, changes, parsed_files, perf_counter() - start
+        )
+
+
+class _RecordingDocumentCache(DocumentCache):
+    def __init__(self, max_bytes: int):
+        super().__init__(max_bytes)
+        self.parsed_files: Set[str] = set()
+
+    def load(
+        self, path: Path, composer: Composer, stat: Optional[stat_result] = None
+    ) -> Optional[Node]:
+        def _compose(composed_path: Path) -> Optional[Node]:
+            self.parsed_files.add(str(composed_path))
+            return composer(composed_path)
+
+        return super().load(path, _compose, stat)
+
+
+def _get_context(
+    tag_handlers: Optional[Iterable[TagHandler]],
+    error_handler: Optional[ErrorHandler],
+    config: Optional[List[Any]],
+    engine: Engine,
+) -> LoadingContext:
     all_tag_handlers: List[TagHandler] = [
         ImportHandler(),
         GlobHandler(),
@@ -85,10 +703,15 @@ def load(  # pylint: disable=too-many-locals
     if error_handler is not None:
         assert callable(error_handler), _("error_handler must be a callable object.")
 
-    context = LoadingContext(
+    context_type = _CONTEXT_TYPES[engine]
+    return context_type(
         error_handler=error_handler, tag_handlers=all_tag_handlers, config=config
     )
 
+
+def _get_root_field(
+    object_class: Optional[Type[Any]], root_field: Optional[BaseField]
+) -> BaseField:
     if root_field is None:
         assert object_class is not None
         assert isclass(object_class), _("object_class must be a type")
@@ -99,13 +722,29 @@ def load(  # pylint: disable=too-many-locals
         assert isclass(object_class), _("object_class must be a type")
         root_field = ObjectField(object_class=object_class)
 
-    node = compose(source)  # type: ignore
-    node_path = None
-    if isinstance(source, TextIOBase) and hasattr(source, "name"):
-        node_path = source.name
+    return root_field
 
-    result = context.load(root_field, node, node_path)
-    if result is UNDEFINED:
-        return UNDEFINED
 
-    return cast(ObjectType, result)
+def _get_field_name(field: BaseField) -> str:
+    def _get_type_name(field_type: Type[Any]) -> str:
+        return f"{field_type.__module__}.{field_type.__qualname__}"
+
+    if isinstance(field, ObjectField):
+        return _get_type_name(field.object_class)
+
+    if isinstance(field, ContainerField):
+        item_name = _get_field_name(field.item_field)
+        return f"{_get_type_name(type(field))}[{item_name}]"
+
+    return _get_type_name(type(field))
+
+
+def _get_location(source: Union[str, IO[str]]) -> Optional[str]:
+    # This fails with pyfakefs, no simple way to check this, so disable it for
+    # now
+    # assert isinstance(source, (str, TextIOBase)), \
+    #     _('source parameter must be a string or Text I/O.')
+    if isinstance(source, TextIOBase) and hasattr(source, "name"):
+        return str(source.name)
+
+    return None
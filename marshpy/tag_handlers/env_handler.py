@@ -7,6 +7,7 @@ from yaml import ScalarNode
 
 from marshpy.core.constants import UNDEFINED
 from marshpy.core.interfaces import IBaseField, ILoadingContext
+from marshpy.core.manifest import Manifest
 from marshpy.tag_handlers.tag_handler import TagHandler
 
 
@@ -26,6 +27,9 @@ class EnvHandler(TagHandler):
 
         node = context.current_node()
         var_name = node.value
+        manifest = context.find_config(Manifest)
+        if manifest is not None:
+            manifest.add_env(var_name, environ.get(var_name))
 
         if var_name not in environ:
             return UNDEFINED
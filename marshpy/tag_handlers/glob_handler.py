@@ -1,12 +1,22 @@
 """Tag handler used to import files in YAML documents."""
+from concurrent.futures import Executor, Future
+from functools import partial
 from gettext import gettext as _
-from typing import Any
+from os import stat_result
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
-from yaml import SequenceNode
+from yaml import Node, SequenceNode
 
 from marshpy.core.constants import UNDEFINED
+from marshpy.core.glob_cache import GlobCache, get_glob_cache
 from marshpy.core.interfaces import IBaseField, ILoadingContext
-from marshpy.tag_handlers.path_handler import PathHandler
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.manifest import Manifest
+from marshpy.core.tracing import Tracer
+from marshpy.tag_handlers.path_handler import PathHandler, compose_file
+
+DEFAULT_SERIAL_THRESHOLD = 8
 
 
 class GlobHandler(PathHandler):
@@ -14,6 +24,52 @@ class GlobHandler(PathHandler):
 
     tag_pattern = "^(glob)$"
 
+    class Config:
+        """Configuration of the glob handler."""
+
+        def __init__(
+            self,
+            executor: Optional[Executor] = None,
+            serial_threshold: int = DEFAULT_SERIAL_THRESHOLD,
+            glob_cache: Optional[GlobCache] = None,
+        ) -> None:
+            """Initialize the config.
+
+            Args:
+                executor: Executor used to compose matched files concurrently.
+                          A ThreadPoolExecutor overlaps file reads, a
+                          ProcessPoolExecutor also parses files in parallel.
+                          If None, files are composed one after the other.
+                serial_threshold: Files are composed serially when less than
+                                  this count of matched files aren't already
+                                  in the document cache.
+                glob_cache: Cache of directory listings used to expand
+                            patterns. Defaults to the process-wide glob
+                            cache.
+
+            """
+            assert serial_threshold >= 0, _("serial_threshold must be positive.")
+            self._executor = executor
+            self._serial_threshold = serial_threshold
+            self._glob_cache = (
+                glob_cache if glob_cache is not None else get_glob_cache()
+            )
+
+        @property
+        def executor(self) -> Optional[Executor]:
+            """Get the executor used to compose files."""
+            return self._executor
+
+        @property
+        def serial_threshold(self) -> int:
+            """Get the minimum count of files to compose concurrently."""
+            return self._serial_threshold
+
+        @property
+        def glob_cache(self) -> GlobCache:
+            """Get the cache used to expand patterns."""
+            return self._glob_cache
+
     def load(self, context: ILoadingContext, field: IBaseField) -> Any:
         """See Resolver.resolve for usage."""
         if not context.expect_scalar(_("glob must be set on a scalar node")):
@@ -21,16 +77,64 @@ class GlobHandler(PathHandler):
 
         node = context.current_node()
         glob = node.value
+        paths = self._glob(context, glob)
+        # Files are stat'ed once, to check the document cache and to load them.
+        file_stats = {it: it.stat() for it in paths}
+        futures = _submit(context, file_stats)
         result = []
-        for root in self._get_roots(context):
-            for path in root.glob(glob):
-                if not path.is_file():
-                    continue
-
-                content = self._load_file(context, path)
+        try:
+            # Files are added in glob order, whatever order they are composed in.
+            for path in paths:
+                future = futures.get(path)
+                composer = partial(_get_result, future) if future else None
+                content = self._load_file(context, path, composer, file_stats[path])
 
                 if content is not None:
                     result.append(content)
+        finally:
+            for future in futures.values():
+                future.cancel()
 
         fake_node = SequenceNode("", result, node.start_mark, node.end_mark)
         return context.load(field, fake_node)
+
+    def _glob(self, context: ILoadingContext, glob: str) -> List[Path]:
+        manifest = context.find_config(Manifest)
+        glob_cache = context.get_config(GlobHandler.Config).glob_cache
+        location = context.current_location()
+        stats = context.get_config(LoadStats)
+        paths = []
+        with context.get_config(Tracer).span(glob, "glob") as end_args:
+            for root in self._get_roots(context):
+                root_paths = glob_cache.glob(root, glob, stats)
+                if manifest is not None:
+                    manifest.add_glob(root, glob, root_paths, location)
+                paths.extend(root_paths)
+
+            end_args["files"] = len(paths)
+
+        return paths
+
+
+def _submit(
+    context: ILoadingContext, file_stats: Dict[Path, stat_result]
+) -> Dict[Path, "Future[Optional[Node]]"]:
+    config = context.get_config(GlobHandler.Config)
+    executor = config.executor
+    if executor is None:
+        return {}
+
+    document_cache = context.get_config(PathHandler.Config).document_cache
+    missing_paths = [
+        path
+        for path, stat in file_stats.items()
+        if not document_cache.is_cached(path, stat)
+    ]
+    if len(missing_paths) < config.serial_threshold:
+        return {}
+
+    return {it: executor.submit(compose_file, it) for it in missing_paths}
+
+
+def _get_result(future: "Future[Optional[Node]]", __: Path) -> Optional[Node]:
+    return future.result()
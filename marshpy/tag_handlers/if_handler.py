@@ -1,9 +1,10 @@
 """Handler loading a value only if some flag is defined."""
 from copy import copy
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Optional, Set
 
 from marshpy.core.constants import UNDEFINED
 from marshpy.core.interfaces import IBaseField, ILoadingContext
+from marshpy.core.manifest import Manifest
 from marshpy.tag_handlers.tag_handler import TagHandler
 
 
@@ -22,22 +23,32 @@ class IfHandler(TagHandler):
             """Initialize the config."""
             self._flags = set(flags) if flags is not None else set()
 
+        @property
+        def flags(self) -> Set[str]:
+            """Get the defined flags."""
+            return self._flags
+
         def is_defined(self, flag: str) -> bool:
             """Check that the given flag is defined."""
             return flag in self._flags
 
     def load(self, context: ILoadingContext, field: IBaseField) -> Any:
         node = context.current_node()
-        tag = node.tag[1:]  # Remove trailing !
-        match = self._compiled_pattern.match(tag)
+        match = context.current_tag_match()
+        if match is None:
+            match = self.match_tag(node.tag[1:])  # Remove trailing !
 
         # The pattern should match already if we're here
         assert match is not None
 
         config = context.get_config(IfHandler.Config)
         flag = match.group("flag")
+        defined = config.is_defined(flag)
+        manifest = context.find_config(Manifest)
+        if manifest is not None:
+            manifest.add_flag(flag, defined)
 
-        if not config.is_defined(flag):
+        if not defined:
             return UNDEFINED
 
         # We need to return a copy of the node and erase the tag to avoid
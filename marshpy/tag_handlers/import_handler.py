@@ -6,6 +6,9 @@ from typing import Any, Optional
 from marshpy.core.constants import UNDEFINED
 from marshpy.core.errors import ErrorCode
 from marshpy.core.interfaces import IBaseField, ILoadingContext
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.manifest import Manifest
+from marshpy.core.stat_cache import StatCache
 from marshpy.tag_handlers.path_handler import PathHandler
 
 
@@ -50,9 +53,27 @@ class ImportHandler(PathHandler):
         if file_path.is_absolute():
             return file_path
 
-        for root in self._get_roots(context):
-            path = root / file_path
-            if path.is_file():
-                return path
+        roots = list(self._get_roots(context))
+        root_index = context.get_config(PathHandler.Config).root_index
+        path = root_index.find(
+            roots,
+            file_path,
+            context.get_config(StatCache),
+            context.get_config(LoadStats),
+        )
 
-        return None
+        # The file could be created later in previous roots, changing the
+        # loaded value.
+        manifest = context.find_config(Manifest)
+        if manifest is None:
+            return path
+
+        location = context.current_location()
+        for root in roots:
+            missing_path = root / file_path
+            if missing_path == path:
+                break
+
+            manifest.add_missing_file(missing_path, location)
+
+        return path
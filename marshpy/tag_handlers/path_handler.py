@@ -1,14 +1,23 @@
 """Tag handler used to import files in YAML documents."""
 from abc import abstractmethod
+from functools import partial
 from gettext import gettext as _
+from os import stat_result
 from pathlib import Path
-from typing import Any, Iterable, Iterator, List, Optional, cast
+from typing import Any, Iterable, Iterator, List, Optional
 
-from yaml import Node, compose
+from yaml import Node
 from yaml.parser import ParserError
 
+from marshpy.core.document_cache import Composer, DocumentCache, get_document_cache
 from marshpy.core.errors import ErrorCode
 from marshpy.core.interfaces import IBaseField, ILoadingContext
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.manifest import Manifest
+from marshpy.core.parsing import compose
+from marshpy.core.root_index import RootIndex, get_root_index
+from marshpy.core.stat_cache import StatCache
+from marshpy.core.tracing import Tracer, count_nodes
 from marshpy.tag_handlers.tag_handler import TagHandler
 
 
@@ -22,12 +31,22 @@ class PathHandler(TagHandler):
     class Config:
         """Shared configuration for all path handlers."""
 
-        def __init__(self, roots: Optional[Iterable[Path]] = None):
+        def __init__(
+            self,
+            roots: Optional[Iterable[Path]] = None,
+            document_cache: Optional[DocumentCache] = None,
+            root_index: Optional[RootIndex] = None,
+        ):
             """Initialize the config.
 
             Args:
                 roots: Base filesystem paths used to resolve paths in handlers
                        inheriting from PathHandler.
+                document_cache: Cache used to avoid composing the same files
+                                again on each load. Defaults to the
+                                process-wide document cache.
+                root_index: Index used to find imported files in roots.
+                            Defaults to the process-wide root index.
 
             """
             if roots is not None:
@@ -40,11 +59,28 @@ class PathHandler(TagHandler):
             else:
                 self._roots = []
 
+            self._document_cache = (
+                document_cache if document_cache is not None else get_document_cache()
+            )
+            self._root_index = (
+                root_index if root_index is not None else get_root_index()
+            )
+
         @property
         def roots(self) -> List[Path]:
             """Get the configured root paths."""
             return self._roots
 
+        @property
+        def document_cache(self) -> DocumentCache:
+            """Get the cache used to load files."""
+            return self._document_cache
+
+        @property
+        def root_index(self) -> RootIndex:
+            """Get the index used to find files in roots."""
+            return self._root_index
+
     def __init__(self, allow_relative: bool = True):
         """Initialize the PathHandler.
 
@@ -69,7 +105,7 @@ class PathHandler(TagHandler):
             if current_location is not None:
                 file_path = Path(current_location)
                 parent = file_path.parent
-                if parent.is_dir():
+                if context.get_config(StatCache).is_dir(parent):
                     yield parent
 
         config = context.get_config(PathHandler.Config)
@@ -78,16 +114,74 @@ class PathHandler(TagHandler):
                 yield root
 
     @staticmethod
-    def _load_file(context: ILoadingContext, path: Path) -> Optional[Node]:
-        """Load a YAML document, emit a MarshPyError on ParseError."""
-        with open(path, "r", encoding="utf-8") as yaml_file:
-            try:
-                return cast(Node, compose(yaml_file))  # type: ignore
-            except ParserError as error:
-                context.error(
-                    ErrorCode.VALUE_ERROR,
-                    _("Parse error while loading {} : {}"),
-                    path,
-                    error,
-                )
+    def _load_file(
+        context: ILoadingContext,
+        path: Path,
+        composer: Optional[Composer] = None,
+        stat: Optional[stat_result] = None,
+    ) -> Optional[Node]:
+        """Load a YAML document, emit a MarshPyError on ParseError.
+
+        Args:
+            context: The loading context.
+            path: The path of the file to load.
+            composer: Called to compose the file if it's not cached, defaults
+                      to composing it in the current thread.
+            stat: Stat result of the file, if already known. If None, the
+                  file is stat'ed.
+
+        """
+        # The manifest and the document cache share the same stat call.
+        if stat is None:
+            stat = path.stat()
+        manifest = context.find_config(Manifest)
+        if manifest is not None:
+            manifest.add_file(path, context.current_location(), stat)
+        config = context.get_config(PathHandler.Config)
+        tracer = context.get_config(Tracer)
+        stats = context.get_config(LoadStats)
+        if composer is None:
+            composer = compose_file
+        composer = partial(_compose_counted, stats, stat.st_size, composer)
+        if tracer.enabled:
+            composer = partial(_compose_traced, tracer, stat.st_size, composer)
+
+        try:
+            with tracer.span(str(path), "file"):
+                opened_files = stats.files
+                node = config.document_cache.load(path, composer, stat)
+                stats.add_cache_access("document", stats.files == opened_files)
+                return node
+        except ParserError as error:
+            context.error(
+                ErrorCode.VALUE_ERROR,
+                _("Parse error while loading {} : {}"),
+                path,
+                error,
+            )
         return None
+
+
+def compose_file(path: Path) -> Optional[Node]:
+    """Compose the YAML document contained in the file at the given path."""
+    with open(path, "r", encoding="utf-8") as yaml_file:
+        return compose(yaml_file)
+
+
+def _compose_counted(
+    stats: LoadStats, size: int, composer: Composer, path: Path
+) -> Optional[Node]:
+    node = composer(path)
+    stats.files += 1
+    stats.bytes_read += size
+    return node
+
+
+def _compose_traced(
+    tracer: Tracer, size: int, composer: Composer, path: Path
+) -> Optional[Node]:
+    with tracer.span(str(path), "compose") as end_args:
+        node = composer(path)
+        end_args["bytes"] = size
+        end_args["nodes"] = count_nodes(node)
+        return node
@@ -4,8 +4,9 @@ Resolvers are used when an !include tag is encountered, to load the included
 YAML documents.
 """
 from abc import ABC, abstractmethod
+from re import Match
 from re import compile as re_compile
-from typing import Any
+from typing import Any, Optional
 
 from yaml import Node
 
@@ -35,10 +36,18 @@ class TagHandler(ABC):
         assert node.tag is not None
         assert node.tag[0] == "!"  # Only handle custom tags.
 
-        pattern = self._compiled_pattern
         tag = node.tag[1:]  # Remove !
 
-        return pattern.match(tag) is not None
+        return self.match_tag(tag) is not None
+
+    def match_tag(self, tag: str) -> Optional["Match[str]"]:
+        """Match the pattern of this handler on the given tag.
+
+        Args:
+            tag: The tag to test, without leading !
+
+        """
+        return self._compiled_pattern.match(tag)
 
     @abstractmethod
     def load(self, context: ILoadingContext, field: IBaseField) -> Any:
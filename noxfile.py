@@ -20,6 +20,23 @@ def tests(session: Session):
     session.run("pytest")
 
 
+@nox.session(reuse_venv=True)
+def benchmarks(session: Session):
+    """Run benchmarks, extra arguments are forwarded to the benchmark script.
+
+    For example, nox -s benchmarks -- --baseline baseline.json
+    """
+    session.install("-e", ".")
+    session.run("python", "-m", "benchmarks.bench_loading", *session.posargs)
+
+
+@nox.session(reuse_venv=True)
+def memory_benchmarks(session: Session):
+    """Run memory benchmarks, extra arguments are forwarded like benchmarks."""
+    session.install("-e", ".")
+    session.run("python", "-m", "benchmarks.bench_memory", *session.posargs)
+
+
 @nox.session(reuse_venv=True)
 def black(session: Session):
     """Check black formatting."""
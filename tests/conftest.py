@@ -0,0 +1,14 @@
+"""Pytest fixtures."""
+from typing import Any
+
+from pytest import MonkeyPatch, fixture
+
+from marshpy.core.constants import Engine
+from tests import helpers
+
+
+@fixture(autouse=True, params=list(Engine), ids=lambda engine: engine.name.lower())
+def engine(request: Any, monkeypatch: MonkeyPatch) -> Engine:
+    """Run each test with each loading engine."""
+    monkeypatch.setattr(helpers, "ENGINE", request.param)
+    return request.param
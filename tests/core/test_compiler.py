@@ -0,0 +1,121 @@
+"""Compiled loaders tests."""
+from typing import Any, Dict, List
+
+from yaml import Node
+
+from marshpy.core.compiler import clear_compiled_loaders, get_compiled_loader
+from marshpy.core.errors import ErrorCode
+from marshpy.core.interfaces import IBaseField
+from marshpy.core.validation import ValidationContext
+from marshpy.fields.bool_field import BoolField
+from marshpy.fields.dict_field import DictField
+from marshpy.fields.float_field import FloatField
+from marshpy.fields.int_field import IntField
+from marshpy.fields.list_field import ListField
+from marshpy.fields.object_field import ObjectField
+from marshpy.fields.string_field import StringField
+from marshpy.loader import load, prepare
+
+
+def _validate_string(context: ValidationContext, value: str) -> None:
+    if value == "invalid":
+        context.error("Invalid value")
+
+
+class _Child:
+    fields = {
+        "bool": BoolField(),
+        "float": FloatField(maximum=10),
+        "int": IntField(minimum=0, required=True),
+        "hex": IntField(base=16),
+        "pattern": StringField(pattern="^[a-z]*$"),
+        "string": StringField(),
+        "validated": StringField(validate=_validate_string),
+        "with space": StringField(),
+    }
+
+    def validate(self, context: ValidationContext) -> None:
+        """Reject some values."""
+        if getattr(self, "string", None) == "invalid":
+            context.error("Invalid child")
+
+
+class _Parent:
+    fields = {
+        "children": ListField(ObjectField(_Child)),
+        "mapping": DictField(ObjectField(_Child)),
+    }
+
+    def post_load(self) -> None:
+        """Mark the object as loaded."""
+        setattr(self, "loaded", True)
+
+
+_SOURCE = """
+children:
+  - { int: 1, bool: yes, float: 1.5, hex: ff, string: value, with space: 1 }
+  - { int: -1, bool: maybe, float: 11, hex: zz, pattern: NOT }
+  - { int: !fail 1, float: -2.5e0, validated: invalid, unknown: value }
+  - { bool: [not, a, scalar], string: invalid, ? [key] : value }
+  - [not, an, object]
+mapping:
+  child: { int: 0, string: !if(flag) value }
+"""
+
+
+def _load(compile_loaders: bool) -> Any:
+    errors: List[str] = []
+
+    def _handler(node: Node, code: ErrorCode, message: str) -> None:
+        mark = node.start_mark
+        errors.append(f"{code} {mark.line}:{mark.column} {message}")
+
+    config = ObjectField.Config(compile_loaders=compile_loaders)
+    result = load(_SOURCE, _Parent, error_handler=_handler, config=[config])
+    return result, errors
+
+
+def test_compiled_loaders_are_identical() -> None:
+    """Compiled loaders should load the same values and emit the same errors."""
+    compiled, compiled_errors = _load(True)
+    generic, generic_errors = _load(False)
+
+    assert compiled_errors == generic_errors
+    assert compiled.loaded and generic.loaded
+    assert len(compiled.children) == len(generic.children) == 3
+    for compiled_child, generic_child in zip(
+        [*compiled.children, compiled.mapping["child"]],
+        [*generic.children, generic.mapping["child"]],
+    ):
+        assert vars(compiled_child) == vars(generic_child)
+
+    child = compiled.children[0]
+    assert (child.bool, child.float, child.int, child.hex) == (True, 1.5, 1, 255)
+    assert getattr(child, "with space") == "1"
+
+
+def test_compiled_loaders_cache() -> None:
+    """Loaders should be compiled once, prepare compiling nested classes."""
+
+    class _Object:
+        fields: Dict[str, IBaseField] = {"child": ObjectField(_Child)}
+
+    clear_compiled_loaders()
+    prepare(_Object)
+
+    config = ObjectField.Config(compile_loaders=True)
+    child_loader = config.get_schema(_Child()).loader
+    object_loader = config.get_schema(_Object()).loader
+    assert child_loader is not None and object_loader is not None
+
+    config = ObjectField.Config(compile_loaders=True)
+    assert config.get_schema(_Child()).loader is child_loader
+
+    _Object.fields = {"other": StringField()}
+    config.invalidate(_Object)
+    schema = config.get_schema(_Object())
+    assert schema.loader is not object_loader
+    assert get_compiled_loader(_Object, schema) is schema.loader
+
+    result = load("other: value", _Object, config=[config])
+    assert getattr(result, "other") == "value"
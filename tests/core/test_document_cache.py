@@ -0,0 +1,118 @@
+"""Document cache tests."""
+from os import stat, utime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from pytest import raises
+from yaml import Node
+from yaml.parser import ParserError
+
+from marshpy.core.document_cache import DocumentCache
+from marshpy.core.parsing import compose
+from marshpy.fields.string_field import StringField
+from marshpy.tag_handlers.import_handler import ImportHandler
+from marshpy.tag_handlers.path_handler import PathHandler
+from tests.helpers import check_load
+
+
+def _composer(composed: List[Path]) -> Callable[[Path], Optional[Node]]:
+    def _compose(path: Path) -> Optional[Node]:
+        composed.append(path)
+        with open(path, "r", encoding="utf-8") as yaml_file:
+            return compose(yaml_file)
+
+    return _compose
+
+
+def _touch(path: Path) -> None:
+    mtime = stat(path).st_mtime_ns + 1_000_000_000
+    utime(path, ns=(mtime, mtime))
+
+
+def test_document_cache(tmp_path: Path) -> None:
+    """Document cache should compose files once, until they change."""
+    file_path = tmp_path / "file.yaml"
+    file_path.write_text("value", encoding="utf-8")
+    composed: List[Path] = []
+    cache = DocumentCache()
+
+    node = cache.load(file_path, _composer(composed))
+    assert node is not None and node.value == "value"
+    assert cache.load(file_path, _composer(composed)) is node
+    assert composed == [file_path]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    file_path.write_text("other_value", encoding="utf-8")
+    _touch(file_path)
+    node = cache.load(file_path, _composer(composed))
+    assert node is not None and node.value == "other_value"
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 1
+
+    # Marks should keep the path the file was loaded with.
+    (tmp_path / "folder").mkdir()
+    other_path = tmp_path / "folder" / ".." / "file.yaml"
+    node = cache.load(other_path, _composer(composed))
+    assert node is not None and node.start_mark.name == str(other_path)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_document_cache_eviction(tmp_path: Path) -> None:
+    """Least recently used documents should be evicted when over budget."""
+    paths = []
+    for name in ["file_1", "file_2", "file_3"]:
+        path = tmp_path / f"{name}.yaml"
+        path.write_text(name, encoding="utf-8")
+        paths.append(path)
+
+    composed: List[Path] = []
+    cache = DocumentCache(max_bytes=12)
+    cache.load(paths[0], _composer(composed))
+    cache.load(paths[1], _composer(composed))
+    cache.load(paths[0], _composer(composed))
+    cache.load(paths[2], _composer(composed))
+    assert cache.evictions == 1
+    assert cache.size == 12
+
+    cache.load(paths[0], _composer(composed))
+    cache.load(paths[1], _composer(composed))
+    assert composed == [paths[0], paths[1], paths[2], paths[1]]
+
+    cache = DocumentCache(max_bytes=0)
+    cache.load(paths[0], _composer(composed))
+    assert len(cache) == 0
+
+
+def test_document_cache_errors(tmp_path: Path) -> None:
+    """Documents failing to parse shouldn't be cached."""
+    file_path = tmp_path / "file.yaml"
+    file_path.write_text("[value", encoding="utf-8")
+    cache = DocumentCache()
+
+    for __ in range(2):
+        with raises(ParserError):
+            cache.load(file_path, _composer([]))
+
+    assert len(cache) == 0
+    assert cache.misses == 2
+
+
+def test_path_handlers_use_document_cache(tmp_path: Path) -> None:
+    """Import handler should load files through the configured cache."""
+    (tmp_path / "file.yaml").write_text("value", encoding="utf-8")
+    cache = DocumentCache()
+
+    for __ in range(2):
+        result = check_load(
+            "!import file.yaml",
+            field=StringField(),
+            tag_handlers=[ImportHandler()],
+            config=[PathHandler.Config(roots=[tmp_path], document_cache=cache)],
+        )
+        assert result == "value"
+
+    assert (cache.hits, cache.misses) == (1, 1)
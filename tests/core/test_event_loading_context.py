@@ -0,0 +1,139 @@
+"""Event loading context tests."""
+from io import StringIO
+from typing import Any, Dict, List
+
+from pytest import raises
+from yaml import MappingNode, Node
+from yaml.composer import ComposerError
+
+from marshpy.core.constants import Engine
+from marshpy.core.errors import ErrorCode, FieldNotDeclaredError
+from marshpy.core.event_loading_context import EventLoadingContext
+from marshpy.core.interfaces import ILoadingContext
+from marshpy.core.validation import ValidationContext
+from marshpy.fields.dict_field import DictField
+from marshpy.fields.list_field import ListField
+from marshpy.fields.object_field import ObjectField
+from marshpy.fields.string_field import StringField
+from marshpy.loader import load
+
+
+class _Child:
+    fields = {"value": StringField()}
+
+    value: str
+
+
+class _Parent:
+    children: List[_Child]
+    mapping: Dict[str, str]
+    value: str
+
+    fields = {
+        "children": ListField(ObjectField(_Child)),
+        "mapping": DictField(StringField()),
+        "value": StringField(),
+    }
+
+
+def test_anchors_and_aliases(engine: Engine) -> None:
+    """Anchored values should be available to aliases."""
+    result = load(
+        "mapping: &mapping { key: value }\n"
+        "children: [&child { value: child }, *child]\n"
+        "ignored: &ignored ignored_value\n"
+        "value: *ignored\n",
+        _Parent,
+        error_handler=lambda *__: None,
+        engine=engine,
+    )
+
+    assert isinstance(result, _Parent)
+    assert result.mapping == {"key": "value"}
+    assert [child.value for child in result.children] == ["child", "child"]
+    assert result.value == "ignored_value"
+
+
+def test_errors_are_identical() -> None:
+    """Errors should have the same message with both engines."""
+
+    def _get_errors(engine: Engine) -> List[str]:
+        errors = []
+
+        def _handler(node: Node, code: ErrorCode, message: str) -> None:
+            mark = node.start_mark
+            errors.append(f"{code} {mark.line}:{mark.column} {message}")
+
+        load(
+            "children:\n"
+            "  - value: child\n"
+            "  - unknown: value\n"
+            "  - [not, an, object]\n"
+            "mapping: { key: [not, a, string] }\n"
+            "value: !unknown_tag value\n",
+            _Parent,
+            error_handler=_handler,
+            engine=engine,
+        )
+        return errors
+
+    assert _get_errors(Engine.EVENTS) == _get_errors(Engine.TREE)
+
+    with raises(FieldNotDeclaredError) as error:
+        load("children: [{ unknown: value }]", _Parent, engine=Engine.EVENTS)
+    assert ":0:11 :" in str(error.value)
+
+
+def test_event_loaded_nodes_have_no_children() -> None:
+    """Nodes loaded from events should have no children."""
+    current_nodes: List[Any] = []
+
+    class _Object:
+        fields = {"value": StringField()}
+
+        def validate(self, context: ValidationContext) -> None:
+            """Keep the node this object was loaded from."""
+            # pylint: disable=protected-access
+            loading_context: ILoadingContext = context._loading_context
+            current_nodes.append(loading_context.current_node())
+
+    load("value: test", _Object, engine=Engine.EVENTS)
+    load("value: test", _Object, engine=Engine.TREE)
+    assert isinstance(current_nodes[0], MappingNode)
+    assert not current_nodes[0].value
+    assert len(current_nodes[1].value) == 1
+
+
+def test_multiple_documents_raise() -> None:
+    """Loading a single document from a stream with more should raise."""
+    context = EventLoadingContext(error_handler=None, tag_handlers=[])
+    with raises(ComposerError):
+        context.load_document(ObjectField(_Parent), "value: 1\n---\nvalue: 2\n")
+
+    documents = context.load_documents(StringField(), "value_1\n---\nvalue_2\n")
+    assert list(documents) == ["value_1", "value_2"]
+
+
+def test_multiple_documents_errors_are_identical() -> None:
+    """Extra documents should raise the same error before loading anything."""
+    loaded_values: List[str] = []
+
+    class _Object:
+        fields = {"value": StringField()}
+
+        def post_load(self) -> None:
+            """Record loaded objects."""
+            loaded_values.append(getattr(self, "value"))
+
+    def _get_error(engine: Engine, source: Any) -> str:
+        with raises(ComposerError) as error:
+            load(source, _Object, engine=engine)
+        return str(error.value)
+
+    source = "value: first\n---\nvalue: second\n"
+    expected = _get_error(Engine.TREE, source)
+    assert "^" in expected
+    assert _get_error(Engine.EVENTS, source) == expected
+    stream_error = _get_error(Engine.TREE, StringIO(source))
+    assert _get_error(Engine.EVENTS, StringIO(source)) == stream_error
+    assert not loaded_values
@@ -0,0 +1,91 @@
+"""Glob cache tests."""
+from os import symlink, utime
+from pathlib import Path
+from time import time_ns
+
+from marshpy.core.glob_cache import GlobCache
+
+
+def _set_old_mtime(path: Path, age: int = 10) -> None:
+    mtime = time_ns() - age * 1_000_000_000
+    utime(path, ns=(mtime, mtime))
+
+
+def _create_tree(root: Path) -> None:
+    (root / "sub" / "deep").mkdir(parents=True)
+    (root / "sub" / "dir.yaml").mkdir()
+    for path in [
+        "a.yaml",
+        ".hidden.yaml",
+        "b.txt",
+        "sub/b.yaml",
+        "sub/c.yaml",
+        "sub/deep/d.yaml",
+    ]:
+        (root / path).write_text("value", encoding="utf-8")
+    symlink(root, root / "sub" / "link")
+
+    for directory in [
+        root,
+        root / "sub",
+        root / "sub" / "deep",
+        root / "sub" / "dir.yaml",
+    ]:
+        _set_old_mtime(directory)
+
+
+def test_glob_cache_matches_pathlib(tmp_path: Path) -> None:
+    """Glob cache should match the same files as Path.glob."""
+    _create_tree(tmp_path)
+    cache = GlobCache()
+
+    for pattern in [
+        "*.yaml",
+        "**/*.yaml",
+        "**",
+        "sub/*",
+        "sub/**/*.yaml",
+        "*/deep/*.yaml",
+        "s?b/[bc].yaml",
+        "sub/link/a.yaml",
+        "sub/../a.yaml",
+        "missing/*",
+    ]:
+        expected = {it for it in tmp_path.glob(pattern) if it.is_file()}
+        assert set(cache.glob(tmp_path, pattern)) == expected, pattern
+
+    assert cache.glob(tmp_path, "**/*.yaml") == [
+        tmp_path / ".hidden.yaml",
+        tmp_path / "a.yaml",
+        tmp_path / "sub" / "b.yaml",
+        tmp_path / "sub" / "c.yaml",
+        tmp_path / "sub" / "deep" / "d.yaml",
+    ]
+
+
+def test_glob_cache_invalidation(tmp_path: Path) -> None:
+    """Glob results should be reused until a visited directory changes."""
+    _create_tree(tmp_path)
+    cache = GlobCache()
+
+    def _check(pattern: str, expected_hits: int, expected_count: int) -> None:
+        assert len(cache.glob(tmp_path, pattern)) == expected_count
+        assert cache.hits == expected_hits
+
+    _check("sub/**/*.yaml", 0, 3)
+    _check("sub/**/*.yaml", 1, 3)
+    _check("*.yaml", 1, 2)
+
+    (tmp_path / "sub" / "deep" / "e.yaml").write_text("value", encoding="utf-8")
+    _set_old_mtime(tmp_path / "sub" / "deep", 5)
+    _check("sub/**/*.yaml", 1, 4)
+    _check("sub/**/*.yaml", 2, 4)
+    _check("*.yaml", 3, 2)
+
+    # Recently modified directories aren't cached.
+    (tmp_path / "f.yaml").write_text("value", encoding="utf-8")
+    _check("*.yaml", 3, 3)
+    _check("*.yaml", 3, 3)
+
+    cache.clear()
+    assert cache.hits == 0 and cache.misses == 0
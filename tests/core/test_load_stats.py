@@ -0,0 +1,96 @@
+"""Load statistics tests."""
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pytest import mark
+
+from marshpy.core.constants import Engine
+from marshpy.core.document_cache import DocumentCache
+from marshpy.core.errors import ErrorCode
+from marshpy.core.glob_cache import GlobCache
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.root_index import RootIndex
+from marshpy.fields.bool_field import BoolField
+from marshpy.fields.int_field import IntField
+from marshpy.fields.list_field import ListField
+from marshpy.fields.object_field import ObjectField
+from marshpy.fields.string_field import StringField
+from marshpy.loader import load
+from marshpy.tag_handlers.glob_handler import GlobHandler
+from marshpy.tag_handlers.path_handler import PathHandler
+
+
+class _Item:
+    fields = {"name": StringField(), "count": IntField(), "enabled": BoolField()}
+
+
+class _Root:
+    fields = {
+        "items": ListField(ObjectField(object_class=_Item)),
+        "globbed": ListField(StringField()),
+    }
+
+
+def _load(config: List[Any], engine: Engine) -> Dict[str, Any]:
+    stats = LoadStats()
+    load(
+        "items:\n"
+        "- { name: first, count: 1, enabled: true }\n"
+        "- { name: second, count: bad }\n"
+        "- !import item.yaml\n"
+        "globbed: !glob folder/*.yaml\n",
+        _Root,
+        error_handler=lambda *__: None,
+        config=[stats, *config],
+        engine=engine,
+    )
+    return stats.to_dict()
+
+
+@mark.parametrize("compile_loaders", [False, True])
+def test_load_stats(tmp_path: Path, engine: Engine, compile_loaders: bool) -> None:
+    """Load stats should count the work done by a load."""
+    (tmp_path / "folder").mkdir()
+    (tmp_path / "folder" / "a.yaml").write_text("a", encoding="utf-8")
+    (tmp_path / "folder" / "b.yaml").write_text("b", encoding="utf-8")
+    (tmp_path / "item.yaml").write_text("name: third", encoding="utf-8")
+    config = [
+        ObjectField.Config(compile_loaders=compile_loaders),
+        PathHandler.Config(
+            roots=[tmp_path], document_cache=DocumentCache(), root_index=RootIndex()
+        ),
+        GlobHandler.Config(glob_cache=GlobCache()),
+    ]
+
+    expected = {
+        "nodes": 24,
+        "objects": 4,
+        "scalars": 16,
+        "files": 3,
+        "bytes_read": 13,
+        "tags": {"!import": 1, "!glob": 1},
+        "errors": {"VALUE_ERROR": 1},
+        "cache_hits": {},
+        "cache_misses": {"document": 3, "glob": 1, "root_index": 1},
+    }
+    assert _load(config, engine) == expected
+
+    expected.update(
+        files=0,
+        bytes_read=0,
+        cache_hits={"document": 3},
+        cache_misses={"glob": 1, "root_index": 1},
+    )
+    assert _load(config, engine) == expected
+
+
+def test_load_stats_error_codes() -> None:
+    """Load stats should count errors by code."""
+    stats = LoadStats()
+    load(
+        "[1, a, b, c]",
+        root_field=ListField(IntField()),
+        error_handler=lambda *__: None,
+        config=[stats],
+    )
+    assert stats.errors == {ErrorCode.VALUE_ERROR: 3}
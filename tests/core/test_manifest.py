@@ -0,0 +1,147 @@
+"""Dependency manifest tests."""
+from os import stat, utime
+from pathlib import Path
+from typing import Any
+
+from pytest import MonkeyPatch
+
+from marshpy.core.constants import Engine
+from marshpy.core.manifest import (
+    FileDependency,
+    FlagDependency,
+    GlobDependency,
+    Manifest,
+)
+from marshpy.fields.list_field import ListField
+from marshpy.fields.string_field import StringField
+from marshpy.loader import load
+from marshpy.tag_handlers.path_handler import PathHandler
+
+
+class _Object:
+    fields = {
+        "imported": StringField(),
+        "globbed": ListField(StringField()),
+        "env": StringField(),
+        "flagged": StringField(),
+    }
+
+
+def _touch(path: Path, content: str) -> None:
+    path.write_text(content, encoding="utf-8")
+    mtime = stat(path).st_mtime_ns + 1_000_000_000
+    utime(path, ns=(mtime, mtime))
+
+
+def test_manifest(tmp_path: Path, monkeypatch: MonkeyPatch, engine: Engine) -> None:
+    """Manifest should record dependencies, and detect their changes."""
+    (tmp_path / "folder").mkdir()
+    _touch(tmp_path / "folder" / "file.yaml", "globbed")
+    _touch(tmp_path / "root.yaml", "!import imported.yaml")
+    _touch(tmp_path / "imported.yaml", "imported")
+    _touch(
+        tmp_path / "main.yaml",
+        "imported: !import root.yaml\n"
+        "globbed: !glob folder/*.yaml\n"
+        "env: !env MARSHPY_MANIFEST_TEST\n"
+        "flagged: !if(flag) flagged\n",
+    )
+    monkeypatch.setenv("MARSHPY_MANIFEST_TEST", "value")
+    manifest = Manifest()
+
+    with open(tmp_path / "main.yaml", "r", encoding="utf-8") as yaml_file:
+        load(
+            yaml_file,
+            _Object,
+            config=[manifest, PathHandler.Config(roots=[tmp_path])],
+            engine=engine,
+        )
+
+    main_path = str(tmp_path / "main.yaml")
+    root_path = str(tmp_path / "root.yaml")
+    glob_path = str(tmp_path / "folder" / "file.yaml")
+    assert manifest.files[main_path].parent is None
+    assert manifest.files[root_path].parent == main_path
+    assert manifest.files[str(tmp_path / "imported.yaml")].parent == root_path
+    assert manifest.files[glob_path].parent == main_path
+    assert manifest.globs == {
+        (str(tmp_path), "folder/*.yaml"): GlobDependency(
+            str(tmp_path), "folder/*.yaml", (glob_path,), main_path
+        )
+    }
+    assert list(manifest.env) == ["MARSHPY_MANIFEST_TEST"]
+    assert manifest.env["MARSHPY_MANIFEST_TEST"].value_hash != "value"
+    assert manifest.flags == {"flag": FlagDependency("flag", False)}
+
+    assert not manifest.has_changed([])
+    assert manifest.get_changes(["flag"]) == [FlagDependency("flag", False)]
+
+    monkeypatch.setenv("MARSHPY_MANIFEST_TEST", "other")
+    _touch(tmp_path / "imported.yaml", "modified")
+    _touch(tmp_path / "folder" / "other.yaml", "other")
+    assert manifest.has_changed()
+    assert manifest.get_changes() == [
+        manifest.env["MARSHPY_MANIFEST_TEST"],
+        manifest.files[str(tmp_path / "imported.yaml")],
+        manifest.globs[(str(tmp_path), "folder/*.yaml")],
+    ]
+
+
+def test_manifest_records_missing_imports(tmp_path: Path, engine: Engine) -> None:
+    """Files looked up by import tags should be recorded, even if missing."""
+    manifest = Manifest()
+    first_root = tmp_path / "first"
+    second_root = tmp_path / "second"
+    second_root.mkdir()
+    _touch(second_root / "file.yaml", "second")
+
+    result = load(
+        "imported: !import file.yaml",
+        _Object,
+        config=[manifest, PathHandler.Config(roots=[first_root, second_root])],
+        engine=engine,
+    )
+    assert isinstance(result, _Object)
+    assert result.imported == "second"  # type: ignore
+    assert manifest.files[str(first_root / "file.yaml")].signature is None
+    assert not manifest.has_changed()
+
+    first_root.mkdir()
+    _touch(first_root / "file.yaml", "first")
+    assert manifest.get_changes() == [
+        FileDependency(str(first_root / "file.yaml"), None, None)
+    ]
+
+
+def test_manifest_not_recorded_by_default(
+    tmp_path: Path, monkeypatch: MonkeyPatch, engine: Engine
+) -> None:
+    """Nothing should be recorded when no manifest is configured."""
+    (tmp_path / "folder").mkdir()
+    _touch(tmp_path / "folder" / "file.yaml", "globbed")
+    _touch(tmp_path / "imported.yaml", "imported")
+    _touch(
+        tmp_path / "main.yaml",
+        "imported: !import imported.yaml\n"
+        "globbed: !glob folder/*.yaml\n"
+        "env: !env MARSHPY_MANIFEST_TEST\n"
+        "flagged: !if(flag) flagged\n",
+    )
+    monkeypatch.setenv("MARSHPY_MANIFEST_TEST", "value")
+
+    def _fail(*__: Any) -> None:
+        assert False, "Nothing should be recorded."
+
+    for method in ["add_file", "add_missing_file", "add_glob", "add_env", "add_flag"]:
+        monkeypatch.setattr(Manifest, method, _fail)
+
+    with open(tmp_path / "main.yaml", "r", encoding="utf-8") as yaml_file:
+        result = load(
+            yaml_file,
+            _Object,
+            config=[PathHandler.Config(roots=[tmp_path / "missing", tmp_path])],
+            engine=engine,
+        )
+
+    assert isinstance(result, _Object)
+    assert getattr(result, "env") == "value"
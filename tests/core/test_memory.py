@@ -0,0 +1,41 @@
+"""Memory tracker tests."""
+from tracemalloc import is_tracing, start, stop
+
+from marshpy.core.constants import Engine
+from marshpy.core.memory import MemoryTracker
+from marshpy.fields.list_field import ListField
+from marshpy.fields.string_field import StringField
+from marshpy.loader import load
+
+
+def _load(item_count: int, tracker: MemoryTracker, engine: Engine) -> None:
+    source = "[" + ", ".join(f"item_{it}" for it in range(item_count)) + "]"
+    result = load(
+        source, root_field=ListField(StringField()), config=[tracker], engine=engine
+    )
+    assert isinstance(result, list) and len(result) == item_count
+
+
+def test_memory_tracker(engine: Engine) -> None:
+    """Memory tracker should measure the peak and retained memory of a load."""
+    tracker = MemoryTracker()
+    assert tracker.usage is None
+
+    _load(500, tracker, engine)
+    assert not is_tracing()
+    assert tracker.usage is not None
+    small = tracker.usage
+    assert 0 < small.retained < small.peak
+
+    _load(5_000, tracker, engine)
+    big = tracker.usage
+    assert big.retained > 5 * small.retained
+    assert big.peak > 5 * small.peak
+
+    start()
+    try:
+        _load(500, tracker, engine)
+        assert is_tracing()
+    finally:
+        stop()
+    assert tracker.usage.retained < big.retained
@@ -0,0 +1,87 @@
+"""YAML parsing backends tests."""
+from io import StringIO
+from typing import Any, List
+
+from pytest import mark, raises
+from yaml import MappingNode, Node, SequenceNode
+from yaml.parser import ParserError
+
+from marshpy.core.parsing import LIBYAML_AVAILABLE, compose
+
+_DOCUMENT = """\
+scalar: value
+tagged: !import some_file.yaml
+sequence:
+  - item_1
+  - !if(FLAG) [nested, items]
+mapping:
+  key: 10
+"""
+
+_requires_libyaml = mark.skipif(
+    not LIBYAML_AVAILABLE, reason="PyYAML was built without libyaml."
+)
+
+
+def _flatten(node: Node) -> List[Any]:
+    start = node.start_mark
+    end = node.end_mark
+    result: List[Any] = [
+        type(node),
+        node.tag,
+        (start.name, start.index, start.line, start.column),
+        (end.name, end.index, end.line, end.column),
+    ]
+
+    if isinstance(node, MappingNode):
+        for key, value in node.value:
+            result += _flatten(key) + _flatten(value)
+    elif isinstance(node, SequenceNode):
+        for item in node.value:
+            result += _flatten(item)
+    else:
+        result.append(node.value)
+
+    return result
+
+
+def test_compose() -> None:
+    """Compose should return the root node of the document, or None."""
+    node = compose(_DOCUMENT, use_libyaml=False)
+    assert isinstance(node, MappingNode)
+    assert node.value[1][1].tag == "!import"
+
+    assert compose("", use_libyaml=False) is None
+
+
+@_requires_libyaml
+def test_libyaml_backend_is_identical() -> None:
+    """Both backends should give the same tags and marks."""
+    python_node = compose(_DOCUMENT, use_libyaml=False)
+    libyaml_node = compose(_DOCUMENT, use_libyaml=True)
+    assert python_node is not None
+    assert libyaml_node is not None
+    assert _flatten(python_node) == _flatten(libyaml_node)
+
+    python_node = compose(StringIO(_DOCUMENT), use_libyaml=False)
+    libyaml_node = compose(StringIO(_DOCUMENT), use_libyaml=True)
+    assert python_node is not None
+    assert libyaml_node is not None
+    assert _flatten(python_node) == _flatten(libyaml_node)
+
+
+@_requires_libyaml
+def test_libyaml_backend_errors_are_identical() -> None:
+    """Both backends should report the same parse errors."""
+
+    def _get_error(source: Any, use_libyaml: bool) -> str:
+        with raises(ParserError) as error:
+            compose(source, use_libyaml=use_libyaml)
+        return str(error.value)
+
+    source = "key: [item_1, item_2"
+    assert _get_error(source, True) == _get_error(source, False)
+
+    stream = StringIO(source)
+    stream.read(3)
+    assert _get_error(stream, True) == _get_error(StringIO(source[3:]), False)
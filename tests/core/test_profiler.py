@@ -0,0 +1,105 @@
+"""Profiler tests."""
+from pathlib import Path
+from pstats import Stats
+from typing import Dict, List
+
+from marshpy.core.constants import Engine
+from marshpy.core.interfaces import IBaseField
+from marshpy.core.profiler import Profiler
+from marshpy.fields.int_field import IntField
+from marshpy.fields.list_field import ListField
+from marshpy.fields.object_field import ObjectField
+from marshpy.fields.string_field import StringField
+from marshpy.loader import load
+from marshpy.tag_handlers.path_handler import PathHandler
+
+
+class _Child:
+    value: int
+    fields: Dict[str, IBaseField] = {"value": IntField()}
+
+
+class _Parent:
+    children: List[_Child]
+    fields = {
+        "name": StringField(),
+        "children": ListField(ObjectField(object_class=_Child)),
+    }
+
+
+class _NamedChild(_Child):
+    name: str
+    fields: Dict[str, IBaseField] = {"name": StringField()}
+
+
+def test_profiler_field_owners(engine: Engine) -> None:
+    """Fields should be reported under the class declaring them."""
+    profiler = Profiler()
+
+    result = load(
+        "children:\n"
+        "- value: 1\n"
+        "- !type:tests.core.test_profiler._NamedChild { name: named, value: 2 }\n",
+        _Parent,
+        config=[profiler],
+        engine=engine,
+    )
+
+    assert isinstance(result, _Parent)
+    assert type(result.children[1]).__qualname__ == "_NamedChild"
+    report = profiler.report()
+    assert {key: stats.calls for key, stats in report.by_field.items()} == {
+        ("_Parent", "children"): 1,
+        ("_Child", "value"): 2,
+        ("_NamedChild", "name"): 1,
+    }
+
+
+def test_profiler(tmp_path: Path, engine: Engine) -> None:
+    """Profiler should time loads by field type, field and tag handler."""
+    (tmp_path / "child.yaml").write_text("value: 3", encoding="utf-8")
+    profiler = Profiler()
+
+    result = load(
+        "name: parent\n"
+        "children:\n"
+        "- value: 1\n"
+        "- value: 2\n"
+        "- !import child.yaml\n",
+        _Parent,
+        config=[profiler, PathHandler.Config(roots=[tmp_path])],
+        engine=engine,
+    )
+
+    assert isinstance(result, _Parent)
+    assert [it.value for it in result.children] == [1, 2, 3]
+    report = profiler.report()
+    # Object keys and the imported path are loaded as strings too.
+    assert {key: stats.calls for key, stats in report.by_field_type.items()} == {
+        "ObjectField": 5,
+        "StringField": 6,
+        "ListField": 1,
+        "IntField": 3,
+    }
+    assert {key: stats.calls for key, stats in report.by_field.items()} == {
+        ("_Parent", "name"): 1,
+        ("_Parent", "children"): 1,
+        ("_Child", "value"): 3,
+    }
+    assert list(report.by_tag_handler) == ["ImportHandler"]
+    for stats in report.by_field_type.values():
+        assert 0 <= stats.exclusive <= stats.inclusive
+
+    root = report.by_field_type["ObjectField"]
+    children = report.by_field[("_Parent", "children")]
+    assert children.inclusive <= root.inclusive
+    assert "_Child.value" in report.format()
+
+    stats_path = tmp_path / "load.prof"
+    profiler.dump_stats(stats_path)
+    pstats = Stats(str(stats_path)).stats  # type: ignore
+    assert pstats[("marshpy", 0, "_Child.value")][:2] == (3, 3)
+    assert ("marshpy", 0, "!ImportHandler") in pstats
+
+    profiler.clear()
+    assert not profiler.report().by_field_type
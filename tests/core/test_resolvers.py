@@ -1,5 +1,10 @@
 """Custom resolvers test."""
-from marshpy import ANNOTATION_RESOLVER_CONFIG, load
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+from marshpy import ANNOTATION_RESOLVER_CONFIG, annotation_fields_resolver, load
+from marshpy.core.resolvers import clear_annotation_cache, get_annotation_field
 
 
 class _AnnotatedType:
@@ -22,3 +27,72 @@ def test_annotation_resolver() -> None:
     assert isinstance(result, _AnnotatedType)
     assert result.list_field == ["item_1", "item_2"]
     assert result.dict_field == {"key_1": "item_1", "key_2": "item_2"}
+
+
+class _Color(Enum):
+    RED = 1
+    GREEN = 2
+
+
+class _Child:
+    color: _Color
+    path: Optional[Path]
+
+
+class _Parent:
+    children: list[dict[str, _Child]]
+    name: Optional[str] = None
+
+
+def test_annotation_resolver_types(tmp_path: Path) -> None:
+    """Optional, enums, paths and nested generics should be resolved."""
+    yaml_string = f"""
+    children:
+      - first: {{ color: RED, path: {tmp_path} }}
+        second: {{ color: GREEN }}
+    name: parent
+    """
+
+    result = load(yaml_string, _Parent, config=[ANNOTATION_RESOLVER_CONFIG])
+
+    assert isinstance(result, _Parent)
+    assert result.name == "parent"
+    first = result.children[0]["first"]
+    assert first.color == _Color.RED
+    assert first.path == tmp_path
+    assert result.children[0]["second"].color == _Color.GREEN
+    assert not hasattr(result.children[0]["second"], "path")
+
+
+def test_annotation_resolver_cache() -> None:
+    """Fields should be resolved once per class and annotation."""
+    fields = annotation_fields_resolver(_Parent())
+    assert annotation_fields_resolver(_Parent()) is fields
+    assert fields["name"] is get_annotation_field(str)
+    assert get_annotation_field(list[str]) is get_annotation_field(list[str])
+
+    clear_annotation_cache()
+    assert annotation_fields_resolver(_Parent()) is not fields
+
+
+class _NamedParent(_Parent):
+    nickname: str
+
+
+class _UnannotatedParent(_Parent):
+    pass
+
+
+def test_annotation_resolver_inheritance() -> None:
+    """Only the annotations of the nearest annotated class should be used."""
+    assert set(annotation_fields_resolver(_NamedParent())) == {"nickname"}
+    assert set(annotation_fields_resolver(_UnannotatedParent())) == {
+        "children",
+        "name",
+    }
+
+
+def test_annotation_resolver_config_caches_schemas() -> None:
+    """Schemas of annotated classes should be resolved once."""
+    first = ANNOTATION_RESOLVER_CONFIG.get_schema(_NamedParent())
+    assert ANNOTATION_RESOLVER_CONFIG.get_schema(_NamedParent()) is first
@@ -0,0 +1,141 @@
+"""Root index tests."""
+from os import scandir, utime
+from pathlib import Path
+from time import time_ns
+from typing import Any, Iterable, Optional
+
+from pytest import MonkeyPatch
+
+from marshpy.core import root_index
+from marshpy.core.constants import Engine
+from marshpy.core.manifest import Manifest
+from marshpy.core.root_index import RootIndex
+from marshpy.core.stat_cache import StatCache
+from marshpy.fields.int_field import IntField
+from marshpy.fields.list_field import ListField
+from marshpy.loader import load
+from marshpy.tag_handlers.path_handler import PathHandler
+
+
+def _set_old_mtime(path: Path, age: int) -> None:
+    mtime = time_ns() - age * 1_000_000_000
+    utime(path, ns=(mtime, mtime))
+
+
+def test_root_index(tmp_path: Path) -> None:
+    """Root index should find files in the first root containing them."""
+    roots = [tmp_path / f"root_{it}" for it in range(10)]
+    for root in roots:
+        (root / "sub").mkdir(parents=True)
+    (roots[7] / "sub" / "file.yaml").write_text("value", encoding="utf-8")
+    (roots[9] / "sub" / "file.yaml").write_text("value", encoding="utf-8")
+    for root in roots:
+        _set_old_mtime(root / "sub", 10)
+
+    index = RootIndex()
+
+    def _find(relative_path: str) -> Optional[Path]:
+        stat_cache = StatCache()
+        path = index.find(roots, Path(relative_path), stat_cache)
+        assert stat_cache.hits == 0
+        return path
+
+    assert _find("sub/file.yaml") == roots[7] / "sub" / "file.yaml"
+    assert index.misses == 8 and index.hits == 0
+    assert _find("sub/file.yaml") == roots[7] / "sub" / "file.yaml"
+    assert index.misses == 8 and index.hits == 8
+    assert _find("sub/missing.yaml") is None
+    assert index.misses == 10 and index.hits == 16
+    assert _find("missing/file.yaml") is None
+    assert index.misses == 10 and index.hits == 16
+
+    (roots[3] / "sub" / "file.yaml").write_text("value", encoding="utf-8")
+    _set_old_mtime(roots[3] / "sub", 5)
+    assert _find("sub/file.yaml") == roots[3] / "sub" / "file.yaml"
+    assert index.misses == 11 and index.hits == 19
+
+    # Recently modified directories aren't indexed.
+    (roots[0] / "sub" / "file.yaml").write_text("value", encoding="utf-8")
+    assert _find("sub/file.yaml") == roots[0] / "sub" / "file.yaml"
+    assert _find("sub/file.yaml") == roots[0] / "sub" / "file.yaml"
+    assert index.misses == 13 and index.hits == 19
+
+    index.clear()
+    assert index.misses == 0 and index.hits == 0
+
+
+def test_root_index_records_missing_files(tmp_path: Path, engine: Engine) -> None:
+    """Files missing in roots before the found one should be recorded."""
+    roots = [tmp_path / f"root_{it}" for it in range(3)]
+    for root in roots:
+        root.mkdir()
+    (roots[1] / "file.yaml").write_text("value", encoding="utf-8")
+    manifest = Manifest()
+
+    result = load(
+        "!import file.yaml",
+        str,
+        config=[manifest, PathHandler.Config(roots=roots, root_index=RootIndex())],
+        engine=engine,
+    )
+
+    assert result == "value"
+    assert list(manifest.files) == [
+        str(roots[0] / "file.yaml"),
+        str(roots[1] / "file.yaml"),
+    ]
+    assert not manifest.has_changed()
+
+    (roots[0] / "file.yaml").write_text("value", encoding="utf-8")
+    assert manifest.has_changed()
+
+
+def test_root_index_lists_recent_directories_once_per_load(
+    tmp_path: Path, engine: Engine, monkeypatch: MonkeyPatch
+) -> None:
+    """Recently modified directories should be listed once per load."""
+    for index in range(20):
+        (tmp_path / f"item_{index}.yaml").write_text(str(index), encoding="utf-8")
+
+    scandir_calls = []
+
+    def _scandir(path: str) -> Any:
+        scandir_calls.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(root_index, "scandir", _scandir)
+    config = [PathHandler.Config(roots=[tmp_path], root_index=RootIndex())]
+    source = "\n".join(f"- !import item_{it}.yaml" for it in range(20))
+
+    result = load(
+        source, root_field=ListField(IntField()), config=config, engine=engine
+    )
+    assert result == list(range(20))
+    assert scandir_calls == [str(tmp_path)]
+
+    # Each load uses its own stat cache, the directory is listed again.
+    load(source, root_field=ListField(IntField()), config=config, engine=engine)
+    assert scandir_calls == [str(tmp_path)] * 2
+
+
+def test_root_index_case_insensitive_names(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Files listed under a name differing by case should be checked."""
+    (tmp_path / "file.yaml").write_text("value", encoding="utf-8")
+    list_files = root_index._list_files  # pylint: disable=protected-access
+
+    def _list_upper_files(directory: str) -> Iterable[str]:
+        # As a case-insensitive file system listing a file created as
+        # FILE.YAML, that can still be opened as file.yaml.
+        return [it.upper() for it in list_files(directory)]
+
+    monkeypatch.setattr(root_index, "_list_files", _list_upper_files)
+    index = RootIndex()
+    found = index.find([tmp_path], Path("file.yaml"), StatCache())
+    assert found == tmp_path / "file.yaml"
+
+    # Names differing by case are found only if the file system opens them.
+    expected = tmp_path / "File.yaml"
+    found = index.find([tmp_path], Path("File.yaml"), StatCache())
+    assert found == (expected if expected.exists() else None)
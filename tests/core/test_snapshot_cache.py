@@ -0,0 +1,190 @@
+"""Snapshot cache tests."""
+from os import stat, utime
+from pathlib import Path
+from typing import Any, List, Tuple
+
+from pytest import MonkeyPatch
+from yaml import Node
+
+from marshpy.core.constants import Engine
+from marshpy.core.errors import ErrorCode
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.manifest import Manifest
+from marshpy.core.memory import MemoryTracker
+from marshpy.core.snapshot_cache import SnapshotCache
+from marshpy.fields.list_field import ListField
+from marshpy.fields.object_field import ObjectField
+from marshpy.fields.string_field import StringField
+from marshpy.loader import load
+from marshpy.tag_handlers.if_handler import IfHandler
+from marshpy.tag_handlers.path_handler import PathHandler
+from marshpy.tag_handlers.tag_handler import TagHandler
+from tests.helpers import FailTagHandler
+
+_LOADED_OBJECTS: List[Any] = []
+
+
+class _Object:
+    fields = {
+        "imported": StringField(),
+        "globbed": ListField(StringField()),
+        "env": StringField(),
+        "flagged": StringField(),
+    }
+
+    def post_load(self) -> None:
+        """Count loaded objects."""
+        _LOADED_OBJECTS.append(self)
+
+
+_SOURCE = """
+imported: !try-import imported.yaml
+globbed: !glob folder/*.yaml
+env: !env MARSHPY_SNAPSHOT_TEST
+flagged: !if(flag) flagged
+"""
+
+
+def _touch(path: Path, content: str) -> None:
+    path.write_text(content, encoding="utf-8")
+    mtime = stat(path).st_mtime_ns + 1_000_000_000
+    utime(path, ns=(mtime, mtime))
+
+
+def test_snapshot_cache(
+    tmp_path: Path, monkeypatch: MonkeyPatch, engine: Engine
+) -> None:
+    """Snapshots should be returned until a dependency changes."""
+    root = tmp_path / "root"
+    (root / "folder").mkdir(parents=True)
+    _touch(root / "folder" / "file_1.yaml", "file_1")
+    monkeypatch.delenv("MARSHPY_SNAPSHOT_TEST", raising=False)
+    cache = SnapshotCache(tmp_path / "cache")
+
+    def _load(flags: List[str]) -> Any:
+        _LOADED_OBJECTS.clear()
+        result = load(
+            _SOURCE,
+            _Object,
+            config=[PathHandler.Config(roots=[root]), IfHandler.Config(flags)],
+            engine=engine,
+            snapshot_cache=cache,
+        )
+        assert isinstance(result, _Object)
+        return result, len(_LOADED_OBJECTS) != 0
+
+    def _check(flags: List[str], loaded: bool, expected: List[Any]) -> None:
+        result, was_loaded = _load(flags)
+        assert was_loaded == loaded
+        values = [getattr(result, it, None) for it in _Object.fields]
+        assert values == expected
+
+    _check([], True, [None, ["file_1"], None, None])
+    _check([], False, [None, ["file_1"], None, None])
+
+    _touch(root / "imported.yaml", "imported")
+    _check([], True, ["imported", ["file_1"], None, None])
+    _check([], False, ["imported", ["file_1"], None, None])
+
+    _touch(root / "imported.yaml", "modified")
+    _check([], True, ["modified", ["file_1"], None, None])
+
+    _touch(root / "folder" / "file_2.yaml", "file_2")
+    _check([], True, ["modified", ["file_1", "file_2"], None, None])
+
+    monkeypatch.setenv("MARSHPY_SNAPSHOT_TEST", "env")
+    _check([], True, ["modified", ["file_1", "file_2"], "env", None])
+    _check([], False, ["modified", ["file_1", "file_2"], "env", None])
+
+    _check(["flag"], True, ["modified", ["file_1", "file_2"], "env", "flagged"])
+    _check(["flag"], False, ["modified", ["file_1", "file_2"], "env", "flagged"])
+    _check([], False, ["modified", ["file_1", "file_2"], "env", None])
+
+
+def test_snapshot_cache_fallbacks(tmp_path: Path, engine: Engine) -> None:
+    """Corrupted snapshots, errors and unpicklable values should be ignored."""
+    cache = SnapshotCache(tmp_path)
+
+    def _load(source: str, object_class: Any = _Object, **kwargs: Any) -> Any:
+        _LOADED_OBJECTS.clear()
+        load(source, object_class, engine=engine, snapshot_cache=cache, **kwargs)
+        return len(_LOADED_OBJECTS) != 0
+
+    assert _load("imported: value")
+    for snapshot_path in tmp_path.iterdir():
+        snapshot_path.write_bytes(b"corrupted")
+    assert _load("imported: value")
+    assert not _load("imported: value")
+
+    errors = []
+
+    def _error_handler(node: Node, code: ErrorCode, message: str) -> None:
+        errors.append(code)
+
+    assert _load("imported: value\nunknown: value", error_handler=_error_handler)
+    assert _load("imported: value\nunknown: value", error_handler=_error_handler)
+    assert errors == [ErrorCode.FIELD_NOT_DECLARED] * 2
+
+    class _LocalObject(_Object):
+        pass
+
+    assert _load("imported: value", _LocalObject)
+    assert _load("imported: value", _LocalObject)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    assert not _load("imported: value", root_field=ObjectField(_Object))
+    assert _load("[{ imported: value }]", root_field=ListField(ObjectField(_Object)))
+
+
+def test_snapshot_cache_key(tmp_path: Path, engine: Engine) -> None:
+    """Tag handler types and roots should be part of snapshot keys."""
+    cache = SnapshotCache(tmp_path / "cache")
+    roots = [tmp_path / f"root_{it}" for it in range(2)]
+    for index, root in enumerate(roots):
+        root.mkdir()
+        (root / "imported.yaml").write_text(f"root_{index}", encoding="utf-8")
+
+    def _load(root: Path, tag_handlers: List[TagHandler]) -> Any:
+        return load(
+            "!import imported.yaml",
+            str,
+            tag_handlers=tag_handlers,
+            config=[PathHandler.Config(roots=[root])],
+            engine=engine,
+            snapshot_cache=cache,
+        )
+
+    assert _load(roots[0], []) == "root_0"
+    assert _load(roots[1], []) == "root_1"
+    assert _load(roots[0], [FailTagHandler()]) == "root_0"
+    assert len(list((tmp_path / "cache").iterdir())) == 3
+
+
+def test_snapshot_cache_replays_records(tmp_path: Path, engine: Engine) -> None:
+    """Snapshot hits should fill the configured manifest, stats and tracker."""
+    cache = SnapshotCache(tmp_path / "cache")
+    (tmp_path / "imported.yaml").write_text("imported", encoding="utf-8")
+
+    def _load() -> Tuple[Manifest, LoadStats, MemoryTracker]:
+        manifest = Manifest()
+        stats = LoadStats()
+        tracker = MemoryTracker()
+        result = load(
+            "imported: !import imported.yaml",
+            _Object,
+            config=[PathHandler.Config(roots=[tmp_path]), manifest, stats, tracker],
+            engine=engine,
+            snapshot_cache=cache,
+        )
+        assert getattr(result, "imported") == "imported"
+        return manifest, stats, tracker
+
+    loaded_manifest, loaded_stats, __ = _load()
+    manifest, stats, tracker = _load()
+
+    assert list(manifest.files) == list(loaded_manifest.files)
+    assert list(manifest.files) == [str(tmp_path / "imported.yaml")]
+    assert stats.objects == loaded_stats.objects == 1
+    assert stats.cache_hits["snapshot"] == 1
+    assert loaded_stats.cache_misses["snapshot"] == 1
+    assert tracker.usage is not None
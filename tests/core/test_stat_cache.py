@@ -0,0 +1,62 @@
+"""Stat cache tests."""
+from pathlib import Path
+from time import sleep
+
+from marshpy.core.constants import Engine
+from marshpy.core.stat_cache import StatCache
+from marshpy.fields.dict_field import DictField
+from marshpy.fields.path_field import PathField
+from marshpy.fields.string_field import StringField
+from marshpy.loader import load
+from marshpy.tag_handlers.path_handler import PathHandler
+
+
+def test_stat_cache(tmp_path: Path, engine: Engine) -> None:
+    """Path fields and handlers should share the stat cache of the load."""
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+    (tmp_path / "second" / "file.yaml").write_text("value", encoding="utf-8")
+    (tmp_path / "main.yaml").write_text(
+        "\n".join(f"key_{it}: !import file.yaml" for it in range(4)),
+        encoding="utf-8",
+    )
+    stat_cache = StatCache()
+    config = [
+        stat_cache,
+        PathHandler.Config(roots=[tmp_path / "first", tmp_path / "second"]),
+    ]
+
+    with open(tmp_path / "main.yaml", "r", encoding="utf-8") as yaml_file:
+        result = load(
+            yaml_file, root_field=DictField(StringField()), config=config, engine=engine
+        )
+
+    assert result == {f"key_{it}": "value" for it in range(4)}
+    # The document directory and the two roots are stat'ed once.
+    assert stat_cache.misses == 3
+    assert stat_cache.hits == 13
+
+    stat_cache.clear()
+    result = load(
+        "{ first: ., second: . }",
+        root_field=DictField(PathField()),
+        config=[stat_cache],
+        engine=engine,
+    )
+    assert result == {"first": Path("."), "second": Path(".")}
+    assert stat_cache.misses == 1 and stat_cache.hits == 3
+
+
+def test_stat_cache_ttl(tmp_path: Path) -> None:
+    """Stat results should be refreshed after the time to live."""
+    path = tmp_path / "file.yaml"
+    stat_cache = StatCache(ttl=0.05)
+
+    assert not stat_cache.exists(path)
+    path.write_text("value", encoding="utf-8")
+    assert not stat_cache.is_file(path)
+    sleep(0.1)
+    assert stat_cache.is_file(path)
+    assert not stat_cache.is_dir(path)
+    assert stat_cache.is_dir(tmp_path)
+    assert stat_cache.hits == 2 and stat_cache.misses == 3
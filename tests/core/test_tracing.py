@@ -0,0 +1,92 @@
+"""Tracing tests."""
+from json import load as load_json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from marshpy.core.constants import Engine
+from marshpy.core.tracing import ChromeTracer
+from marshpy.fields.dict_field import DictField
+from marshpy.fields.list_field import ListField
+from marshpy.fields.string_field import StringField
+from marshpy.loader import load
+from marshpy.tag_handlers.path_handler import PathHandler
+
+
+def _get_spans(events: List[Dict[str, Any]]) -> List[Any]:
+    spans = []
+    stack: List[Dict[str, Any]] = []
+    for event in events:
+        if event["ph"] == "B":
+            stack.append(event)
+            continue
+
+        assert event["ph"] == "E"
+        begin = stack.pop()
+        assert (begin["name"], begin["cat"]) == (event["name"], event["cat"])
+        assert begin["ts"] <= event["ts"]
+        spans.append((len(stack), event["cat"], begin["name"], event["args"]))
+
+    assert not stack
+    return spans
+
+
+def test_chrome_tracer(tmp_path: Path, engine: Engine) -> None:
+    """Chrome tracer should record file loads, globs and tag handler calls."""
+    (tmp_path / "folder").mkdir()
+    (tmp_path / "folder" / "a.yaml").write_text("a", encoding="utf-8")
+    (tmp_path / "folder" / "b.yaml").write_text("b", encoding="utf-8")
+    (tmp_path / "imported.yaml").write_text("[c, d]", encoding="utf-8")
+    tracer = ChromeTracer()
+
+    result = load(
+        "globbed: !glob folder/*.yaml\nimported: !import imported.yaml",
+        root_field=DictField(ListField(StringField())),
+        config=[tracer, PathHandler.Config(roots=[tmp_path])],
+        engine=engine,
+    )
+
+    assert result == {"globbed": ["a", "b"], "imported": ["c", "d"]}
+    spans = _get_spans(tracer.events)
+    a_path = str(tmp_path / "folder" / "a.yaml")
+    imported_path = str(tmp_path / "imported.yaml")
+    assert (2, "glob", "folder/*.yaml", {"files": 2}) in spans
+    assert (3, "compose", a_path, {"bytes": 1, "nodes": 1}) in spans
+    assert (3, "compose", imported_path, {"bytes": 6, "nodes": 3}) in spans
+    assert (2, "file", imported_path, {}) in spans
+    assert [it[2] for it in spans if it[1] == "tag"] == ["!glob", "!import"]
+
+    # Composed files are cached, so they aren't composed again.
+    tracer.clear()
+    load(
+        "!import imported.yaml",
+        root_field=ListField(StringField()),
+        config=[tracer, PathHandler.Config(roots=[tmp_path])],
+    )
+    assert [it[1] for it in _get_spans(tracer.events)] == ["file", "tag", "document"]
+
+    trace_path = tmp_path / "trace.json"
+    tracer.write(trace_path)
+    with open(trace_path, "r", encoding="utf-8") as trace_file:
+        assert load_json(trace_file)["traceEvents"] == tracer.events
+
+
+def test_chrome_tracer_root_file(tmp_path: Path, engine: Engine) -> None:
+    """Documents loaded from files should be traced as imported files."""
+    root_path = tmp_path / "root.yaml"
+    root_path.write_text("[a, b]", encoding="utf-8")
+    tracer = ChromeTracer()
+
+    with open(root_path, "r", encoding="utf-8") as root_file:
+        result = load(
+            root_file,
+            root_field=ListField(StringField()),
+            config=[tracer],
+            engine=engine,
+        )
+
+    assert result == ["a", "b"]
+    spans = _get_spans(tracer.events)
+    assert (1, "file", str(root_path), {}) in spans
+    compose_args = next(it[3] for it in spans if it[1] == "compose")
+    assert compose_args["bytes"] == 6
+    assert spans[-1][:3] == (0, "document", str(root_path))
@@ -1,7 +1,23 @@
 """Yaml object loading tests."""
-from marshpy.core.errors import ErrorCode
+import pickle
+from typing import Any
+
+from pytest import raises
+
+from marshpy.core.constants import Engine
+from marshpy.core.errors import (
+    ErrorCode,
+    MissingRequiredFieldError,
+    UnexpectedNodeTypeError,
+)
+from marshpy.core.lazy import LazyValue
 from marshpy.core.validation import ValidationContext
+from marshpy.fields.base_field import BaseField
+from marshpy.fields.dict_field import DictField
+from marshpy.fields.list_field import ListField
+from marshpy.fields.object_field import ObjectField
 from marshpy.fields.string_field import StringField
+from marshpy.loader import load
 from tests.helpers import check_field_error
 
 
@@ -16,3 +32,39 @@ def test_field_validation() -> None:
         fields = {"field": StringField(validate=_validate)}
 
     check_field_error(_Test, "field", "value", ErrorCode.VALIDATION_ERROR)
+
+
+def test_lazy_fields(engine: Engine) -> None:
+    """Lazy fields should be loaded and validated on first access."""
+
+    class _Child:
+        fields = {"field": StringField(required=True)}
+
+    class _Test:
+        fields = {
+            "child": ObjectField(_Child, lazy=True),
+            "list": ListField(ObjectField(_Child), lazy=True),
+            "dict": DictField(StringField(), lazy=True),
+        }
+
+    def _load(source: str, eager: bool = False) -> Any:
+        return load(source, _Test, config=[BaseField.Config(eager)], engine=engine)
+
+    result = _load("child: { field: value }\nlist: [{ field: item }]\ndict: { a: b }")
+    assert isinstance(result.child, LazyValue)
+    assert not result.child.is_loaded
+    assert result.child.field == "value"
+    assert result.child.is_loaded
+    assert isinstance(result.child.materialize(), _Child)
+    assert result.list[0].field == "item"
+    assert len(result.dict) == 1 and result.dict["a"] == "b"
+    assert pickle.loads(pickle.dumps(result.dict)) == {"a": "b"}
+
+    result = _load("child: {}\nlist: scalar")
+    with raises(MissingRequiredFieldError):
+        result.child.materialize()
+    with raises(UnexpectedNodeTypeError):
+        len(result.list)
+
+    with raises(MissingRequiredFieldError):
+        _load("child: {}", eager=True)
@@ -1,10 +1,13 @@
 """Dictionary field tests."""
 from typing import Dict, Optional
 
+from marshpy.core.constants import UNDEFINED
 from marshpy.core.errors import ErrorCode
+from marshpy.core.lazy import LazyMapping
+from marshpy.core.validation import ValidationContext
 from marshpy.fields.dict_field import DictField
 from marshpy.fields.string_field import StringField
-from tests.helpers import check_field, check_field_error
+from tests.helpers import check_field, check_field_error, check_load
 
 
 class _Test:
@@ -37,3 +40,23 @@ def test_dict_field_error_handling() -> None:
     """Dict field should correctly handle errors."""
     _check_field_error("scalar_value", ErrorCode.UNEXPECTED_NODE_TYPE)
     _check_field_error("[a, list]", ErrorCode.UNEXPECTED_NODE_TYPE)
+
+
+def test_dict_field_view() -> None:
+    """Dict views should load values when they are read."""
+    loaded_values = []
+
+    def _validate(__: ValidationContext, value: str) -> None:
+        loaded_values.append(value)
+
+    field = DictField(StringField(validate=_validate), view=True)
+    result = check_load("{key_1: value_1, key_2: !fail value_2}", field=field)
+
+    assert isinstance(result, LazyMapping)
+    assert len(result) == 2 and "key_1" in result and "key_3" not in result
+    assert list(result) == ["key_1", "key_2"]
+    assert len(loaded_values) == 0
+    assert result["key_1"] == "value_1" and result.get("key_3") is None
+    assert result["key_2"] is UNDEFINED
+    assert dict(result) == {"key_1": "value_1", "key_2": UNDEFINED}
+    assert loaded_values == ["value_1"]
@@ -1,10 +1,15 @@
 """List field tests."""
-from typing import List, Optional
+import pickle
+from typing import Any, List, Optional
 
+from marshpy.core.constants import UNDEFINED
 from marshpy.core.errors import ErrorCode
+from marshpy.core.lazy import LazySequence
+from marshpy.core.validation import ValidationContext
+from marshpy.fields.base_field import BaseField
 from marshpy.fields.list_field import ListField
 from marshpy.fields.string_field import StringField
-from tests.helpers import check_field, check_field_error
+from tests.helpers import check_field, check_field_error, check_load
 
 
 class _Test:
@@ -36,3 +41,39 @@ def test_list_field_error_handling() -> None:
     """List field should correctly handle errors."""
     _check_field_error("scalar_value", ErrorCode.UNEXPECTED_NODE_TYPE)
     _check_field_error("{a, dict}", ErrorCode.UNEXPECTED_NODE_TYPE)
+
+
+def test_list_field_view() -> None:
+    """List views should load items when they are read."""
+    loaded_values = []
+
+    def _validate(__: ValidationContext, value: str) -> None:
+        loaded_values.append(value)
+
+    def _load(cache_items: bool = True, eager: bool = False) -> Any:
+        field = ListField(
+            StringField(validate=_validate), view=True, cache_items=cache_items
+        )
+        loaded_values.clear()
+        return check_load(
+            "[item_1, !fail item_2, item_3]",
+            field=field,
+            config=[BaseField.Config(eager)],
+        )
+
+    result = _load()
+    assert isinstance(result, LazySequence)
+    assert len(result) == 3 and len(loaded_values) == 0
+    assert result[2] == "item_3" and result[-1] == "item_3"
+    assert result[1] is UNDEFINED
+    assert loaded_values == ["item_3"]
+    assert list(result) == ["item_1", UNDEFINED, "item_3"]
+    assert result[:1] == ["item_1"]
+    assert loaded_values == ["item_3", "item_1"]
+    assert pickle.loads(pickle.dumps(result)) == ["item_1", UNDEFINED, "item_3"]
+
+    result = _load(cache_items=False)
+    assert result[0] == result[0]
+    assert loaded_values == ["item_1", "item_1"]
+
+    assert _load(eager=True) == ["item_1", "item_3"]
@@ -1,9 +1,11 @@
 """Object field tests."""
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from marshpy.core.errors import ErrorCode
+from marshpy.core.interfaces import IBaseField
 from marshpy.core.validation import ValidationContext
 from marshpy.fields.bool_field import BoolField
+from marshpy.fields.list_field import ListField
 from marshpy.fields.object_field import ObjectField
 from marshpy.fields.string_field import StringField
 from tests.helpers import check_field_error, check_load
@@ -145,3 +147,62 @@ def test_object_field_error_handling() -> None:
 
     # obj = check_load('{ }', _NoFields, ErrorCode.SCHEMA_ERROR)
     # assert obj == UNDEFINED
+
+
+def test_object_field_schema_cache() -> None:
+    """Fields and hooks should be resolved once per class."""
+    resolved_classes = []
+
+    def _fields_resolver(obj: Any) -> Dict[str, IBaseField]:
+        resolved_classes.append(obj.__class__)
+        return dict(getattr(obj, "fields"))
+
+    class _Parent:
+        fields = {"children": ListField(ObjectField(_Simple))}
+
+    def _load(config: ObjectField.Config) -> None:
+        check_load(
+            "children: [{ field: value_1 }, { field: value_2 }]",
+            _Parent,
+            config=[config],
+        )
+
+    config = ObjectField.Config(fields_resolver=_fields_resolver, cache_schemas=True)
+    _load(config)
+    _load(config)
+    assert resolved_classes == [_Parent, _Simple]
+
+    config.invalidate(_Simple)
+    _load(config)
+    assert resolved_classes == [_Parent, _Simple, _Simple]
+
+    config.invalidate()
+    _load(config)
+    assert resolved_classes == [_Parent, _Simple, _Simple, _Parent, _Simple]
+
+    resolved_classes.clear()
+    _load(ObjectField.Config(fields_resolver=_fields_resolver, cache_schemas=False))
+    assert resolved_classes == [_Parent, _Simple, _Simple]
+
+    # Custom resolvers may depend on objects, schemas aren't cached by default.
+    resolved_classes.clear()
+    _load(ObjectField.Config(fields_resolver=_fields_resolver))
+    assert resolved_classes == [_Parent, _Simple, _Simple]
+
+
+def test_object_field_schema_cache_invalidates_subclasses() -> None:
+    """Invalidating a class should drop the schemas of its subclasses."""
+
+    class _Base:
+        fields = {"field": StringField()}
+
+    class _Child(_Base):
+        pass
+
+    config = ObjectField.Config()
+    check_load("{ field: value }", _Child, config=[config])
+    assert config.get_schema(_Child()).fields.keys() == {"field"}
+
+    _Base.fields = {"other_field": StringField()}
+    config.invalidate(_Base)
+    assert config.get_schema(_Child()).fields.keys() == {"other_field"}
@@ -1,16 +1,25 @@
 """Test helpers."""
 from typing import IO, Any, List, Optional, Type, Union
 
-from yaml import Node, compose
+from yaml import Node
 
-from marshpy.core.constants import UNDEFINED
+from marshpy.core.constants import UNDEFINED, Engine
 from marshpy.core.errors import ErrorCode
+from marshpy.core.event_loading_context import EventLoadingContext
 from marshpy.core.interfaces import IBaseField, ILoadingContext
 from marshpy.core.loading_context import LoadingContext
 from marshpy.fields.base_field import BaseField
 from marshpy.fields.object_field import ObjectField
 from marshpy.tag_handlers.tag_handler import TagHandler
 
+# Engine used by check_load, set for each test by the engine fixture.
+ENGINE = Engine.TREE
+
+_CONTEXT_TYPES = {
+    Engine.TREE: LoadingContext,
+    Engine.EVENTS: EventLoadingContext,
+}
+
 
 def check_field(
     object_class: Type[Any], field_name: str, field_value: str, expected_value: Any
@@ -59,14 +68,13 @@ def check_load(
         assert expected_error is not None
         assert code == expected_error
 
-    context = LoadingContext(_handler, tag_handlers, config=config)
-    node = compose(source)
+    context = _CONTEXT_TYPES[ENGINE](_handler, tag_handlers, config=config)
 
     if field is None:
         assert object_class is not None
         field = ObjectField(object_class=object_class)
 
-    result = context.load(field, node, str(location))
+    result = context.load_document(field, source, str(location))
 
     if expected_error is not None:
         assert handler_called
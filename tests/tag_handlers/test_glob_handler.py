@@ -1,8 +1,17 @@
 """Glob tag handler tests."""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from os import stat_result
 from pathlib import Path
+from typing import Any, List
 
+from pytest import MonkeyPatch
+from yaml import Node
+
+from marshpy.core.document_cache import DocumentCache
 from marshpy.core.errors import ErrorCode
+from marshpy.loader import load
 from marshpy.tag_handlers.glob_handler import GlobHandler
+from marshpy.tag_handlers.path_handler import PathHandler
 from tests.tag_handlers.path_handler_helpers import check_path_tag, check_path_tag_error
 
 
@@ -41,3 +50,66 @@ def test_glob_tag_handler_error_handling(datadir: Path) -> None:
         roots=[datadir],
         expected_value=[],
     )
+
+
+def test_glob_tag_handler_executor(tmp_path: Path) -> None:
+    """Glob tag should compose files concurrently, keeping glob order."""
+    for index in range(20):
+        (tmp_path / f"file_{index}.yaml").write_text(f"value_{index}", "utf-8")
+    (tmp_path / "file_error.yaml").write_text("[value", "utf-8")
+
+    def _load(config: GlobHandler.Config) -> Any:
+        errors = []
+
+        def _handler(node: Node, code: ErrorCode, message: str) -> None:
+            errors.append((node.start_mark.name, code, message))
+
+        result = load(
+            "!glob file_*.yaml",
+            list,
+            error_handler=_handler,
+            config=[
+                PathHandler.Config(roots=[tmp_path], document_cache=DocumentCache()),
+                config,
+            ],
+        )
+        return result, errors
+
+    expected = _load(GlobHandler.Config())
+    assert len(expected[0]) == 20
+    assert len(expected[1]) == 1
+
+    with ThreadPoolExecutor(4) as executor:
+        assert _load(GlobHandler.Config(executor)) == expected
+        assert _load(GlobHandler.Config(executor, serial_threshold=100)) == expected
+
+    with ProcessPoolExecutor(2) as process_executor:
+        assert _load(GlobHandler.Config(process_executor)) == expected
+
+
+def test_glob_tag_handler_stats_files_once(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Globbed files should be stat'ed once, document cache check included."""
+    for index in range(4):
+        (tmp_path / f"file_{index}.yaml").write_text(f"value_{index}", "utf-8")
+    stat_calls: List[Path] = []
+    path_stat = Path.stat
+
+    def _stat(path: Path, **kwargs: Any) -> stat_result:
+        stat_calls.append(path)
+        return path_stat(path, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", _stat)
+    with ThreadPoolExecutor(2) as executor:
+        result = load(
+            "!glob file_*.yaml",
+            list,
+            config=[
+                PathHandler.Config(roots=[tmp_path], document_cache=DocumentCache()),
+                GlobHandler.Config(executor, serial_threshold=0),
+            ],
+        )
+
+    assert result == [f"value_{index}" for index in range(4)]
+    assert sorted(stat_calls) == sorted(tmp_path.glob("file_*.yaml"))
@@ -1,5 +1,10 @@
 """If tag handler tests."""
+from re import Match
+from typing import Optional
+
 from marshpy.core.constants import UNDEFINED
+from marshpy.core.interfaces import ILoadingContext
+from marshpy.core.loading_context import LoadingContext
 from marshpy.fields.dict_field import DictField
 from marshpy.fields.list_field import ListField
 from marshpy.fields.string_field import StringField
@@ -41,3 +46,19 @@ def test_if_tag_handler() -> None:
     )
 
     assert result == ["item"]
+
+
+def test_if_tag_handler_without_tag_match() -> None:
+    """If tag should work with contexts not giving the tag match."""
+
+    class _Context(LoadingContext):
+        def current_tag_match(self) -> Optional["Match[str]"]:
+            return ILoadingContext.current_tag_match(self)
+
+    context = _Context(
+        error_handler=None,
+        tag_handlers=[IfHandler()],
+        config=[IfHandler.Config({"FLAG"})],
+    )
+    assert context.current_tag_match() is None
+    assert context.load_document(StringField(), "!if(FLAG) value") == "value"
@@ -1,9 +1,17 @@
 """Import handler tests."""
+from os import stat_result
 from pathlib import Path
+from typing import Any
 
-from marshpy.core.constants import UNDEFINED
+from pytest import MonkeyPatch
+
+from marshpy.core.constants import UNDEFINED, Engine
+from marshpy.core.document_cache import DocumentCache
 from marshpy.core.errors import ErrorCode
+from marshpy.core.load_stats import LoadStats
+from marshpy.loader import load
 from marshpy.tag_handlers.import_handler import ImportHandler
+from marshpy.tag_handlers.path_handler import PathHandler
 from tests.tag_handlers.path_handler_helpers import check_path_tag, check_path_tag_error
 
 
@@ -59,3 +67,26 @@ def test_import_tag_handler_error_handling(datadir: Path) -> None:
     check_path_tag_error(
         ImportHandler, "!import yaml_error.yaml", ErrorCode.VALUE_ERROR, roots=[datadir]
     )
+
+
+def test_import_tag_handler_stats_files_once(
+    tmp_path: Path, engine: Engine, monkeypatch: MonkeyPatch
+) -> None:
+    """Imported files should be stat'ed once, manifest and cache included."""
+    (tmp_path / "file.yaml").write_text("value", encoding="utf-8")
+    stat_calls = []
+    path_stat = Path.stat
+
+    def _stat(path: Path, **kwargs: Any) -> stat_result:
+        stat_calls.append(path)
+        return path_stat(path, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", _stat)
+    stats = LoadStats()
+    config = [
+        PathHandler.Config(roots=[tmp_path], document_cache=DocumentCache()),
+        stats,
+    ]
+    assert load("!import file.yaml", str, config=config, engine=engine) == "value"
+    assert stat_calls == [tmp_path / "file.yaml"]
+    assert stats.bytes_read == len("value")
@@ -1,7 +1,8 @@
 """Error handling tests."""
+import pickle
 from typing import Type
 
-from yaml import Node
+from yaml import Node, ScalarNode, SequenceNode
 from yaml.error import Mark
 
 from marshpy.core.errors import (
@@ -56,3 +57,17 @@ def test_exception_format() -> None:
     error_string = str(error)
     assert location_string in error_string
     assert message in error_string
+
+
+def test_exception_pickling() -> None:
+    """Errors should be picklable, without the children of their node."""
+    mark = Mark("file_name", 0, 10, 42, "buffer", 0)
+    node = SequenceNode("tag", [ScalarNode("tag", "value", mark, mark)], mark, mark)
+    error = pickle.loads(pickle.dumps(ValidationError(node, "Error message")))
+
+    assert isinstance(error, ValidationError)
+    assert str(error) == str(ValidationError(node, "Error message"))
+    assert error.message == "Error message"
+    assert isinstance(error.node, SequenceNode)
+    assert error.node.value == []
+    assert error.node.start_mark.buffer is None
@@ -1,22 +1,45 @@
 """Yaml object loading tests."""
+from asyncio import CancelledError, Semaphore, create_task, gather, run, to_thread
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import StringIO
+from os import stat, utime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from threading import Event
+from typing import Any, Dict, Iterator, List, Optional
+from weakref import ReferenceType, ref
 
+from pytest import raises
 from yaml import Node
-
-from marshpy.core.constants import UNDEFINED
-from marshpy.core.errors import ErrorCode
+from yaml.error import MarkedYAMLError
+
+from marshpy.core.constants import UNDEFINED, Engine
+from marshpy.core.errors import (
+    ErrorCode,
+    MissingRequiredFieldError,
+    UnexpectedNodeTypeError,
+)
 from marshpy.core.interfaces import IBaseField, ILoadingContext
+from marshpy.core.load_stats import LoadStats
+from marshpy.core.manifest import Manifest
+from marshpy.core.snapshot_cache import SnapshotCache
+from marshpy.fields.base_field import BaseField
 from marshpy.fields.list_field import ListField
 from marshpy.fields.object_field import ObjectField
 from marshpy.fields.string_field import StringField
-from marshpy.loader import load
+from marshpy.loader import (
+    LoadManyResult,
+    Reloader,
+    aload,
+    load,
+    load_all,
+    load_many,
+)
 from marshpy.tag_handlers.path_handler import PathHandler
+from marshpy.tag_handlers.tag_handler import TagHandler
 from tests.helpers import FailTagHandler
 
 
-def test_resolve_root_works(datadir: Path) -> None:
+def test_resolve_root_works(datadir: Path, engine: Engine) -> None:
     """Resolve root should be forwarded to glob and import tag handler."""
 
     class _Owned:
@@ -38,6 +61,7 @@ def test_resolve_root_works(datadir: Path) -> None:
         "object_field: !import object.yaml\n",
         _Owner,
         config=[PathHandler.Config(roots=[datadir])],
+        engine=engine,
     )
     assert isinstance(test, _Owner)
     assert isinstance(test.object_field, _Owned)
@@ -47,6 +71,7 @@ def test_resolve_root_works(datadir: Path) -> None:
         "object_list: !glob glob_directory/*.yaml\n",
         _Owner,
         config=[PathHandler.Config(roots=[datadir])],
+        engine=engine,
     )
 
     assert isinstance(test, _Owner)
@@ -57,38 +82,40 @@ def test_resolve_root_works(datadir: Path) -> None:
     assert test.object_list[1].test_field == "test_value"
 
 
-def test_root_field_is_correctly_inferred() -> None:
+def test_root_field_is_correctly_inferred(engine: Engine) -> None:
     """Root field should be inferred from object_class."""
-    assert load("on", bool)
-    assert load("10", int) == 10
-    assert load("10.0", float) == 10.0
-    assert load("string_value", str) == "string_value"
-    test_list = load("- item_1\n" "- item_2", list)
+    assert load("on", bool, engine=engine)
+    assert load("10", int, engine=engine) == 10
+    assert load("10.0", float, engine=engine) == 10.0
+    assert load("string_value", str, engine=engine) == "string_value"
+    test_list = load("- item_1\n" "- item_2", list, engine=engine)
 
     assert test_list == ["item_1", "item_2"]
 
-    test_dict = load("key_1: value_1\n" "key_2: value_2\n", dict)
+    test_dict = load("key_1: value_1\n" "key_2: value_2\n", dict, engine=engine)
 
     assert test_dict == {"key_1": "value_1", "key_2": "value_2"}
 
 
-def test_tag_handler_fails_on_root_node_returns_none() -> None:
+def test_tag_handler_fails_on_root_node_returns_none(engine: Engine) -> None:
     """Nothing shoud be deserialized when loading root node fails."""
-    result = load("!fail some_value", str, tag_handlers=[FailTagHandler()])
+    result = load(
+        "!fail some_value", str, tag_handlers=[FailTagHandler()], engine=engine
+    )
     assert result is UNDEFINED
 
 
-def test_load_handles_stream(datadir: Path) -> None:
+def test_load_handles_stream(datadir: Path, engine: Engine) -> None:
     """It should be correct to give a stream as source parameter for load."""
     with open(datadir / "object.yaml", encoding="utf-8") as yaml_file:
-        test = load(yaml_file, dict)
+        test = load(yaml_file, dict, engine=engine)
         assert test == {"test_field": "test_value"}
 
-    test = load(StringIO("test_field: test_value"), dict)
+    test = load(StringIO("test_field: test_value"), dict, engine=engine)
     assert test == {"test_field": "test_value"}
 
 
-def test_load_defines_node_path(datadir: Path) -> None:
+def test_load_defines_node_path(datadir: Path, engine: Engine) -> None:
     """Calling load with a stream should set the location of the root node."""
     file_path = datadir / "object.yaml"
     validate_called = False
@@ -105,11 +132,11 @@ def test_load_defines_node_path(datadir: Path) -> None:
             assert context.current_location() == str(file_path)
 
     with open(file_path, encoding="utf-8") as yaml_file:
-        load(yaml_file, _TestObject)
+        load(yaml_file, _TestObject, engine=engine)
         assert validate_called
 
 
-def test_error_hanlder_is_called() -> None:
+def test_error_hanlder_is_called(engine: Engine) -> None:
     """The given error_handler should be called when defined."""
     handler_called = False
 
@@ -117,11 +144,11 @@ def test_error_hanlder_is_called() -> None:
         nonlocal handler_called
         handler_called = True
 
-    load("[a, list]", str, error_handler=_handler)
+    load("[a, list]", str, error_handler=_handler, engine=engine)
     assert handler_called
 
 
-def test_schema_resolver_is_called() -> None:
+def test_schema_resolver_is_called(engine: Engine) -> None:
     """The given schema_resolver should be called when defined."""
     resolver_called = False
 
@@ -140,8 +167,251 @@ def test_schema_resolver_is_called() -> None:
         "string_field: value",
         object_class=_Object,
         config=[ObjectField.Config(fields_resolver=_field_resolver)],
+        engine=engine,
     )
 
     assert resolver_called
     assert isinstance(result, _Object)
     assert result.string_field == "value"
+
+
+def test_load_all(engine: Engine) -> None:
+    """Load all should load each document of the stream."""
+    result = list(
+        load_all(
+            "value_1\n---\n!fail value_2\n---\nvalue_3",
+            str,
+            tag_handlers=[FailTagHandler()],
+            engine=engine,
+        )
+    )
+    assert result == ["value_1", UNDEFINED, "value_3"]
+
+    assert not list(load_all("", str, engine=engine))
+
+
+def test_load_all_releases_documents(engine: Engine) -> None:
+    """Load all should release a document before composing the next one."""
+    loaded_nodes: List[ReferenceType[Node]] = []
+
+    class _CheckField(BaseField):
+        def _load(self, context: ILoadingContext) -> Any:
+            for node_ref in loaded_nodes:
+                assert node_ref() is None
+            loaded_nodes.append(ref(context.current_node()))
+            return context.current_node().value
+
+    documents: Iterator[Any] = load_all(
+        "- item_1\n---\n- item_2\n---\n- item_3",
+        root_field=_CheckField(),
+        engine=engine,
+    )
+    for document in documents:
+        assert isinstance(document, list)
+
+    assert len(loaded_nodes) == 3
+
+
+class _BatchObject:
+    fields = {"value": StringField(required=True)}
+
+    value: str
+
+
+def test_load_many(tmp_path: Path, engine: Engine) -> None:
+    """Load many should load sources in order, collecting errors."""
+    file_path = tmp_path / "file.yaml"
+    file_path.write_text("value: from_file\n", encoding="utf-8")
+    malformed_path = tmp_path / "malformed.yaml"
+    malformed_path.write_text("value: [unclosed\n", encoding="utf-8")
+    sources: List[Any] = [
+        file_path,
+        "value: text",
+        "{}",
+        "value: [a]",
+        malformed_path,
+        tmp_path / "missing.yaml",
+    ]
+
+    def _check(results: List[LoadManyResult]) -> None:
+        assert [getattr(it.value, "value", None) for it in results] == [
+            "from_file",
+            "text",
+            None,
+            None,
+            None,
+            None,
+        ]
+        assert [len(it.errors) for it in results] == [0, 0, 1, 1, 1, 1]
+        assert isinstance(results[2].errors[0], MissingRequiredFieldError)
+        assert "file.yaml" not in str(results[2].errors[0])
+        assert isinstance(results[3].errors[0], UnexpectedNodeTypeError)
+        assert str(results[3].errors[0]).endswith(":0:7 : Expected a scalar value.")
+        assert isinstance(results[4].errors[0], MarkedYAMLError)
+        assert isinstance(results[5].errors[0], FileNotFoundError)
+        assert list(results[0].manifest.files) == [str(file_path)]
+        assert not results[0].manifest.has_changed()
+        assert [it.stats.objects for it in results[:4]] == [1, 1, 1, 1]
+        assert results[3].stats.errors == {ErrorCode.UNEXPECTED_NODE_TYPE: 1}
+
+    with ThreadPoolExecutor(2) as executor:
+        _check(load_many(sources, _BatchObject, engine=engine, executor=executor))
+
+    with ProcessPoolExecutor(2) as process_executor:
+        config = [ObjectField.Config(compile_loaders=True)]
+        for __ in range(2):
+            _check(
+                load_many(
+                    sources,
+                    _BatchObject,
+                    config=config,
+                    engine=engine,
+                    executor=process_executor,
+                    chunksize=1,
+                )
+            )
+
+
+def test_aload(datadir: Path, engine: Engine) -> None:
+    """Aload should load documents off the event loop, like load."""
+
+    class _Object:
+        fields = {"test_field": StringField()}
+
+    manifest = Manifest()
+    stats = LoadStats()
+
+    async def _load_all() -> List[Any]:
+        semaphore = Semaphore(2)
+        config = [PathHandler.Config(roots=[datadir]), manifest, stats]
+        return await gather(
+            *[
+                aload(
+                    "!import object.yaml",
+                    _Object,
+                    config=config,
+                    engine=engine,
+                    semaphore=semaphore,
+                )
+                for __ in range(4)
+            ],
+            aload("[]", _Object, engine=engine),
+            return_exceptions=True,
+        )
+
+    results = run(_load_all())
+    assert [getattr(it, "test_field", None) for it in results[:4]] == ["test_value"] * 4
+    assert list(manifest.files) == [str(datadir / "object.yaml")]
+    assert stats.objects == 4
+
+    with raises(UnexpectedNodeTypeError) as error:
+        load("[]", _Object, engine=engine)
+    assert isinstance(results[4], UnexpectedNodeTypeError)
+    assert str(results[4]) == str(error.value)
+
+
+def test_aload_cancelled(engine: Engine) -> None:
+    """Cancelled aload calls shouldn't add their records to the config ones."""
+    started = Event()
+    released = Event()
+
+    class _BlockingTagHandler(TagHandler):
+        tag_pattern = "^block$"
+
+        def load(self, __: ILoadingContext, ___: IBaseField) -> Any:
+            started.set()
+            released.wait()
+            return "value"
+
+    class _Object:
+        fields = {"test_field": StringField()}
+
+    stats = LoadStats()
+
+    async def _cancel(executor: ThreadPoolExecutor) -> None:
+        task = create_task(
+            aload(
+                "test_field: !block",
+                _Object,
+                tag_handlers=[_BlockingTagHandler()],
+                config=[stats],
+                engine=engine,
+                executor=executor,
+            )
+        )
+        await to_thread(started.wait)
+        task.cancel()
+        with raises(CancelledError):
+            await task
+
+    with ThreadPoolExecutor(1) as executor:
+        try:
+            run(_cancel(executor))
+        finally:
+            released.set()
+
+    assert stats.to_dict() == LoadStats().to_dict()
+
+
+def test_aload_snapshot_cache(tmp_path: Path, engine: Engine) -> None:
+    """Aload should forward the snapshot cache to load."""
+    cache = SnapshotCache(tmp_path)
+    stats = LoadStats()
+
+    async def _load() -> Any:
+        return await aload(
+            "value", str, config=[stats], engine=engine, snapshot_cache=cache
+        )
+
+    assert run(_load()) == "value"
+    assert run(_load()) == "value"
+    assert stats.cache_misses["snapshot"] == 1
+    assert stats.cache_hits["snapshot"] == 1
+
+
+def test_reloader(tmp_path: Path) -> None:
+    """Reloader should compose again only the files that changed."""
+
+    class _Object:
+        fields = {
+            "imported": StringField(),
+            "globbed": ListField(StringField()),
+        }
+
+    def _touch(path: Path, content: str) -> None:
+        path.write_text(content, encoding="utf-8")
+        mtime = stat(path).st_mtime_ns + 1_000_000_000
+        utime(path, ns=(mtime, mtime))
+
+    main_path = tmp_path / "main.yaml"
+    imported_path = tmp_path / "imported.yaml"
+    (tmp_path / "folder").mkdir()
+    _touch(tmp_path / "folder" / "file_1.yaml", "file_1")
+    _touch(imported_path, "imported")
+    _touch(main_path, "imported: !import imported.yaml\nglobbed: !glob folder/*")
+    reloader = Reloader(main_path, _Object)
+    assert reloader.value is UNDEFINED
+
+    def _check(reloaded: bool, parsed_files: List[Path], expected: List[Any]) -> None:
+        result = reloader.reload()
+        assert result.value is reloader.value
+        assert result.reloaded == reloaded
+        assert result.parsed_files == {str(it) for it in parsed_files}
+        assert result.duration >= 0
+        assert [getattr(result.value, it, None) for it in _Object.fields] == expected
+
+    file_1_path = tmp_path / "folder" / "file_1.yaml"
+    _check(True, [main_path, imported_path, file_1_path], ["imported", ["file_1"]])
+    _check(False, [], ["imported", ["file_1"]])
+
+    _touch(imported_path, "modified")
+    _check(True, [imported_path], ["modified", ["file_1"]])
+    _check(False, [], ["modified", ["file_1"]])
+
+    file_2_path = tmp_path / "folder" / "file_2.yaml"
+    _touch(file_2_path, "file_2")
+    _check(True, [file_2_path], ["modified", ["file_1", "file_2"]])
+
+    _touch(main_path, "imported: !import imported.yaml")
+    _check(True, [main_path], ["modified", None])
+    assert reloader.reload(force=True).parsed_files == set()
@@ -1,5 +1,6 @@
 """Loading context tests."""
-from typing import Optional
+from re import Match
+from typing import Any, Optional
 
 from pytest import raises
 from yaml import Node
@@ -9,6 +10,8 @@ from marshpy.core.errors import ErrorCode, MarshPyValueError
 from marshpy.core.interfaces import IBaseField, ILoadingContext
 from marshpy.core.loading_context import LoadingContext
 from marshpy.fields.base_field import BaseField
+from marshpy.fields.list_field import ListField
+from marshpy.fields.string_field import StringField
 from marshpy.tag_handlers.tag_handler import TagHandler
 from tests.helpers import check_load
 
@@ -42,6 +45,68 @@ def test_loading_context_raises_on_multiple_tag_match() -> None:
     )
 
 
+def test_loading_context_caches_tag_dispatch() -> None:
+    """Tags should be matched once per loading session."""
+    matched_tags = []
+
+    class _CountingHandler(TagHandler):
+        tag_pattern = "^count(?P<value>[0-9]+)$"
+
+        def match_tag(self, tag: str) -> Optional["Match[str]"]:
+            matched_tags.append(tag)
+            return super().match_tag(tag)
+
+        def load(self, context: ILoadingContext, field: IBaseField) -> Any:
+            match = context.current_tag_match()
+            assert match is not None
+            return match.group("value")
+
+    class _NodeHandler(TagHandler):
+        tag_pattern = ""
+
+        def match(self, node: Node) -> bool:
+            return bool(node.tag == "!node" and node.value == "match")
+
+        def load(self, context: ILoadingContext, field: IBaseField) -> Any:
+            assert context.current_tag_match() is None
+            return "node"
+
+    result = check_load(
+        "[!count1 a, !count1 b, !count2 c, !unknown d, !node match, !node e]",
+        field=ListField(StringField()),
+        tag_handlers=[_NodeHandler(), _CountingHandler()],
+    )
+
+    assert result == ["1", "1", "2", "d", "node", "e"]
+    # Tags not matching the combined pattern aren't tested against handlers.
+    assert matched_tags == ["count1", "count2"]
+
+
+def test_loading_context_get_config() -> None:
+    """Configs should be found by type, defaults being created once."""
+
+    class _Config:
+        pass
+
+    class _ChildConfig(_Config):
+        pass
+
+    class _OtherConfig:
+        pass
+
+    child_config = _ChildConfig()
+    config = [child_config, _Config()]
+    context = LoadingContext(error_handler=None, tag_handlers=[], config=config)
+
+    assert context.get_config(_Config) is child_config
+    assert context.get_config(_ChildConfig) is child_config
+
+    other_config = context.get_config(_OtherConfig)
+    assert isinstance(other_config, _OtherConfig)
+    assert context.get_config(_OtherConfig) is other_config
+    assert len(config) == 2
+
+
 def test_loading_context_returns_node_location() -> None:
     """Loading context should store the last given location for a node."""
 